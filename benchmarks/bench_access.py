@@ -0,0 +1,72 @@
+""" Benchmarks attribute and item access to values at various depths and in configurations of various sizes. """
+from functools import reduce
+from common import DEPTHS, SIZES, generate, generate_depth
+from reflective import Reflective
+
+
+class Depth:
+    """ Benchmarks access to a value nested at various depths. """
+
+    params = DEPTHS
+    param_names = ['depth']
+
+    def setup(self, depth: int):
+        self.config, self.path = generate_depth(depth)
+        self.query = '/'.join(self.path)
+        self.r = Reflective(self.config)
+        self.r[self.query]
+
+    def time_attribute(self, depth: int):
+        reduce(getattr, self.path, self.r)
+
+    def time_item(self, depth: int):
+        self.r[self.query]
+
+    def time_item_uncached(self, depth: int):
+        Reflective(self.config)[self.query]
+
+
+class Size:
+    """ Benchmarks access to a value in configurations of various sizes. """
+
+    params = SIZES
+    param_names = ['size']
+
+    def setup(self, size: int):
+        self.config = generate(size)
+        self.r = Reflective(self.config)
+        self.r['services/0/port']
+        self.queries = [f'services/{i}/{key}' for i in range(min(len(self.config['services']), 50)) for key in ('name', 'port')]
+
+    def time_attribute(self, size: int):
+        self.r.services[0].port
+
+    def time_item(self, size: int):
+        self.r['services/0/port']
+
+    def time_item_uncached(self, size: int):
+        Reflective(self.config)['services/0/port']
+
+    def time_items(self, size: int):
+        [self.r[query] for query in self.queries]
+
+    def time_get_many(self, size: int):
+        self.r().get_many(self.queries)
+
+
+class Frozen:
+    """ Benchmarks access to a value nested at various depths of a frozen configuration. """
+
+    params = DEPTHS
+    param_names = ['depth']
+
+    def setup(self, depth: int):
+        config, self.path = generate_depth(depth)
+        self.query = '/'.join(self.path)
+        self.f = Reflective(config)().freeze()
+
+    def time_attribute(self, depth: int):
+        reduce(getattr, self.path, self.f)
+
+    def time_item(self, depth: int):
+        self.f[self.query]
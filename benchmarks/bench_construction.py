@@ -0,0 +1,69 @@
+""" Benchmarks the construction of Reflective instances and of the wrappers for values that have not been accessed. """
+from common import SIZES, generate
+from reflective import Reflective
+from reflective.context import ContextManager
+
+VALUES: dict = {
+    'str': 'value',
+    'ref': 'hello $r{/str}',
+    'int': 1,
+    'dict': {'a': 1, 'b': 2},
+    'list': [1, 2, 3],
+    'tuple': (1, 2, 3),
+}
+""" The values to construct wrappers for, keyed by name. """
+
+WRAPPERS: int = 1000
+""" The number of wrappers constructed for each value in a single run. """
+
+
+class Construction:
+    """ Benchmarks the construction of root instances for synthetic configurations. """
+
+    params = SIZES
+    param_names = ['size']
+
+    def setup(self, size: int):
+        self.config = generate(size)
+
+    def time_construct(self, size: int):
+        Reflective(self.config)
+
+    def time_construct_and_access(self, size: int):
+        Reflective(self.config).services[0].name
+
+
+class Wrappers:
+    """ Benchmarks the construction of the wrapper of each value type on first access. """
+
+    params = list(VALUES)
+    param_names = ['value']
+
+    def setup(self, name: str):
+        self.values = {f'{name}{i}': VALUES[name] for i in range(WRAPPERS)}
+        self.values['str'] = VALUES['str']
+        self.keys = [f'{name}{i}' for i in range(WRAPPERS)]
+
+    def time_wrap(self, name: str):
+        r = Reflective(self.values)
+        for key in self.keys:
+            r[key]
+
+    def track_parses(self, name: str) -> int:
+        """ Returns the number of times a value is parsed while its wrapper is constructed. """
+        parse = ContextManager.parse
+        calls: list = []
+
+        def counted(context, value, default=None, path=None):
+            calls.append(path)
+            return parse(context, value, default, path)
+
+        r = Reflective(self.values)
+        ContextManager.parse = counted
+
+        try:
+            r[self.keys[0]]
+        finally:
+            ContextManager.parse = parse
+
+        return calls.count([self.keys[0]])
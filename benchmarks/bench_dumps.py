@@ -0,0 +1,26 @@
+""" Benchmarks the serialization of configurations of various sizes. """
+import io
+from common import SIZES, generate
+from reflective import Reflective
+
+
+class Dumps:
+    """ Benchmarks serializing synthetic configurations to JSON. """
+
+    params = SIZES
+    param_names = ['size']
+
+    def setup(self, size: int):
+        self.r = Reflective(generate(size))
+
+    def time_to_json(self, size: int):
+        self.r().to_json()
+
+    def time_dump_json(self, size: int):
+        self.r().dump_json(io.StringIO())
+
+    def time_to_yaml(self, size: int):
+        self.r().to_yaml()
+
+    def time_dump_yaml(self, size: int):
+        self.r().dump_yaml(io.StringIO())
@@ -0,0 +1,42 @@
+""" Benchmarks reading values from Reflective instances backed by memory-mapped JSON files. """
+import json
+import os
+import tempfile
+from common import SIZES, generate
+from reflective import Reflective
+from reflective.mapped import MappedDocument
+
+
+class Mapped:
+    """ Benchmarks reading single values from synthetic configurations in memory-mapped JSON files. """
+
+    params = SIZES
+    param_names = ['size']
+
+    def setup(self, size: int):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'config.json')
+        self.indexed = os.path.join(self.directory.name, 'indexed.json')
+
+        for path in (self.path, self.indexed):
+            with open(path, 'w') as fp:
+                json.dump(generate(size), fp)
+
+        MappedDocument.build_index(self.indexed)
+
+    def teardown(self, size: int):
+        self.directory.cleanup()
+
+    def time_json_load(self, size: int):
+        with open(self.path) as fp:
+            Reflective(json.load(fp))('services/-1/name')
+
+    def time_mapped(self, size: int):
+        r = Reflective.from_mapped_json(self.path)
+        with r:
+            r('services/-1/name')
+
+    def time_mapped_indexed(self, size: int):
+        r = Reflective.from_mapped_json(self.indexed)
+        with r:
+            r('services/-1/name')
@@ -0,0 +1,24 @@
+""" Benchmarks setting and deleting values in configurations of various sizes. """
+from common import SIZES, generate
+from reflective import Reflective
+
+
+class Mutation:
+    """ Benchmarks attribute assignment and deletion against synthetic configurations. """
+
+    params = SIZES
+    param_names = ['size']
+
+    def setup(self, size: int):
+        self.r = Reflective(generate(size))
+        self.service = self.r.services[0]
+
+    def time_setattr(self, size: int):
+        self.service.port = 9000
+
+    def time_setattr_delattr(self, size: int):
+        self.service.extra = 1
+        del self.service.extra
+
+    def time_setattr_root(self, size: int):
+        self.r.domain = 'example.org'
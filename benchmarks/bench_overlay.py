@@ -0,0 +1,41 @@
+""" Benchmarks composing layered configurations with overlays. """
+from common import SIZES, generate
+from reflective import Reflective
+
+
+class Overlays:
+    """ Benchmarks composing layered configurations by overlaying them and by deep merging them. """
+
+    params = SIZES
+    param_names = ['size']
+
+    def setup(self, size: int):
+        self.defaults = generate(size)
+        self.layers = [{'domain': f'layer-{i}.example.com', 'services': self.defaults['services']} for i in range(3)]
+
+    @staticmethod
+    def merge(base: dict, layer: dict) -> dict:
+        """ Returns a deep merged copy of the given dictionaries, as layered configurations are composed without
+        overlays. """
+        merged = dict(base)
+        for key, value in layer.items():
+            if isinstance(value, dict) and isinstance(merged.get(key), dict):
+                value = Overlays.merge(merged[key], value)
+            merged[key] = value
+        return merged
+
+    def time_merge_and_read(self, size: int):
+        import copy
+        config = copy.deepcopy(self.defaults)
+        for layer in self.layers:
+            config = self.merge(config, copy.deepcopy(layer))
+        Reflective(config)('services/0/host')
+
+    def time_overlay_and_read(self, size: int):
+        Reflective.overlay(self.defaults, *self.layers)('services/0/host')
+
+    def time_overlay_add_layer(self, size: int):
+        r = Reflective.overlay(self.defaults, *self.layers)
+        r('services/0/host')
+        r().add_layer({'domain': 'host.example.com'})
+        r('services/0/host')
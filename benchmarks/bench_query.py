@@ -0,0 +1,72 @@
+""" Benchmarks slice, wildcard and filter queries against lists of various sizes. """
+from common import SIZES, generate
+from reflective import Reflective
+
+
+class Slices:
+    """ Benchmarks slice queries against the services of synthetic configurations. """
+
+    params = SIZES
+    param_names = ['size']
+
+    def setup(self, size: int):
+        self.r = Reflective(generate(size))
+        self.r.services
+
+    def time_slice(self, size: int):
+        self.r['services/0:100']
+
+    def time_slice_step(self, size: int):
+        self.r['services/::100']
+
+    def time_slice_cached(self, size: int):
+        self.r().query('services/0:100', use_cache=True)
+
+    def time_slice_all_first(self, size: int):
+        self.r['services/:'][0]
+
+    def time_slice_all_len(self, size: int):
+        len(self.r['services/:'])
+
+
+class Wildcards:
+    """ Benchmarks wildcard and recursive queries against the services of synthetic configurations. """
+
+    params = SIZES
+    param_names = ['size']
+
+    def setup(self, size: int):
+        self.r = Reflective(generate(size))
+
+    def time_wildcard_first(self, size: int):
+        self.r['services/*/port'][0]
+
+    def time_wildcard(self, size: int):
+        list(self.r['services/*/port'])
+
+    def time_recursive(self, size: int):
+        list(self.r['**/memory'])
+
+
+class Filters:
+    """ Benchmarks filter queries against the services of synthetic configurations. """
+
+    params = SIZES
+    param_names = ['size']
+
+    def setup(self, size: int):
+        self.r = Reflective(generate(size))
+        self.indexed = Reflective(generate(size))
+        self.indexed().index('services', 'name')
+
+    def time_filter_equal(self, size: int):
+        list(self.r["services[?name=='service-1']/port"])
+
+    def time_filter_resolved(self, size: int):
+        list(self.r["services[?host=='service-1.example.com']/port"])
+
+    def time_filter_indexed(self, size: int):
+        list(self.indexed["services[?name=='service-1']/port"])
+
+    def time_filter_python(self, size: int):
+        [service.port for service in self.r.services if service.name == 'service-1']
@@ -0,0 +1,28 @@
+""" Benchmarks the resolution of $r{} references that fan out from a single source value. """
+from common import FAN_OUTS, generate_fan_out
+from reflective import Reflective
+
+
+class FanOut:
+    """ Benchmarks resolving many values that reference the same source value. """
+
+    params = FAN_OUTS
+    param_names = ['count']
+
+    def setup(self, count: int):
+        self.config = generate_fan_out(count)
+        self.r = Reflective(self.config)
+        self.r().context.resolved
+
+    def time_resolve(self, count: int):
+        Reflective(self.config)().context.resolved
+
+    def time_resolve_all(self, count: int):
+        Reflective(self.config)().resolve_all()
+
+    def time_resolve_memoized(self, count: int):
+        self.r().context.resolved
+
+    def time_resolve_after_change(self, count: int):
+        self.r.source = 'changed'
+        self.r().context.resolved
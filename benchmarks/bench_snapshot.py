@@ -0,0 +1,30 @@
+""" Benchmarks the cold start of Reflective instances from binary snapshots. """
+import json
+from common import SIZES, generate
+from reflective import Reflective
+
+
+class Snapshots:
+    """ Benchmarks the cold start of pre-resolved synthetic configurations from snapshots and from JSON text. """
+
+    params = SIZES
+    param_names = ['size']
+
+    def setup(self, size: int):
+        r = Reflective(generate(size))
+        r().resolve_all()
+        self.snapshot = r().dump_snapshot()
+        self.text = json.dumps(generate(size))
+
+    def time_load_json_and_resolve(self, size: int):
+        Reflective(json.loads(self.text))().resolve_all()
+
+    def time_load_snapshot(self, size: int):
+        Reflective.load_snapshot(self.snapshot)
+
+    def time_load_snapshot_and_resolve(self, size: int):
+        Reflective.load_snapshot(self.snapshot)().resolve_all()
+
+    def track_snapshot_bytes(self, size: int) -> int:
+        """ Returns the size of the snapshot in bytes. """
+        return len(self.snapshot)
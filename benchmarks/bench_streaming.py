@@ -0,0 +1,25 @@
+""" Benchmarks the incremental loading of Reflective instances from JSON streams. """
+import io
+import json
+from common import SIZES, generate
+from reflective import Reflective
+
+
+class Streaming:
+    """ Benchmarks the incremental loading of synthetic configurations from JSON text. """
+
+    params = SIZES
+    param_names = ['size']
+
+    def setup(self, size: int):
+        self.text = json.dumps(generate(size))
+
+    def time_json_loads(self, size: int):
+        Reflective(json.loads(self.text))
+
+    def time_stream_first_key(self, size: int):
+        Reflective.from_json_stream(io.StringIO(self.text)).domain
+
+    def time_stream_skip(self, size: int):
+        r = Reflective.from_json_stream(io.StringIO(self.text), skip=['services'])
+        r().raw.load()
@@ -0,0 +1,54 @@
+""" Provides the synthetic configurations and parameters shared by the benchmark modules. """
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+SIZES: list = [100, 10000, 1000000]
+""" The approximate number of nodes in the synthetic configurations that size dependent benchmarks are run against. """
+
+QUICK_SIZES: list = [100, 10000]
+""" The sizes that size dependent benchmarks are run against when a quick run is requested. """
+
+DEPTHS: list = [1, 4, 16, 64]
+""" The depths of the values that access benchmarks read. """
+
+FAN_OUTS: list = [1, 100, 10000]
+""" The numbers of values referencing a single source that resolution benchmarks resolve. """
+
+SERVICE_NODES: int = 10
+""" The number of nodes in each service of a synthetic configuration. """
+
+
+def generate(nodes: int) -> dict:
+    """ Returns a synthetic configuration with approximately the given number of nodes. Each service references the
+    shared domain, so that resolution is exercised along with access. """
+    services: list = []
+
+    for i in range(max(nodes // SERVICE_NODES, 1)):
+        services.append({
+            'name': f'service-{i}',
+            'host': f'service-{i}.$r{{/domain}}',
+            'port': 8000 + i % 1000,
+            'enabled': i % 2 == 0,
+            'tags': ('web', f'group-{i % 10}'),
+            'limits': {'cpu': 0.5, 'memory': 512},
+        })
+
+    return {'domain': 'example.com', 'services': services}
+
+
+def generate_depth(depth: int) -> tuple:
+    """ Returns a configuration with a value nested at the given depth, along with the path components of that value. """
+    path: list = [f'level{i}' for i in range(depth)]
+    config: any = 'value'
+
+    for key in reversed(path):
+        config = {key: config, 'sibling': 1}
+
+    return config, path
+
+
+def generate_fan_out(count: int) -> dict:
+    """ Returns a configuration with the given number of values that each reference the same source value. """
+    return {'source': 'value', 'values': {f'value{i}': 'prefix-$r{/source}' for i in range(count)}}
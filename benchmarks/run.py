@@ -0,0 +1,187 @@
+""" Runs the Reflective benchmark suite and stores the results, optionally comparing them with a previous run.
+
+Benchmarks are defined asv-style in the bench_*.py modules of this directory as classes with optional params,
+param_names, setup and teardown attributes. Methods prefixed with time_ are timed, and methods prefixed with track_ have
+their return value recorded.
+
+    python benchmarks/run.py
+    python benchmarks/run.py --quick --filter access
+    python benchmarks/run.py --compare benchmarks/results/0.2.1.json
+"""
+import argparse
+import importlib
+import inspect
+import json
+import platform
+import re
+import subprocess
+import sys
+import time
+import timeit
+from pathlib import Path
+
+BENCHMARKS_PATH: Path = Path(__file__).resolve().parent
+""" The directory containing the benchmark modules. """
+
+RESULTS_PATH: Path = BENCHMARKS_PATH / 'results'
+""" The directory that results are stored in by default. """
+
+QUICK_LIMIT: int = 10000
+""" The largest numeric parameter that benchmarks are run with when a quick run is requested. """
+
+
+def get_version() -> str:
+    """ Returns the version of the project being benchmarked. """
+    pyproject = (BENCHMARKS_PATH.parent / 'pyproject.toml').read_text()
+    match = re.search(r'^version\s*=\s*"([^"]+)"', pyproject, re.MULTILINE)
+    return match.group(1) if match else 'unknown'
+
+
+def get_commit() -> str:
+    """ Returns the abbreviated hash of the commit being benchmarked, if available. """
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=BENCHMARKS_PATH, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def discover(pattern: str = '') -> list:
+    """ Returns the benchmark name, class and method name of every benchmark matching the given pattern. """
+    sys.path.insert(0, str(BENCHMARKS_PATH))
+    benchmarks: list = []
+
+    for path in sorted(BENCHMARKS_PATH.glob('bench_*.py')):
+        module = importlib.import_module(path.stem)
+
+        for class_name, cls in inspect.getmembers(module, inspect.isclass):
+            if cls.__module__ != module.__name__:
+                continue
+
+            for method in sorted(dir(cls)):
+                if not method.startswith(('time_', 'track_')):
+                    continue
+                name = f'{path.stem[6:]}.{class_name}.{method}'
+                if pattern in name:
+                    benchmarks.append((name, cls, method))
+
+    return benchmarks
+
+
+def measure(function, repeat: int) -> dict:
+    """ Returns the best time per call of the given function, calling it as many times as fit in 0.2 seconds. """
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    times = timer.repeat(repeat=repeat, number=number)
+    return {'seconds': min(times) / number, 'number': number, 'repeat': repeat}
+
+
+def run(benchmarks: list, repeat: int, quick: bool) -> dict:
+    """ Runs the given benchmarks for each of their parameters, returning the results keyed by benchmark name. """
+    results: dict = {}
+    classes: dict = {}
+
+    for name, cls, method in benchmarks:
+        classes.setdefault(cls, []).append((name, method))
+
+    for cls, methods in classes.items():
+        params = getattr(cls, 'params', [None])
+
+        for param in params:
+            if quick and isinstance(param, int) and param > QUICK_LIMIT:
+                continue
+
+            args = () if param is None else (param,)
+            instance = cls()
+
+            if hasattr(instance, 'setup'):
+                instance.setup(*args)
+
+            for name, method in methods:
+                key = name if param is None else f'{name}({param})'
+                function = getattr(instance, method)
+
+                if method.startswith('time_'):
+                    results[key] = measure(lambda: function(*args), repeat)
+                    print(f'{key:<60}{format_seconds(results[key]["seconds"]):>14}', flush=True)
+                else:
+                    results[key] = {'value': function(*args)}
+                    print(f'{key:<60}{results[key]["value"]!s:>14}', flush=True)
+
+            if hasattr(instance, 'teardown'):
+                instance.teardown(*args)
+
+    return results
+
+
+def compare(results: dict, previous: dict, threshold: float) -> int:
+    """ Prints the change of each result from the given previous results, returning the number of regressions. """
+    regressions: int = 0
+
+    print(f'\n{"benchmark":<60}{"before":>14}{"after":>14}{"ratio":>9}')
+
+    for key, result in results.items():
+        before = previous.get(key)
+
+        if before is None:
+            continue
+
+        if 'seconds' in result:
+            ratio = result['seconds'] / before['seconds'] if before['seconds'] else float('inf')
+            flag = ''
+            if ratio > 1 + threshold:
+                flag = '  slower'
+                regressions += 1
+            elif ratio < 1 - threshold:
+                flag = '  faster'
+            print(f'{key:<60}{format_seconds(before["seconds"]):>14}{format_seconds(result["seconds"]):>14}'
+                  f'{ratio:>9.2f}{flag}')
+        elif result['value'] != before['value']:
+            print(f'{key:<60}{before["value"]!s:>14}{result["value"]!s:>14}')
+
+    return regressions
+
+
+def format_seconds(seconds: float) -> str:
+    """ Returns the given duration formatted with an appropriate unit. """
+    for unit, scale in (('s', 1), ('ms', 1e-3), ('us', 1e-6)):
+        if seconds >= scale:
+            return f'{seconds / scale:.2f} {unit}'
+    return f'{seconds / 1e-9:.2f} ns'
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Runs the Reflective benchmark suite.')
+    parser.add_argument('--filter', default='', help='only run benchmarks whose name contains this text')
+    parser.add_argument('--quick', action='store_true', help=f'skip parameters larger than {QUICK_LIMIT}')
+    parser.add_argument('--repeat', type=int, default=3, help='the number of timings to take the best of')
+    parser.add_argument('--output', type=Path, help='the file to store results in, defaults to results/<version>.json')
+    parser.add_argument('--compare', type=Path, help='a previous results file to compare the results with')
+    parser.add_argument('--threshold', type=float, default=0.1, help='the relative change reported as a regression')
+    args = parser.parse_args()
+
+    version = get_version()
+    results = run(discover(args.filter), args.repeat, args.quick)
+
+    output = args.output or RESULTS_PATH / f'{version}.json'
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps({
+        'version': version,
+        'commit': get_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'results': results,
+    }, indent=4) + '\n')
+
+    print(f'\nResults stored in {output}')
+
+    if args.compare is not None:
+        previous = json.loads(args.compare.read_text())['results']
+        return 1 if compare(results, previous, args.threshold) else 0
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,13 +1,104 @@
 from __future__ import annotations
-from collections import UserDict
+from collections.abc import MutableMapping
+from typing import NamedTuple, Union
 
 
-class CacheManager(UserDict):
-    """ This class provides a cache management interface for Reflective instances. """
+class CacheSummary(NamedTuple):
+    """ This class provides a data object to represent the statistics of the cache entries below a path. """
+
+    entries: int
+    """ The number of entries at or below the path. """
+
+    bytes: int
+    """ The approximate total size in bytes of the values of the entries at or below the path. """
+
+
+class CacheEntry:
+    """ This class provides a single value stored by a CacheManager instance. Entries are linked together in least
+    recently used order. """
+
+    __slots__ = ('key', 'value', 'weak', 'expires', 'size', 'prev', 'next')
+
+    key: any
+    """ The cache key of the entry. """
+
+    value: any
+    """ The cached value, or a weak reference to it when the entry is weak. """
+
+    weak: bool
+    """ Whether the entry holds a weak reference to the cached value. """
+
+    expires: Union[float, None]
+    """ The monotonic time at which the entry expires, or None if it never expires. """
+
+    size: int
+    """ The approximate size of the cached value in bytes. """
+
+    prev: 'CacheEntry'
+    """ The next less recently used entry. """
+
+    next: 'CacheEntry'
+    """ The next more recently used entry. """
+
+    def __init__(self, key: any, value: any, weak: bool, expires: Union[float, None], size: int):
+        """ Initializes a new, unlinked CacheEntry object. """
+        self.key = key
+        self.value = value
+        self.weak = weak
+        self.expires = expires
+        self.size = size
+        self.prev = self
+        self.next = self
+
+    def resolve(self) -> any:
+        """ Returns the cached value, or None if a weakly referenced value has been collected. """
+        return self.value() if self.weak else self.value
+
+    def link(self, successor: CacheEntry) -> None:
+        """ Links this entry into the list immediately before the given entry. """
+        self.prev = successor.prev
+        self.next = successor
+        successor.prev.next = self
+        successor.prev = self
+
+    def unlink(self) -> None:
+        """ Unlinks this entry from the list it belongs to. """
+        self.prev.next = self.next
+        self.next.prev = self.prev
+        self.prev = self.next = self
+
+
+class CacheManager(MutableMapping):
+    """ This class provides a cache management interface for Reflective instances. Entries are stored in a trie of
+    their path component keys so that the entries below a path can be enumerated, summarized and invalidated without
+    scanning the whole cache. Entries are kept in least recently used order, and may optionally be bounded by count or
+    approximate size, expire after a time-to-live, or be held by weak reference so that unreferenced instances can be
+    collected. """
 
     _core: 'RCore'
     """ The parent RCore instance of this instance. """
 
+    _entries: 'PathTrie'
+    """ The cache entries, keyed by their path component tuple cache keys and weighted by their approximate size. """
+
+    _order: CacheEntry
+    """ The sentinel of the circular list linking the cache entries in least recently used order. """
+
+    _max_entries: Union[int, None]
+    """ The maximum number of entries retained, or None for no limit. """
+
+    _max_bytes: Union[int, None]
+    """ The maximum approximate total size in bytes of the retained values, or None for no limit. """
+
+    _ttl: Union[float, None]
+    """ The number of seconds an entry is retained after it is stored, or None for no expiry. """
+
+    _weak: bool
+    """ Whether values are held by weak reference where the value type supports it. """
+
+    _evictions: int
+    """ The number of entries that have been evicted or expired. """
+
     @property
     def core(self) -> 'RCore':
         """ Returns the parent RCore instance of this instance. """
@@ -18,7 +109,267 @@ class CacheManager(UserDict):
         """ Returns the context manager instance associated with the parent RCore instance. """
         return self.core.context
 
-    def __init__(self, core: 'RCore'):
+    @property
+    def max_entries(self) -> Union[int, None]:
+        """ Returns the maximum number of entries retained, or None for no limit. """
+        return self._max_entries
+
+    @max_entries.setter
+    def max_entries(self, value: Union[int, None]) -> None:
+        """ Sets the maximum number of entries retained, or None for no limit. """
+        self._max_entries = value
+        self.evict()
+
+    @property
+    def max_bytes(self) -> Union[int, None]:
+        """ Returns the maximum approximate total size in bytes of the retained values, or None for no limit. """
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: Union[int, None]) -> None:
+        """ Sets the maximum approximate total size in bytes of the retained values, or None for no limit. Values are
+        only measured while there is a limit, so the retained values are measured when a limit is first set. """
+        measured = self._max_bytes is not None
+        self._max_bytes = value
+        if measured != (value is not None):
+            self.remeasure()
+        self.evict()
+
+    @property
+    def ttl(self) -> Union[float, None]:
+        """ Returns the number of seconds an entry is retained after it is stored, or None for no expiry. """
+        return self._ttl
+
+    @ttl.setter
+    def ttl(self, value: Union[float, None]) -> None:
+        """ Sets the number of seconds an entry is retained after it is stored, or None for no expiry. This only
+        applies to entries stored after the change. """
+        self._ttl = value
+
+    @property
+    def weak(self) -> bool:
+        """ Returns whether values are held by weak reference where the value type supports it. """
+        return self._weak
+
+    @weak.setter
+    def weak(self, value: bool) -> None:
+        """ Sets whether values are held by weak reference where the value type supports it. This only applies to
+        entries stored after the change. """
+        self._weak = value
+
+    @property
+    def bytes(self) -> int:
+        """ Returns the approximate total size in bytes of the retained values, which is zero unless there is a byte
+        limit, since values are only measured while there is one. """
+        return self._entries.summary().weight
+
+    @property
+    def evictions(self) -> int:
+        """ Returns the number of entries that have been evicted or expired. """
+        return self._evictions
+
+    def __init__(self, core: 'RCore', max_entries: Union[int, None] = None, max_bytes: Union[int, None] = None,
+                 ttl: Union[float, None] = None, weak: bool = False):
         """ Initializes a new CacheManager object associated with the given core. """
+        from reflective.trie import PathTrie
         self._core = core
-        super().__init__()
+        self._entries = PathTrie()
+        self._order = CacheEntry(None, None, False, None, 0)
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._weak = weak
+        self._evictions = 0
+
+    def __getitem__(self, key: tuple) -> any:
+        entry = self._entries[key]
+        value = entry.resolve()
+
+        if (entry.weak and value is None) or self.expired(entry):
+            self.discard(key)
+            self._evictions += 1
+            raise KeyError(key)
+
+        # Move the entry to the most recently used end of the list
+        entry.unlink()
+        entry.link(self._order)
+
+        return value
+
+    def __setitem__(self, key: tuple, value: any) -> None:
+        import time
+        import weakref
+
+        self.discard(key)
+
+        weak = False
+        stored = value
+
+        if self._weak:
+            try:
+                stored = weakref.ref(value, lambda ref, k=key: self.collected(k, ref))
+                weak = True
+            except TypeError:
+                # Some value types, such as int and tuple subclasses, don't support weak references
+                pass
+
+        expires = time.monotonic() + self._ttl if self._ttl is not None else None
+        size = self.measure(value) if self._max_bytes is not None else 0
+        entry = CacheEntry(key, stored, weak, expires, size)
+
+        self._entries.insert(key, entry, entry.size)
+        entry.link(self._order)
+
+        self.evict()
+
+    def __delitem__(self, key: tuple) -> None:
+        if key not in self._entries:
+            raise KeyError(key)
+        self.discard(key)
+
+    def __contains__(self, key: tuple) -> bool:
+        entry = self._entries.get(key)
+
+        if entry is None:
+            return False
+
+        if (entry.weak and entry.value() is None) or self.expired(entry):
+            self.discard(key)
+            self._evictions += 1
+            return False
+
+        return True
+
+    def __iter__(self):
+        """ Iterates the cache keys in least recently used order. """
+        keys: list = []
+        entry = self._order.next
+        while entry is not self._order:
+            keys.append(entry.key)
+            entry = entry.next
+        return iter(keys)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: tuple, default: any = None) -> any:
+        """ Returns the cached value for the given key, or the given default if it isn't cached. """
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def discard(self, key: tuple) -> None:
+        """ Removes the entry for the given key, if any. """
+        entry = self._entries.get(key)
+        if entry is not None:
+            del self._entries[key]
+            entry.unlink()
+
+    def clear(self) -> None:
+        """ Removes all entries. """
+        from reflective.trie import PathTrie
+        self._entries = PathTrie()
+        self._order = CacheEntry(None, None, False, None, 0)
+
+    def subtree(self, path: tuple = ()):
+        """ Yields the key and value of every live entry at or below the given path, without changing the least
+        recently used order of the entries. """
+        for key, entry in list(self._entries.subtree(path)):
+            value = entry.resolve()
+            if (entry.weak and value is None) or self.expired(entry):
+                continue
+            yield key, value
+
+    def summary(self, path: tuple = ()) -> CacheSummary:
+        """ Returns the number and approximate total size of the entries at or below the given path. """
+        summary = self._entries.summary(path)
+        return CacheSummary(summary.count, summary.weight)
+
+    def invalidate(self, path: tuple = (), inclusive: bool = True) -> int:
+        """ Removes the entries below the given path, as well as the entry at the path itself if inclusive, returning
+        the number of entries removed. This only visits the entries that are removed. """
+        removed: list = []
+
+        if inclusive:
+            removed = self._entries.pop_subtree(path)
+        else:
+            node = self._entries.node(path)
+            for component in list(node.children) if node is not None else []:
+                removed += self._entries.pop_subtree(tuple(path) + (component,))
+
+        for _, entry in removed:
+            entry.unlink()
+
+        return len(removed)
+
+    def remeasure(self) -> None:
+        """ Measures the size of every retained value again if there is a byte limit, or else resets their sizes to zero.
+        """
+        entry = self._order.next
+
+        while entry is not self._order:
+            value = entry.resolve()
+            entry.size = self.measure(value) if self._max_bytes is not None and value is not None else 0
+            self._entries.insert(entry.key, entry, entry.size)
+            entry = entry.next
+
+    @staticmethod
+    def measure(value: any) -> int:
+        """ Returns the approximate size in bytes of the given value, including the items of containers and the copy of
+        the value held by Reflective instances. Objects reachable more than once are only counted once, and the items of
+        lazily loaded containers that haven't been loaded yet aren't counted. """
+        import sys
+        from reflective.types import Reflective
+
+        seen: set = set()
+        stack: list = [value]
+        size: int = 0
+
+        while stack:
+            item = stack.pop()
+
+            if id(item) in seen:
+                continue
+
+            seen.add(id(item))
+            size += sys.getsizeof(item)
+
+            # The built-in methods are used so that lazily loaded containers aren't loaded by measuring them
+            if isinstance(item, Reflective):
+                if 'data' in item.__dict__:
+                    stack.append(item.__dict__['data'])
+                if isinstance(item, tuple):
+                    stack.extend(tuple.__iter__(item))
+            elif isinstance(item, dict):
+                stack.extend(dict.keys(item))
+                stack.extend(dict.values(item))
+            elif isinstance(item, (list, tuple)):
+                stack.extend(list.__iter__(item) if isinstance(item, list) else tuple.__iter__(item))
+
+        return size
+
+    def expired(self, entry: CacheEntry) -> bool:
+        """ Returns whether the given entry has expired. """
+        import time
+        return entry.expires is not None and entry.expires <= time.monotonic()
+
+    def collected(self, key: tuple, ref: any) -> None:
+        """ Removes the entry for the given key once its weakly referenced value has been collected. """
+        entry = self._entries.get(key)
+        if entry is not None and entry.value is ref:
+            self.discard(key)
+            self._evictions += 1
+
+    def evict(self) -> None:
+        """ Removes the least recently used entries while they have expired or the cache exceeds its limits. Expired
+        entries that have been used more recently are removed when they are next accessed. """
+        while self._order.next is not self._order and self.expired(self._order.next):
+            self.discard(self._order.next.key)
+            self._evictions += 1
+
+        while self._order.next is not self._order and (
+                (self._max_entries is not None and len(self._entries) > self._max_entries)
+                or (self._max_bytes is not None and self.bytes > self._max_bytes)):
+            self.discard(self._order.next.key)
+            self._evictions += 1
@@ -20,6 +20,19 @@ class ContextManager:
     _delimiter: str
     """ The delimiter used to join path components into paths. """
 
+    _origin: 'ContextManager'
+    """ The context manager of the root Reflective instance. This is the instance itself for the root instance. """
+
+    _version: int
+    """ The structural version of the root context. This is incremented whenever a container value may have been
+    replaced or its items moved, which invalidates the parent containers cached by descendent contexts. """
+
+    _parent: any
+    """ The cached reference to the container value that holds the value of this context. """
+
+    _parent_version: int
+    """ The structural version of the root context at the time the parent container was cached. """
+
     @property
     def core(self) -> 'RCore':
         """ Returns the parent RCore instance of this instance. """
@@ -35,15 +48,37 @@ class ContextManager:
         """ Returns the cache manager instance associated with the parent RCore instance. """
         return self.core.cache
 
+    @property
+    def origin(self) -> 'ContextManager':
+        """ Returns the context manager of the root Reflective instance. """
+        return self._origin
+
+    @origin.setter
+    def origin(self, value: 'ContextManager') -> None:
+        """ Sets the context manager of the root Reflective instance. """
+        self._origin = value
+        self._parent_version = -1
+
+    @property
+    def version(self) -> int:
+        """ Returns the structural version of the root context. """
+        return self._origin._version
+
     @property
     def root(self) -> any:
         """ Returns the reference to the value of the root Reflective instance."""
+        if self._origin is not self:
+            return self._origin.root
         return self._root
 
     @root.setter
     def root(self, value: any) -> None:
         """ Sets the reference to the value of the root Reflective instance."""
+        if self._origin is not self:
+            self._origin.root = value
+            return
         self._root = value
+        self._version += 1
 
     @property
     def path(self) -> list:
@@ -54,34 +89,71 @@ class ContextManager:
     def path(self, value: list) -> None:
         """ Sets the path components of the current context. This should be empty for the root instance. """
         self._path = value
+        self._parent_version = -1
 
     @property
     def ref(self) -> any:
-        """ Returns a reference to the parsed value of this context. """
-        return self.parse(self.raw)
+        """ Returns a reference to the parsed value of this context. If lazy resolution is enabled, composite values are
+        returned as views that only resolve the items which are accessed. """
+        if self.core is not None and self.core.lazy:
+            return self.view(self.raw)
+        return self.parse(self.raw, path=self.path)
+
+    @property
+    def resolved(self) -> any:
+        """ Returns a fully resolved copy of the value of this context, regardless of the resolution mode. """
+        return self.parse(self.raw, path=self.path)
+
+    @property
+    def parent(self) -> any:
+        """ Returns a reference to the container value that holds the value of this context. The container is cached
+        until the structure of the root value changes, so repeated access doesn't traverse the path from the root. This
+        should not be used for the root instance. """
+        origin = self._origin
+
+        if self._parent_version != origin._version:
+            from functools import reduce
+            from reflective.stats import StatsManager
+            if StatsManager.active and self.core is not None and self.core.stats.enabled:
+                self.core.stats.count('traverse')
+            self._parent = reduce(lambda c, k: c[k], self._path[:-1], origin.root)
+            self._parent_version = origin._version
+
+        return self._parent
 
     @property
     def raw(self) -> any:
         """ Returns a reference to the unparsed value of this context. """
-        from functools import reduce
-        return reduce(lambda c, k: c[k], self.path, self.root)
+        if not self._path:
+            return self.root
+        return self.parent[self._path[-1]]
 
     @raw.setter
     def raw(self, value: any) -> None:
         """ Sets the unparsed value of this context. """
-        from functools import reduce
         if len(self.path):
-            parent = reduce(lambda c, k: c[k], self.path[:-1], self.root)
-            original_type = type(parent[self.path[-1]])
+            parent = self.parent
+            original = parent[self.path[-1]]
             parent[self.path[-1]] = value
+            self.changed(structural=isinstance(original, (dict, list, tuple)))
         else:
-            original_type = type(self.root)
-            self.root = value
+            original = self.root
+            # The structural version is incremented by signaling the change, so the root setter isn't used
+            self._origin._root = value
+            self.changed()
+
+        original_type = type(original)
 
         # Check if the parsed value type is different then the previous, and invalidate existing cached instance if so
-        if type(self.ref) is not original_type and self.cache_key in self.cache:
-            self.cache[self.cache_key]().invalidate()
-            del self.cache[self.cache_key]
+        if self.cache_key in self.cache:
+            from reflective.view import View
+            parsed = self.ref
+            # Lazily resolved views are compared by the type of the container they wrap, as in eager mode
+            if isinstance(parsed, View):
+                parsed = parsed.raw
+            if type(parsed) is not original_type:
+                self.cache[self.cache_key]().invalidate()
+                del self.cache[self.cache_key]
 
     @property
     def delimiter(self) -> str:
@@ -89,15 +161,10 @@ class ContextManager:
         return self._delimiter
 
     @property
-    def cache_key(self) -> str:
+    def cache_key(self) -> tuple:
         """ Builds a cache key for this context instance based on the context path. """
         from reflective.core import RCore
-
-        # Build the hash source value from path components
-        source = self.delimiter.join(str(c) for c in self.path)
-
-        # Generate the hash
-        return RCore.hash_value(source)
+        return RCore.path_key(self.path)
 
     def __init__(self, core: 'RCore' = None, root: any = None, path: list = None, delimiter: Union[str, None] = None):
         """ Initializes a new ContextManager object associated with the given core. """
@@ -105,82 +172,246 @@ class ContextManager:
         self._root = root
         self._path = list(path) if path is not None else []
         self._delimiter = delimiter if delimiter is not None else DEFAULT_DELIMITER
+        self._origin = self
+        self._version = 0
+        self._parent = None
+        self._parent_version = -1
 
     def get(self, path: list) -> 'Reflective':
         """ Returns a singular Reflective instance for the given path, relative to this context. """
         from reflective.core import RCore
+        from reflective.stats import StatsManager
         from reflective.types import Reflective
 
         full_path = self.path + path
-        path_key: str = self.delimiter.join(str(c) for c in full_path)
-        cache_key: str = RCore.hash_value(path_key)
+        cache_key: tuple = RCore.path_key(full_path)
 
         # Check if the path is already cached
-        if cache_key in self.cache:
-            return self.cache[cache_key]
+        instance = self.cache.get(cache_key)
+
+        if StatsManager.active and self.core.stats.enabled:
+            self.core.stats.count('cache_miss' if instance is None else 'cache_hit')
+
+        if instance is not None:
+            return instance
 
         # Create a new instance and cache a reference to it
         cm = ContextManager(root=self.root, path=full_path)
+        cm.origin = self.origin
         cm.core = RCore(context=cm, root=self.core.root, delimiter=self.delimiter)
-        self.cache[cache_key] = Reflective(cm.core)
+        instance = Reflective(cm.core)
+        self.cache[cache_key] = instance
 
-        return self.cache[cache_key]
+        return instance
+
+    def moved(self, position: int, count: int) -> None:
+        """ Signals that the given number of items were inserted into the unparsed list value of this context at the
+        given position, or removed from it if the count is negative. This is a structural change, but the indexes of
+        the list are updated incrementally instead of being rebuilt. """
+        self.changed(reindex=False)
+        if len(self.core.indexes):
+            self.core.indexes.moved(self.path, position, count)
 
     def delete(self, path: list = None) -> None:
         """ Deletes the value at the given path, relative to this context. """
         from functools import reduce
-        path = self.path + path if isinstance(path, list) else self.path
-        reduce(lambda c, k: c[k], path[:-1], self.root).pop(path[-1])
-        parent_path = path[:-1]
-        parent_core = self.get(path[:-1])() if len(parent_path) else self.core.root()
-        cache_key = self.cache_key
-        if cache_key in parent_core.cache:
-            del parent_core.cache[cache_key]
-
-    def parse(self, value: any, default: any = None) -> any:
+        from reflective.core import RCore
+
+        if isinstance(path, list):
+            path = self.path + path
+            container = reduce(lambda c, k: c[k], path[:-1], self.root)
+        else:
+            path = self.path
+            container = self.parent
+
+        original = container.pop(path[-1])
+
+        # Removing a list item shifts the positions of the items that follow it
+        if isinstance(container, list):
+            position = path[-1] if path[-1] >= 0 else len(container) + 1 + path[-1]
+            self.origin.changed(path[:-1], reindex=False)
+            if len(self.core.indexes):
+                self.core.indexes.moved(path[:-1], position, -1)
+        else:
+            self.origin.changed(path, structural=isinstance(original, (dict, list, tuple)))
+
+        # The cache is shared by every instance of the root, so the entries can be removed through this context
+        self.cache.invalidate(RCore.path_key(path))
+
+    def view(self, value: any, path: list = None) -> any:
+        """ Returns a lazily resolved view of the given value if it is a composite value, or else the parsed value. """
+        from reflective.view import DictView, ListView, TupleView
+
+        path = self.path if path is None else path
+
+        if isinstance(value, dict):
+            return DictView(self, value, path)
+
+        elif isinstance(value, list):
+            return ListView(self, value, path)
+
+        elif isinstance(value, tuple):
+            return TupleView(self, value, path)
+
+        return self.parse(value, path=path)
+
+    def parse(self, value: any, default: any = None, path: list = None) -> any:
         """ Parses the given value for Reflective references, updating the references with values from the root context,
-        and returning the updated value reference. """
-        import os
-        from reflective.util import RUtil
+        and returning the updated value reference. If the path of the value is given, resolved values are memoized until
+        the values they depend on are modified. """
+        from reflective.core import RCore
+        from reflective.stats import StatsManager
+        from reflective.template import Template
+
+        stats = self.core.stats if StatsManager.active else None
+
+        if stats is not None and stats.enabled:
+            stats.count('parse')
 
         if isinstance(value, dict):
-            return {k: self.parse(v, default) for k, v in value.copy().items()}
+            if path is None:
+                return {k: self.parse(v, default) for k, v in value.copy().items()}
+            return {k: self.parse(v, default, path + [k]) for k, v in value.copy().items()}
 
         elif isinstance(value, list):
-            return [self.parse(item, default) for item in value.copy()]
+            if path is None:
+                return [self.parse(item, default) for item in value.copy()]
+            return [self.parse(item, default, path + [i]) for i, item in enumerate(value.copy())]
 
         elif isinstance(value, tuple):
-            return tuple([self.parse(item, default) for item in value])
+            if path is None:
+                return tuple([self.parse(item, default) for item in value])
+            return tuple([self.parse(item, default, path + [i]) for i, item in enumerate(value)])
 
         if not isinstance(value, str):
             return value
 
-        # Process $(r|e){...} references
-        matches = RUtil.ref_pattern.findall(value)
+        # Strings without references are returned as-is without being compiled into a template
+        if '$' not in value:
+            return value
+
+        resolver = self.core.resolver
+        template = resolver.templates.get(value)
+
+        # Templates compiled ahead of time for the root value are used without compiling the string
+        if template is None:
+            if stats is not None and stats.enabled:
+                misses = Template.cache_info().misses
+                template = Template.compile(value)
+                stats.count('scan', Template.cache_info().misses - misses)
+            else:
+                template = Template.compile(value)
+
+        if not template.slots:
+            return value
+
+        key = RCore.path_key(path) if path is not None else None
+
+        # Return the memoized value if the references of this value have already been resolved
+        if key is not None and key in resolver:
+            if stats is not None and stats.enabled:
+                stats.count('memo_hit')
+            return resolver.recall(key)
+
+        with resolver.resolving(key) as frame:
+            if stats is not None and stats.enabled:
+                frame.value = stats.measure('render', self.render, template)
+            else:
+                frame.value = self.render(template)
+
+        return frame.value
+
+    def render(self, template: 'Template') -> any:
+        """ Renders the given template, resolving its references against the root context. If the template consists of
+        nothing but references to the same query, the referenced value is returned without being converted to a string.
+        References to composite values return a resolved copy of the value, which is memoized by the path of each
+        reference, so every reference to a composite value holds its own copy. The copies can't be shared, since
+        instances of lists write their resolved value back over the unparsed value and modify it in place. Writers avoid
+        the copies by traversing the referenced value instead, see the referent method. """
+        import os
+        from reflective.query import Query, QueryResult
+        from reflective.stats import StatsManager
+        from reflective.types import Reflective
+
+        resolver = self.core.resolver
+        resolved: dict = {}
+        values: list = []
 
-        for match in matches:
-            # The part that comes after the "$" and before the "{"
-            method = str(match[0]).lower()
+        for slot in template.slots:
 
             # Handles instances of $(r){...} references
-            if method == 'r':
-                from reflective.query import QueryResult
-                from reflective.types import Reflective
-                from reflective.util import RUtil
+            if slot.method == 'r':
+                if slot.query not in resolved:
+                    if StatsManager.active and self.core.stats.enabled:
+                        self.core.stats.count('resolve')
+                    query = Query.compile(slot.query)
+                    resolver.depend(query.path)
+                    qr = self.core.root().query(query)
 
-                # The Reflective query string
-                query = match[1]
+                    if isinstance(qr, QueryResult) and len(qr) or isinstance(qr, Reflective):
+                        if isinstance(qr, QueryResult) and len(qr) == 1:
+                            qr = qr[0]
 
-                qr = self.core.root().query(query)
+                        # Provide typed references when sole references are found. The resolved value of the
+                        # referenced context is returned rather than its cached instance, since the instance holds a
+                        # copy of the value that isn't updated when the sources of the value are modified.
+                        if template.sole:
+                            return qr().context.resolved if isinstance(qr, Reflective) else qr
 
-                if isinstance(qr, QueryResult) and len(qr) or isinstance(qr, Reflective):
-                    value = RUtil.update(value, query, qr)
+                        resolved[slot.query] = str(qr)
+
+                    # Unresolvable references are left in place
+                    else:
+                        resolved[slot.query] = slot.text
+
+                values.append(resolved[slot.query])
 
             # Handles instances of $(e){...} references
-            elif method == 'e':
-                # The environment variable name
-                query = match[1]
-                query_value = os.getenv(query)
-                value = value.replace(f'${match[0]}{{{query}}}', str(query_value))
+            elif slot.method == 'e':
+                values.append(str(os.getenv(slot.query)))
+                resolver.volatile()
+
+        return template.render(values)
+
+    def referent(self, value: any) -> Union['Reflective', None]:
+        """ Returns the instance of the composite value referenced by the given unparsed value if it consists of nothing
+        but a reference to a single composite value, or else None. Writers use this to traverse the referenced value
+        from its own path rather than resolving a copy of it. """
+        from reflective.query import Query, QueryResult
+        from reflective.template import Template
+        from reflective.types import Reflective
+
+        if not isinstance(value, str) or '$' not in value:
+            return None
 
-        return value
+        template = self.core.resolver.templates.get(value)
+
+        if template is None:
+            template = Template.compile(value)
+
+        if not template.sole:
+            return None
+
+        qr = self.core.root().query(Query.compile(template.slots[0].query))
+
+        if isinstance(qr, QueryResult) and len(qr) == 1:
+            qr = qr[0]
+
+        if isinstance(qr, Reflective) and isinstance(qr().context.raw, (dict, list, tuple)):
+            return qr
+
+        return None
+
+    def changed(self, path: list = None, structural: bool = True, reindex: bool = True) -> None:
+        """ Signals that the unparsed value at the given path, relative to this context, has been modified so that any
+        state derived from it can be invalidated. Structural changes are those that may have replaced container values
+        or moved their items, which invalidates the parent containers cached by all contexts. Indexes of the modified
+        value are rebuilt before they are next used, unless reindex is false because they have already been updated. """
+        path = self.path + path if isinstance(path, list) else self.path
+        self.core.resolver.invalidate(path)
+        if len(self.core.indexes):
+            self.core.indexes.changed(path, reindex)
+        if structural:
+            self._origin._version += 1
+            # Cached descendents may no longer exist or may refer to different values
+            self.cache.invalidate(self.core.path_key(path), inclusive=False)
@@ -20,15 +20,31 @@ class RCore:
     _context: 'ContextManager'
     """ The context manager instance associated with the Reflective instance. """
 
+    _resolver: 'ResolutionManager'
+    """ The resolution manager instance that memoizes resolved references for the root Reflective instance. """
+
     _query: 'QueryManager'
     """ The query manager instance associated with the Reflective instance. """
 
+    _stats: 'StatsManager'
+    """ The stats manager instance that records instrumentation events for the root Reflective instance. """
+
+    _indexes: 'IndexManager'
+    """ The index manager instance that maintains the secondary indexes of the root Reflective instance. """
+
     _delimiter: str
     """ The delimiter used to join path components into paths. """
 
     _invalid: bool
     """ A flag to indicate whether the instance is invalid. """
 
+    _lazy: bool
+    """ A flag to indicate whether composite values are resolved lazily. This is only used by the root instance. """
+
+    _resources: list
+    """ The resources backing the value, such as mapped documents, that are closed with the instance. This is only used
+    by the root instance. """
+
     @property
     def instance(self) -> 'Reflective':
         """ Returns the Reflective instance that this RCore instance is associated with. """
@@ -64,16 +80,42 @@ class RCore:
         """ Sets the context manager instance associated with the Reflective instance. """
         self._context = value
 
+    @property
+    def resolver(self) -> 'ResolutionManager':
+        """ Returns the resolution manager instance that memoizes resolved references for the root Reflective instance.
+        """
+        return self._resolver
+
     @property
     def query(self) -> 'QueryManager':
         """ Returns the query manager instance associated with the Reflective instance. """
         return self._query
 
+    @property
+    def stats(self) -> 'StatsManager':
+        """ Returns the stats manager instance that records instrumentation events for the root Reflective instance. """
+        return self._stats
+
+    @property
+    def indexes(self) -> 'IndexManager':
+        """ Returns the index manager instance that maintains the secondary indexes of the root Reflective instance. """
+        return self._indexes
+
     @property
     def delimiter(self) -> str:
         """ Returns the delimiter used to join path components into paths. """
         return self._delimiter
 
+    @property
+    def lazy(self) -> bool:
+        """ Returns whether composite values are returned as lazily resolved views instead of parsed copies. """
+        return self.root()._lazy
+
+    @lazy.setter
+    def lazy(self, value: bool) -> None:
+        """ Sets whether composite values are returned as lazily resolved views instead of parsed copies. """
+        self.root()._lazy = value
+
     @property
     def path(self) -> list:
         """ Returns the path components of the associated context. This should be empty for the root instance. """
@@ -103,26 +145,194 @@ class RCore:
                  delimiter: Union[str, None] = None):
         """ Initializes a new ContextManager object associated with the given core. """
         from reflective.cache import CacheManager
+        from reflective.index import IndexManager
         from reflective.query import QueryManager
+        from reflective.resolver import ResolutionManager
+        from reflective.stats import StatsManager
         self._instance = instance
         self._context = context
         self._root = root if root is not None else instance
         self._delimiter = delimiter if delimiter is not None else DEFAULT_DELIMITER
         self._invalid = False
+        self._lazy = False
+        self._resources = []
 
-        # Initialize the other managers that aren't provided through instantiation.
-        self._cache = CacheManager(self) if root is None else root().cache
+        # Initialize the other managers that aren't provided through instantiation. Descendents share the managers of
+        # the root instance.
+        if root is None:
+            self._cache = CacheManager(self)
+            self._resolver = ResolutionManager(self)
+            self._stats = StatsManager(self)
+            self._indexes = IndexManager(self)
+        else:
+            root_core = root()
+            self._cache = root_core.cache
+            self._resolver = root_core.resolver
+            self._stats = root_core.stats
+            self._indexes = root_core.indexes
         self._query = QueryManager(self, delimiter)
 
+    def index(self, path: str, field: str) -> 'ListIndex':
+        """ Declares a secondary index on the given field of the items of the list at the given path, relative to this
+        instance unless it starts with the delimiter, and returns it. Fields are paths relative to each item. The index
+        is maintained as the value is modified, and is used by filter queries comparing the field for equality. """
+        from reflective.query import Query
+
+        query = Query.compile(path, self.delimiter)
+        list_path = self.path + query.path if query.is_relative else query.path
+        field_path = [] if field == '@' else Query.compile(field.strip(self.delimiter), self.delimiter).path
+
+        return self.indexes.add(list_path, field_path)
+
+    def overlay(self) -> 'Overlay':
+        """ Returns the overlay that is the value of the root instance. A TypeError is raised if the root value isn't an
+        overlay. """
+        from reflective.overlay import Overlay
+
+        overlay = self.root().context.raw
+
+        if not isinstance(overlay, Overlay):
+            raise TypeError(f'<{self.__class__.__name__}> Layers can only be changed for overlays, but the root value '
+                            f'is a {type(overlay).__name__}.')
+
+        return overlay
+
+    def add_layer(self, layer: dict, position: Union[int, None] = None) -> None:
+        """ Adds the given layer to the overlay of the root instance at the given position, or above every other layer.
+        Only the values of the keys held by the layer are invalidated. """
+        self.overlay_changed(self.overlay().add_layer(layer, position))
+
+    def replace_layer(self, position: int, layer: dict) -> None:
+        """ Replaces the layer at the given position of the overlay of the root instance with the given layer. Only the
+        values of the keys held by either layer are invalidated. """
+        self.overlay_changed(self.overlay().replace_layer(position, layer))
+
+    def remove_layer(self, position: int) -> None:
+        """ Removes the layer at the given position of the overlay of the root instance. Only the values of the keys held
+        by the layer are invalidated. """
+        self.overlay_changed(self.overlay().remove_layer(position))
+
+    def overlay_changed(self, keys: list) -> None:
+        """ Signals that the values of the given keys of the overlay of the root instance may have changed, since a layer
+        holding them was added, replaced or removed. Cached instances of the keys are invalidated if the type of their
+        value changed or the key no longer exists. """
+        from reflective.util import RUtil
+
+        context = self.root().context
+        overlay = context.raw
+
+        for key in keys:
+            context.changed([key])
+            instance = self.cache.get((key,))
+            if instance is None:
+                continue
+            if key not in overlay or type(instance) is not RUtil.get_type_class(overlay[key]):
+                instance().invalidate()
+                del self.cache[(key,)]
+
+    def graph(self) -> 'DependencyGraph':
+        """ Returns the graph of the Reflective references in the value of this instance, built by scanning the unparsed
+        value once. The graph loaded with a snapshot of the root instance is returned instead while it's current. """
+        from reflective.graph import DependencyGraph
+
+        if not self.path and self.resolver.graph is not None:
+            return self.resolver.graph
+
+        return DependencyGraph(self)
+
+    def resolve_all(self) -> any:
+        """ Resolves every Reflective reference in the value of the root instance once, in dependency order, and returns
+        a fully resolved plain copy of the value. The resolved values are memoized, so subsequent reads don't resolve
+        them again, and the copy is kept as the snapshot of the resolver until the value is next modified. """
+        root = self.root()
+        snapshot = root.graph().resolve()
+        self.resolver.snapshot = snapshot
+        return snapshot
+
+    def freeze(self) -> any:
+        """ Returns an immutable, fully resolved facade of the value of this instance. Reading the facade never parses,
+        validates, or traverses from the root value, so it suits values that aren't modified after they are loaded.
+        The facade doesn't reflect later modifications, and the snapshot of the resolver is reused if it is current. """
+        from functools import reduce
+        from reflective.frozen import Frozen
+
+        snapshot = self.resolver.snapshot
+
+        if snapshot is None:
+            snapshot = self.resolve_all()
+
+        return Frozen.freeze(reduce(lambda c, k: c[k], self.path, snapshot), self.delimiter)
+
+    def get_many(self, queries: list) -> list:
+        """ Returns the result of each of the given queries, in the same order, as calling the instance with the query
+        would. The instance is validated once for the whole batch, and containers shared by several query paths are
+        only looked up once. """
+        self.enforce_validation()
+
+        results: list = []
+
+        for qr in self.query.query_many(queries):
+            results.append(qr[0] if len(qr) == 1 else qr)
+
+        return results
+
+    def dump_snapshot(self, fp: any = None) -> Union[bytes, None]:
+        """ Returns the compact binary snapshot of the unparsed value of this instance, or writes it to the given binary
+        file object. The snapshot stores each distinct string once, along with the compiled template of every string
+        containing references. Snapshots of the root instance also store its dependency graph and the plain resolved
+        values memoized so far, so loading one with Reflective.load_snapshot requires no scanning or re-resolution. """
+        from reflective.snapshot import SnapshotWriter
+
+        references = None
+        memos = None
+
+        if not self.path:
+            references = self.graph().references
+            memos = [(key, value, dependencies) for key, value, dependencies in self.resolver.entries()
+                     if value is None or isinstance(value, (str, int, float, complex))]
+
+        data = SnapshotWriter().dump(self.context.raw, references, memos)
+
+        if fp is None:
+            return data
+
+        fp.write(data)
+
     def to_json(self, ref: any = None, flat: bool = True) -> str:
         """ Returns the JSON representation of the given reference, with the option to format the output. """
         import json
-        return json.dumps(ref or self.ref, indent=None if flat else 4)
+        return json.dumps(ref or self.context.resolved, indent=None if flat else 4)
 
     def to_yaml(self, ref: any = None) -> str:
         """ Returns the YAML representation of the given reference. """
         import yaml
-        return yaml.dump(ref or self.ref, indent=4)
+        return yaml.dump(ref or self.context.resolved, indent=4)
+
+    def dump_json(self, fp: any, flat: bool = True, chunk_size: Union[int, None] = None) -> None:
+        """ Writes the JSON representation of the reference value to the given text file object, in chunks of the given
+        number of characters. References are resolved as the value is written, so the output matches to_json without
+        a resolved copy of the value or the whole output being held in memory. """
+        from reflective.stream import StreamWriter, STREAM_CHUNK_SIZE
+        StreamWriter(fp, chunk_size if chunk_size is not None else STREAM_CHUNK_SIZE).dump_json(self.context, flat)
+
+    def dump_yaml(self, fp: any, chunk_size: Union[int, None] = None) -> None:
+        """ Writes the YAML representation of the reference value to the given text file object, in chunks of the given
+        number of characters. References are resolved as the value is written, so the output matches to_yaml without
+        a resolved copy of the value or the whole output being held in memory. """
+        from reflective.stream import StreamWriter, STREAM_CHUNK_SIZE
+        StreamWriter(fp, chunk_size if chunk_size is not None else STREAM_CHUNK_SIZE).dump_yaml(self.context)
+
+    def hold(self, resource: any) -> None:
+        """ Registers the given resource, which must have a close method, to be closed along with the root instance. """
+        self.root()._resources.append(resource)
+
+    def close(self) -> None:
+        """ Closes the resources backing the value of the root instance, such as the mapped document of an instance
+        created by Reflective.from_mapped_json. Values that haven't been read yet can't be read after. """
+        resources = self.root()._resources
+
+        while resources:
+            resources.pop().close()
 
     def invalidate(self) -> None:
         """ Invalidates the instance. """
@@ -135,8 +345,20 @@ class RCore:
             raise RInvalidReference('This reference is now invalid due to a value type change in the parsed value.')
 
     @staticmethod
-    def hash_value(value: str) -> str:
-        """ Builds a hash for the given value. """
-        import hashlib
-        import json
-        return hashlib.md5(json.dumps(str(value)).encode('utf-8')).hexdigest()
+    def path_key(path: list) -> tuple:
+        """ Builds a hashable key for the given path components. Slice components are converted to their string
+        representation since slices aren't hashable. """
+        key: list = []
+
+        if not any(type(component) is slice for component in path):
+            return tuple(path)
+
+        for component in path:
+            if type(component) is slice:
+                start = component.start if component.start is not None else ''
+                stop = component.stop if component.stop is not None else ''
+                step = component.step if component.step is not None else ''
+                component = f'{start}:{stop}:{step}'
+            key.append(component)
+
+        return tuple(key)
@@ -5,3 +5,26 @@ class RException(Exception):
 
 class RInvalidReference(RException):
     pass
+
+
+class RResolutionError(RException):
+    pass
+
+
+class RCircularReference(RResolutionError):
+
+    def __init__(self, message: str, cycle: list):
+        super().__init__(message)
+        self.cycle = cycle
+
+
+class RResolutionDepthExceeded(RResolutionError):
+    pass
+
+
+class RQuerySyntaxError(RException):
+    pass
+
+
+class RSnapshotError(RException):
+    pass
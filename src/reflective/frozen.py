@@ -0,0 +1,144 @@
+from __future__ import annotations
+from collections.abc import Mapping, Sequence
+from types import MappingProxyType
+from typing import Union
+
+
+class Frozen:
+    """ This class provides the base for immutable, fully resolved facades of composite values. Facades are built once
+    from a resolved value, so reading them never parses, validates, or traverses from the root value. Every value of a
+    frozen structure is also indexed by its path, so path reads cost a single lookup regardless of their depth. """
+
+    __slots__ = ('_data', '_index', '_prefix', '_delimiter')
+
+    _data: Union[MappingProxyType, tuple]
+    """ The immutable container of the frozen items. """
+
+    _index: dict
+    """ The frozen values of the whole frozen structure, keyed by the path components of their path relative to the
+    frozen root. """
+
+    _prefix: tuple
+    """ The path components of this value relative to the frozen root, which are empty for the frozen root itself. """
+
+    _delimiter: str
+    """ The delimiter used to join path components into paths. """
+
+    @property
+    def path(self) -> str:
+        """ Returns the path of this value relative to the frozen root. """
+        return self._delimiter.join(str(component) for component in self._prefix)
+
+    def __init__(self, data: Union[MappingProxyType, tuple], index: dict, prefix: tuple, delimiter: str):
+        """ Initializes a new Frozen object for the given immutable container. """
+        object.__setattr__(self, '_data', data)
+        object.__setattr__(self, '_index', index)
+        object.__setattr__(self, '_prefix', prefix)
+        object.__setattr__(self, '_delimiter', delimiter)
+
+    def __getattr__(self, item: str) -> any:
+        if item.startswith('_'):
+            raise AttributeError(item)
+        try:
+            return self.item(item)
+        except (KeyError, IndexError, TypeError):
+            raise AttributeError(f'<{self.__class__.__name__}> The attribute "{item}" does not exist.') from None
+
+    def __setattr__(self, key: str, value: any) -> None:
+        raise TypeError(f'<{self.__class__.__name__}> Frozen values cannot be modified.')
+
+    def __delattr__(self, item: str) -> None:
+        raise TypeError(f'<{self.__class__.__name__}> Frozen values cannot be modified.')
+
+    def __getitem__(self, key: any) -> any:
+        return self.item(key)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return self.thaw().__repr__()
+
+    def item(self, key: any) -> any:
+        """ Returns the frozen value of the item with the given key, or of the value at the given path if the key is a
+        path. Paths starting with the delimiter are relative to the frozen root. """
+        from reflective.core import RCore
+        from reflective.query import Query
+
+        delimiter = self._delimiter
+
+        if type(key) is str and delimiter in key:
+            path = key.strip(delimiter)
+            components = tuple(Query.compile(path, delimiter).path) if path else ()
+            if not key.startswith(delimiter):
+                components = self._prefix + components
+            return self._index[RCore.path_key(components)]
+
+        return self._data[key]
+
+    def thaw(self) -> any:
+        """ Returns a mutable, plain copy of this value. """
+        return Frozen.thaw_value(self._data)
+
+    @staticmethod
+    def thaw_value(value: any) -> any:
+        """ Returns a mutable, plain copy of the given frozen value, where sequences are copied as lists. """
+        if isinstance(value, Mapping):
+            return {k: Frozen.thaw_value(v) for k, v in value.items()}
+        if isinstance(value, (tuple, FrozenList)):
+            return [Frozen.thaw_value(item) for item in value]
+        return value
+
+    @staticmethod
+    def freeze(value: any, delimiter: str, index: dict = None, prefix: tuple = ()) -> any:
+        """ Returns an immutable facade of the given resolved value, recording every frozen value in the given path index.
+        Dictionaries become FrozenDict facades, lists and tuples become FrozenList facades, and other values are returned
+        as-is. """
+        if index is None:
+            index = {}
+
+        if isinstance(value, Mapping):
+            data = MappingProxyType({k: Frozen.freeze(v, delimiter, index, prefix + (k,)) for k, v in value.items()})
+            frozen = FrozenDict(data, index, prefix, delimiter)
+
+        elif isinstance(value, (list, tuple)):
+            data = tuple(Frozen.freeze(item, delimiter, index, prefix + (i,)) for i, item in enumerate(value))
+            frozen = FrozenList(data, index, prefix, delimiter)
+
+        else:
+            frozen = value
+
+        index[prefix] = frozen
+
+        return frozen
+
+
+class FrozenDict(Frozen, Mapping):
+    """ This class provides an immutable, fully resolved facade of a dictionary value. """
+
+    __slots__ = ()
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __contains__(self, key: any) -> bool:
+        return key in self._data
+
+
+class FrozenList(Frozen, Sequence):
+    """ This class provides an immutable, fully resolved facade of a list or tuple value. """
+
+    __slots__ = ()
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __contains__(self, item: any) -> bool:
+        return item in self._data
+
+    def __eq__(self, other: any) -> bool:
+        if isinstance(other, (list, tuple, FrozenList)):
+            return self._data == tuple(other)
+        return NotImplemented
+
+    __hash__ = None
@@ -0,0 +1,184 @@
+from __future__ import annotations
+from typing import Union
+
+
+class DependencyGraph:
+    """ This class provides the graph of the Reflective references in a value, where each node is the path of a string
+    value containing references, and each edge leads from a node to the nodes that its references depend on. A node
+    depends on every node at or below the path of each of its references, since resolving a container value resolves
+    the references of all of its items. """
+
+    _core: 'RCore'
+    """ The RCore instance whose value the graph was built from. """
+
+    _references: dict
+    """ The paths of the Reflective references of each node, keyed by node path components. """
+
+    _edges: dict
+    """ The nodes that each node depends on, keyed by node path components. """
+
+    @property
+    def core(self) -> 'RCore':
+        """ Returns the RCore instance whose value the graph was built from. """
+        return self._core
+
+    @property
+    def nodes(self) -> list:
+        """ Returns the path components of every node, in the order they were found. """
+        return list(self._edges)
+
+    @property
+    def edges(self) -> dict:
+        """ Returns the path components of the nodes that each node depends on, keyed by node path components. """
+        return {key: set(dependencies) for key, dependencies in self._edges.items()}
+
+    @property
+    def references(self) -> dict:
+        """ Returns the path components of the references of each node, keyed by node path components. """
+        return {key: list(references) for key, references in self._references.items()}
+
+    def __init__(self, core: 'RCore', references: Union[dict, None] = None):
+        """ Initializes a new DependencyGraph object by scanning the unparsed value of the given core once, or from the
+        given path components of the references of each node, such as those stored in a snapshot. """
+        from reflective.trie import PathTrie
+
+        self._core = core
+        self._references = {}
+        self._edges = {}
+
+        if references is None:
+            self.scan(core.context.raw, list(core.path))
+        else:
+            self._references = {key: list(paths) for key, paths in references.items()}
+
+        index = PathTrie()
+
+        for key in self._references:
+            index[key] = True
+
+        # Each reference depends on the nodes at or below the referenced path
+        for key, references in self._references.items():
+            self._edges[key] = set(node for path in references for node, _ in index.subtree(path))
+
+    def __contains__(self, key: tuple) -> bool:
+        return key in self._edges
+
+    def __len__(self) -> int:
+        return len(self._edges)
+
+    def scan(self, value: any, path: list) -> None:
+        """ Records a node for every string value containing Reflective references at or below the given value. """
+        from reflective.query import Filter, Query, Wildcard
+        from reflective.util import RUtil
+
+        if isinstance(value, dict):
+            for k, v in value.items():
+                self.scan(v, path + [k])
+
+        elif isinstance(value, (list, tuple)):
+            for i, item in enumerate(value):
+                self.scan(item, path + [i])
+
+        elif isinstance(value, str):
+            references = RUtil.extract(value)
+
+            if not references:
+                return
+
+            paths: list = []
+
+            for reference in references:
+                # Slices, wildcards and filters can't be tracked individually, so the dependency is on their container
+                components: list = []
+                for component in Query.compile(reference).path:
+                    if type(component) is slice or isinstance(component, (Wildcard, Filter)):
+                        break
+                    components.append(component)
+                paths.append(tuple(components))
+
+            self._references[self.core.path_key(path)] = paths
+
+    def order(self) -> list:
+        """ Returns the path components of every node, ordered so that each node follows the nodes it depends on. An
+        RCircularReference error is raised if the references form a cycle. """
+        from collections import deque
+
+        remaining: dict = {key: len(dependencies) for key, dependencies in self._edges.items()}
+        dependents: dict = {key: [] for key in self._edges}
+
+        for key, dependencies in self._edges.items():
+            for dependency in dependencies:
+                dependents[dependency].append(key)
+
+        ready = deque(key for key, count in remaining.items() if not count)
+        order: list = []
+
+        while ready:
+            key = ready.popleft()
+            order.append(key)
+            for dependent in dependents[key]:
+                remaining[dependent] -= 1
+                if not remaining[dependent]:
+                    ready.append(dependent)
+
+        if len(order) < len(self._edges):
+            self.raise_cycle(set(key for key, count in remaining.items() if count))
+
+        return order
+
+    def raise_cycle(self, nodes: set) -> None:
+        """ Raises an RCircularReference error naming a cycle among the given nodes, which must all depend on another
+        of the given nodes. """
+        from reflective.exceptions import RCircularReference
+
+        key = next(iter(sorted(nodes, key=str)))
+        visited: list = []
+
+        # Every remaining node depends on another remaining node, so following dependencies must revisit a node
+        while key not in visited:
+            visited.append(key)
+            key = next(iter(sorted((d for d in self._edges[key] if d in nodes), key=str)))
+
+        cycle = [self.format(k) for k in visited[visited.index(key):]] + [self.format(key)]
+        raise RCircularReference(f'Circular reference detected: {" -> ".join(cycle)}', cycle)
+
+    def resolve(self) -> any:
+        """ Resolves every node in dependency order, memoizing each resolved value, and returns a fully resolved plain
+        copy of the value the graph was built from. Since every dependency of a node has already been resolved, each
+        node is resolved once and no resolution recurses through other references. """
+        from functools import reduce
+        from reflective.util import RUtil
+
+        root = self.core.root().context
+
+        for key in self.order():
+            try:
+                value = reduce(lambda c, k: c[k], key, root.raw)
+            except (KeyError, IndexError, TypeError):
+                continue
+            root.parse(value, path=list(key))
+
+        return RUtil.get_plain_value(self.core.context.resolved)
+
+    def format(self, key: Union[tuple, None]) -> str:
+        """ Returns the given path components formatted as an absolute query path. """
+        return self.core.resolver.format(key)
+
+    def to_dict(self) -> dict:
+        """ Returns the graph as a dictionary of the formatted paths of the nodes that each node depends on, keyed by the
+        formatted node path. """
+        return {self.format(key): sorted(self.format(d) for d in dependencies) for key, dependencies in
+                self._edges.items()}
+
+    def to_dot(self) -> str:
+        """ Returns the graph in the Graphviz DOT language, with edges leading from each node to its dependencies. """
+        lines: list = ['digraph reflective {']
+
+        for key, dependencies in self._edges.items():
+            lines.append(f'    "{self.format(key)}";')
+            for dependency in sorted(dependencies, key=str):
+                lines.append(f'    "{self.format(key)}" -> "{self.format(dependency)}";')
+
+        lines.append('}')
+
+        return '\n'.join(lines)
@@ -0,0 +1,307 @@
+from __future__ import annotations
+from typing import Union
+
+UNINDEXED: object = object()
+""" The key recorded for items whose field is missing or unhashable, which can never equal a filter literal. """
+
+DYNAMIC: object = object()
+""" The key recorded for items whose field contains references, which must be resolved whenever the index is used. """
+
+
+class ListIndex:
+    """ This class provides a secondary index over a list of composite items, mapping the unparsed value of a field of
+    each item to the positions of the items holding it. Fields containing references can't be indexed by their resolved
+    value, since it changes with the values it depends on, so the positions of those items are always included in
+    lookups. The index is maintained incrementally as items are added, removed or modified, and is rebuilt when it can't
+    be, such as when the list is sorted or replaced. """
+
+    _path: tuple
+    """ The path components of the indexed list. """
+
+    _field: tuple
+    """ The path components of the indexed field, relative to each item. """
+
+    _keys: list
+    """ The key recorded for the item at each position. """
+
+    _positions: dict
+    """ The positions of the items holding each unparsed field value, keyed by field value. """
+
+    _dynamic: set
+    """ The positions of the items whose field contains references. """
+
+    _stale: bool
+    """ Whether the index must be rebuilt before it is used. """
+
+    @property
+    def path(self) -> tuple:
+        """ Returns the path components of the indexed list. """
+        return self._path
+
+    @property
+    def field(self) -> tuple:
+        """ Returns the path components of the indexed field, relative to each item. """
+        return self._field
+
+    @property
+    def stale(self) -> bool:
+        """ Returns whether the index must be rebuilt before it is used. """
+        return self._stale
+
+    @stale.setter
+    def stale(self, value: bool) -> None:
+        """ Sets whether the index must be rebuilt before it is used. """
+        self._stale = value
+
+    def __init__(self, path: tuple, field: tuple):
+        """ Initializes a new, stale ListIndex object for the given list and field path components. """
+        self._path = path
+        self._field = field
+        self._keys = []
+        self._positions = {}
+        self._dynamic = set()
+        self._stale = True
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} path={self._path} field={self._field} stale={self._stale}>'
+
+    def build(self, items: Union[list, tuple]) -> None:
+        """ Rebuilds the index from the given unparsed items. """
+        self._keys = [UNINDEXED] * len(items)
+        self._positions = {}
+        self._dynamic = set()
+
+        for position, item in enumerate(items):
+            self.add(position, item)
+
+        self._stale = False
+
+    def key(self, item: any) -> any:
+        """ Returns the key recorded for the given unparsed item. """
+        from functools import reduce
+
+        try:
+            value = reduce(lambda c, k: c[k], self._field, item)
+        except (KeyError, IndexError, TypeError):
+            return UNINDEXED
+
+        if isinstance(value, str) and '$' in value:
+            return DYNAMIC
+
+        try:
+            hash(value)
+        except TypeError:
+            return UNINDEXED
+
+        return value
+
+    def add(self, position: int, item: any) -> None:
+        """ Records the given unparsed item at the given position, which must not already be recorded. """
+        key = self._keys[position] = self.key(item)
+
+        if key is DYNAMIC:
+            self._dynamic.add(position)
+        elif key is not UNINDEXED:
+            self._positions.setdefault(key, set()).add(position)
+
+    def discard(self, position: int) -> None:
+        """ Removes the record of the item at the given position. """
+        key = self._keys[position]
+        self._keys[position] = UNINDEXED
+
+        if key is DYNAMIC:
+            self._dynamic.discard(position)
+        elif key is not UNINDEXED:
+            positions = self._positions[key]
+            positions.discard(position)
+            if not positions:
+                del self._positions[key]
+
+    def update(self, position: int, item: any) -> None:
+        """ Records the given unparsed item in place of the item previously at the given position. """
+        self.discard(position)
+        self.add(position, item)
+
+    def move(self, position: int, count: int, items: Union[list, tuple]) -> None:
+        """ Records that the given number of items were inserted at the given position, or removed from it if the count
+        is negative, given the unparsed items of the list after the change. Every item from the position onwards is
+        recorded again at its shifted position, so each change costs time proportional to the number of items after
+        the position: appending to or popping from the end of the list is cheap, while inserting at or removing from
+        the start of a large list costs as much as rebuilding the index. """
+        for i in range(position, len(self._keys)):
+            self.discard(i)
+
+        if count > 0:
+            self._keys[position:position] = [UNINDEXED] * count
+        else:
+            del self._keys[position:position - count]
+
+        for i in range(position, len(self._keys)):
+            self.add(i, items[i])
+
+    def lookup(self, value: any) -> list:
+        """ Returns the positions of the items whose field may equal the given value, in ascending order. These are the
+        items whose unparsed field equals the value, and the items whose field must first be resolved. """
+        try:
+            positions = self._positions.get(value, ())
+        except TypeError:
+            positions = ()
+
+        if not self._dynamic:
+            return sorted(positions)
+
+        return sorted(self._dynamic.union(positions))
+
+
+class IndexManager:
+    """ This class provides the secondary indexes declared on a root Reflective instance and its descendents, and keeps
+    them current as the value is modified. Filter queries that compare an indexed field for equality use the index to
+    visit only the matching items. """
+
+    _core: 'RCore'
+    """ The parent RCore instance of this instance. """
+
+    _indexes: dict
+    """ The declared indexes, keyed by the path components of the indexed list and field. """
+
+    @property
+    def core(self) -> 'RCore':
+        """ Returns the parent RCore instance of this instance. """
+        return self._core
+
+    def __init__(self, core: 'RCore'):
+        """ Initializes a new IndexManager object associated with the given core. """
+        self._core = core
+        self._indexes = {}
+
+    def __contains__(self, key: tuple) -> bool:
+        return key in self._indexes
+
+    def __iter__(self):
+        return iter(self._indexes.values())
+
+    def __len__(self) -> int:
+        return len(self._indexes)
+
+    def add(self, path: list, field: list) -> ListIndex:
+        """ Declares an index on the given field of the items of the list at the given absolute path, returning the
+        existing index if one is already declared. The index is built immediately. """
+        from reflective.core import RCore
+
+        key = (RCore.path_key(path), RCore.path_key(field))
+        index = self._indexes.get(key)
+
+        if index is None:
+            index = self._indexes[key] = ListIndex(*key)
+
+        self.refresh(index)
+
+        return index
+
+    def drop(self, path: list, field: list) -> None:
+        """ Removes the index on the given field of the items of the list at the given absolute path, if declared. """
+        from reflective.core import RCore
+        self._indexes.pop((RCore.path_key(path), RCore.path_key(field)), None)
+
+    def clear(self) -> None:
+        """ Removes all declared indexes. """
+        self._indexes = {}
+
+    def get(self, path: tuple, field: tuple, items: Union[list, tuple, None] = None) -> Union[ListIndex, None]:
+        """ Returns the current index on the given field of the items of the list at the given path components, or None
+        if no such index is declared. A stale index is rebuilt first, from the given unparsed items if provided. """
+        index = self._indexes.get((path, field))
+
+        if index is not None and index.stale:
+            self.refresh(index, items)
+
+        return index
+
+    def refresh(self, index: ListIndex, items: Union[list, tuple, None] = None) -> None:
+        """ Rebuilds the given index from the given unparsed items, or from the unparsed list at the indexed path. """
+        from functools import reduce
+
+        if items is None:
+            try:
+                items = reduce(lambda c, k: c[k], index.path, self.core.root().context.raw)
+            except (KeyError, IndexError, TypeError):
+                items = None
+
+        if not isinstance(items, (list, tuple)):
+            raise TypeError(f'<{self.__class__.__name__}> Only list values can be indexed, but the value at '
+                            f'"{self.core.resolver.format(index.path)}" is a {type(items).__name__}.')
+
+        index.build(items)
+
+    def changed(self, path: list, reindex: bool = True) -> None:
+        """ Signals that the unparsed value at the given absolute path has been modified. Indexes of lists at or below
+        the path are rebuilt before they are next used, unless the change was already applied to them incrementally,
+        and indexed items modified at or above their indexed field are recorded again. """
+        from reflective.core import RCore
+
+        key = RCore.path_key(path)
+        size = len(key)
+
+        for index in self._indexes.values():
+            if index.stale:
+                continue
+
+            depth = len(index.path)
+
+            # Lists at or below the path may have been replaced, or moved if an enclosing list was modified
+            if index.path[:size] == key:
+                if reindex or size < depth:
+                    index.stale = True
+                continue
+
+            if size <= depth or key[:depth] != index.path:
+                continue
+
+            position = key[depth]
+            remainder = key[depth + 1:]
+
+            # Only changes to the item itself, the indexed field, or the containers leading to it affect the index
+            if remainder != index.field[:len(remainder)]:
+                continue
+
+            if type(position) is not int or not 0 <= position < len(index):
+                index.stale = True
+                continue
+
+            self.refresh_item(index, position)
+
+    def refresh_item(self, index: ListIndex, position: int) -> None:
+        """ Records the current unparsed item at the given position of the given index again. """
+        from functools import reduce
+
+        try:
+            items = reduce(lambda c, k: c[k], index.path, self.core.root().context.raw)
+            index.update(position, items[position])
+        except (KeyError, IndexError, TypeError):
+            index.stale = True
+
+    def moved(self, path: list, position: int, count: int) -> None:
+        """ Signals that the given number of items were inserted into the list at the given absolute path at the given
+        position, or removed from it if the count is negative, updating the indexes of the list incrementally. """
+        from functools import reduce
+        from reflective.core import RCore
+
+        key = RCore.path_key(path)
+        items = None
+
+        for index in self._indexes.values():
+            if index.path != key or index.stale:
+                continue
+
+            if items is None:
+                items = reduce(lambda c, k: c[k], index.path, self.core.root().context.raw)
+
+            # Indexes that are out of step with the list, such as after direct modification, are rebuilt instead
+            if len(index) + count != len(items):
+                index.stale = True
+                continue
+
+            index.move(position, count, items)
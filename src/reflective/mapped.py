@@ -0,0 +1,440 @@
+from __future__ import annotations
+import json
+import mmap
+import os
+import re
+import struct
+from typing import Callable, Union
+from reflective.stream import LazyDict, LazyList
+
+MAPPED_THRESHOLD: int = 4096
+""" The size in bytes from which composite values of a mapped document are decoded lazily instead of all at once. """
+
+INDEX_SUFFIX: str = '.index'
+""" The suffix appended to the path of a mapped document to form the default path of its offset index. """
+
+INDEX_MAGIC: bytes = b'RFX1'
+""" The bytes that offset indexes start with, identifying their layout. """
+
+INDEX_HEADER: struct.Struct = struct.Struct('<4sQQ')
+""" The layout of the header of offset indexes, holding the magic bytes, the size of the indexed document, and the
+number of indexed composite values. """
+
+INDEX_RECORD: struct.Struct = struct.Struct('<QQQ')
+""" The layout of the directory records of offset indexes, holding the offset of an indexed composite value in the
+document, and the position and length of its member offsets in the index. Records are sorted by offset, so that they
+can be found by binary search. """
+
+WHITESPACE_PATTERN: re.Pattern = re.compile(rb'[ \t\n\r]*')
+""" The regular expression pattern used to skip insignificant whitespace between JSON tokens. """
+
+STRING_PATTERN: re.Pattern = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+""" The regular expression pattern used to match a complete JSON string. """
+
+BRACKET_PATTERN: re.Pattern = re.compile(rb'(?:[^"{}\[\]]|"[^"\\]*(?:\\.[^"\\]*)*")*([{}\[\]])', re.DOTALL)
+""" The regular expression pattern used to find the next container boundary within a JSON value, skipping strings. """
+
+SCALAR_END_PATTERN: re.Pattern = re.compile(rb'[ \t\n\r,\]}]')
+""" The regular expression pattern used to find the end of a JSON number or literal. """
+
+
+class MappedDocument:
+    """ This class provides read access to a JSON document in a memory-mapped file. Composite values are decoded one
+    level at a time as they are first dereferenced, so only the bytes on the paths that are read are decoded, and memory
+    use stays proportional to the values that are read rather than to the size of the file. The offsets of the members
+    of large composite values are read from a prebuilt offset index when one is given, and are otherwise found by
+    scanning the value when it is first dereferenced. Offset indexes are memory-mapped as well, and the member offsets of
+    a value are only decoded from the index when the value is dereferenced. """
+
+    _file: any
+    """ The binary file object of the document. """
+
+    _map: Union[mmap.mmap, None]
+    """ The memory map of the document, or None once the document has been closed. """
+
+    _index_file: any
+    """ The binary file object of the offset index, or None if there is no index. """
+
+    _index: Union[mmap.mmap, None]
+    """ The memory map of the offset index, or None if there is no index or the document has been closed. """
+
+    _count: int
+    """ The number of composite values in the offset index. """
+
+    _threshold: int
+    """ The size in bytes from which composite values are decoded lazily. """
+
+    @property
+    def threshold(self) -> int:
+        """ Returns the size in bytes from which composite values are decoded lazily. """
+        return self._threshold
+
+    def __init__(self, path: str, index: Union[str, None] = None, threshold: int = MAPPED_THRESHOLD):
+        """ Initializes a new MappedDocument object for the JSON file at the given path, using the offset index at the
+        given path if provided. """
+        self._file = open(path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._index_file = None
+        self._index = None
+        self._count = 0
+        self._threshold = threshold
+
+        if index is not None:
+            try:
+                self.read_index(index)
+            except (OSError, ValueError):
+                self.close()
+                raise
+
+    def __enter__(self) -> 'MappedDocument':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        """ Closes the memory maps and the files of the document and its offset index. Values that haven't been decoded
+        can't be read after. """
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+            self._file.close()
+
+        if self._index is not None:
+            self._index.close()
+            self._index = None
+
+        if self._index_file is not None:
+            self._index_file.close()
+            self._index_file = None
+
+    def load(self) -> any:
+        """ Returns the root value of the document. """
+        data = self._map
+        start = self.skip_whitespace(0)
+        end = len(data)
+
+        # The root value ends at the last significant byte, so finding it doesn't require scanning the document
+        while end > start and data[end - 1:end] in (b' ', b'\t', b'\n', b'\r'):
+            end -= 1
+
+        return self.decode(start, end)
+
+    def skip_whitespace(self, position: int) -> int:
+        """ Returns the position of the first significant byte at or after the given position. """
+        return WHITESPACE_PATTERN.match(self._map, position).end()
+
+    def value_end(self, start: int) -> int:
+        """ Returns the position following the JSON value starting at the given position. Composite values are skipped
+        by counting their brackets, without decoding them. """
+        data = self._map
+        c = data[start:start + 1]
+
+        if not c:
+            raise json.JSONDecodeError('Expecting value', '', start)
+
+        if c == b'"':
+            match = STRING_PATTERN.match(data, start)
+            if match is None:
+                raise json.JSONDecodeError('Unterminated string', '', start)
+            return match.end()
+
+        if c not in b'{[':
+            match = SCALAR_END_PATTERN.search(data, start)
+            return match.start() if match is not None else len(data)
+
+        depth = 0
+        position = start
+
+        while True:
+            match = BRACKET_PATTERN.match(data, position)
+
+            if match is None:
+                raise json.JSONDecodeError('Unterminated value', '', start)
+
+            depth += 1 if match.group(1) in b'{[' else -1
+            position = match.end()
+
+            if not depth:
+                return position
+
+    def expect(self, position: int, characters: bytes) -> tuple:
+        """ Returns the next significant byte at or after the given position, which must be one of the given bytes, and
+        the position following it. """
+        position = self.skip_whitespace(position)
+        c = self._map[position:position + 1]
+
+        if not c or c not in characters:
+            raise json.JSONDecodeError(f'Expecting one of {characters!r}', '', position)
+
+        return c, position + 1
+
+    def members(self, start: int, measure: Union[Callable, None] = None) -> tuple:
+        """ Returns the members of the composite value starting at the given position, as a list of the key, when the
+        value is a dictionary, and the start and end positions of each member, along with the position following the
+        value. The end of each member is found with the given callable if provided, or by skipping over it. """
+        data = self._map
+        measure = measure if measure is not None else self.value_end
+        opening = data[start:start + 1]
+        closing = b'}' if opening == b'{' else b']'
+        position = self.skip_whitespace(start + 1)
+        table: list = []
+
+        if data[position:position + 1] == closing:
+            return table, position + 1
+
+        while True:
+            if opening == b'{':
+                position = self.skip_whitespace(position)
+                end = self.value_end(position)
+                key = json.loads(data[position:end])
+                position = self.skip_whitespace(self.expect(end, b':')[1])
+                end = measure(position)
+                table.append([key, position, end])
+            else:
+                position = self.skip_whitespace(position)
+                end = measure(position)
+                table.append([position, end])
+
+            c, position = self.expect(end, b',' + closing)
+
+            if c == closing:
+                return table, position
+
+    def table(self, start: int) -> Union[dict, list]:
+        """ Returns the member offsets of the composite value starting at the given position, as a dictionary of start
+        and end positions keyed by member key for dictionaries, or as a list of start and end positions for lists. """
+        table = self.indexed(start)
+
+        if table is None:
+            table = self.members(start)[0]
+
+        if self._map[start:start + 1] == b'{':
+            return {key: (position, end) for key, position, end in table}
+
+        return [tuple(span) for span in table]
+
+    def decode(self, start: int, end: int) -> any:
+        """ Decodes the JSON value between the given positions. Composite values of at least the threshold size are
+        returned as mapped containers whose members are decoded as they are first read. """
+        if self._map is None:
+            raise ValueError(f'<{self.__class__.__name__}> The mapped document has been closed.')
+
+        if end - start >= self._threshold:
+            c = self._map[start:start + 1]
+            if c == b'{':
+                return MappedDict(self, start)
+            if c == b'[':
+                return MappedList(self, start)
+
+        return json.loads(self._map[start:end])
+
+    def indexed(self, start: int) -> Union[list, None]:
+        """ Returns the member offsets of the composite value starting at the given position from the offset index, or
+        None if the value isn't indexed. The directory of the index is searched in place, and only the member offsets of
+        the value are decoded. """
+        index = self._index
+
+        if index is None:
+            return None
+
+        low, high = 0, self._count
+
+        while low < high:
+            middle = (low + high) // 2
+            offset, position, length = INDEX_RECORD.unpack_from(index, INDEX_HEADER.size + middle * INDEX_RECORD.size)
+            if offset < start:
+                low = middle + 1
+            elif offset > start:
+                high = middle
+            else:
+                return json.loads(index[position:position + length])
+
+        return None
+
+    def read_index(self, path: str) -> None:
+        """ Maps the offset index at the given path, checking that it was built for this document. Member offsets are
+        read from it as the indexed values are dereferenced. """
+        self._index_file = open(path, 'rb')
+        self._index = mmap.mmap(self._index_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._index) < INDEX_HEADER.size:
+            raise ValueError(f'<{self.__class__.__name__}> The file at "{path}" is not an offset index.')
+
+        magic, size, self._count = INDEX_HEADER.unpack_from(self._index)
+
+        if magic != INDEX_MAGIC:
+            raise ValueError(f'<{self.__class__.__name__}> The file at "{path}" is not an offset index.')
+
+        if size != len(self._map):
+            raise ValueError(f'<{self.__class__.__name__}> The offset index at "{path}" was built for a different '
+                             f'version of the document.')
+
+    def write_index(self, path: str) -> None:
+        """ Scans the whole document once and writes the member offsets of every composite value of at least the
+        threshold size to an offset index at the given path. The index starts with a directory of the indexed values
+        sorted by offset, followed by the member offsets of each value encoded as JSON. """
+        tables: dict = {}
+        self.index_value(self.skip_whitespace(0), tables)
+
+        offsets = sorted(tables)
+        position = INDEX_HEADER.size + len(offsets) * INDEX_RECORD.size
+        bodies: list = []
+
+        with open(path, 'wb') as fp:
+            fp.write(INDEX_HEADER.pack(INDEX_MAGIC, len(self._map), len(offsets)))
+
+            for offset in offsets:
+                body = json.dumps(tables[offset], separators=(',', ':')).encode()
+                fp.write(INDEX_RECORD.pack(offset, position, len(body)))
+                position += len(body)
+                bodies.append(body)
+
+            for body in bodies:
+                fp.write(body)
+
+    def index_value(self, start: int, tables: dict) -> int:
+        """ Records the member offsets of the composite values of at least the threshold size at or below the value
+        starting at the given position, and returns the position following the value. """
+        if self._map[start:start + 1] not in (b'{', b'['):
+            return self.value_end(start)
+
+        # Members are indexed depth first in a single pass, so that no value is scanned more than once
+        table, end = self.members(start, lambda position: self.index_value(position, tables))
+
+        if end - start >= self._threshold:
+            tables[start] = table
+
+        return end
+
+    @staticmethod
+    def build_index(path: str, index: Union[str, None] = None, threshold: int = MAPPED_THRESHOLD) -> str:
+        """ Builds the offset index of the JSON file at the given path, writing it to the given index path or next to
+        the file, and returns the index path. """
+        if index is None:
+            index = path + INDEX_SUFFIX
+
+        with MappedDocument(path, threshold=threshold) as document:
+            document.write_index(index)
+
+        return index
+
+    @staticmethod
+    def default_index(path: str) -> Union[str, None]:
+        """ Returns the default path of the offset index of the JSON file at the given path, if an index exists there
+        that is newer than the file. """
+        index = path + INDEX_SUFFIX
+
+        if os.path.exists(index) and os.path.getmtime(index) >= os.path.getmtime(path):
+            return index
+
+        return None
+
+
+class MappedDict(LazyDict):
+    """ This class provides a dictionary from a mapped document whose members are decoded as they are first read. """
+
+    _document: MappedDocument
+    """ The mapped document holding the dictionary. """
+
+    _table: dict
+    """ The start and end positions of each member, keyed by member key. """
+
+    def __init__(self, document: MappedDocument, start: int):
+        """ Initializes a new MappedDict object for the dictionary starting at the given position of the document. """
+        super().__init__()
+        self._document = document
+        self._table = document.table(start)
+        self._loaded = False
+
+    def __missing__(self, key: any) -> any:
+        if self._loaded:
+            raise KeyError(key)
+
+        try:
+            span = self._table[key]
+        except (KeyError, TypeError):
+            raise KeyError(key) from None
+
+        value = self._document.decode(*span)
+        dict.__setitem__(self, key, value)
+
+        return value
+
+    def __contains__(self, key: any) -> bool:
+        if self._loaded:
+            return dict.__contains__(self, key)
+
+        try:
+            return key in self._table
+        except TypeError:
+            return False
+
+    def __len__(self) -> int:
+        return dict.__len__(self) if self._loaded else len(self._table)
+
+    def load(self) -> None:
+        """ Decodes the remaining members, keeping the members in document order. """
+        if self._loaded:
+            return
+
+        decoded = dict(dict.items(self))
+        dict.clear(self)
+
+        for key, span in self._table.items():
+            dict.__setitem__(self, key, decoded[key] if key in decoded else self._document.decode(*span))
+
+        self._loaded = True
+        self._table = {}
+
+
+class MappedList(LazyList):
+    """ This class provides a list from a mapped document whose items are decoded as they are first read. """
+
+    _document: MappedDocument
+    """ The mapped document holding the list. """
+
+    _table: list
+    """ The start and end positions of each item. """
+
+    _items: dict
+    """ The items that have been decoded before the whole list was loaded, keyed by position. """
+
+    def __init__(self, document: MappedDocument, start: int):
+        """ Initializes a new MappedList object for the list starting at the given position of the document. """
+        super().__init__()
+        self._document = document
+        self._table = document.table(start)
+        self._items = {}
+        self._loaded = False
+
+    def __getitem__(self, index: Union[int, slice]) -> any:
+        if self._loaded or type(index) is not int:
+            self.load()
+            return list.__getitem__(self, index)
+
+        position = index + len(self._table) if index < 0 else index
+
+        if not 0 <= position < len(self._table):
+            raise IndexError('list index out of range')
+
+        if position not in self._items:
+            self._items[position] = self._document.decode(*self._table[position])
+
+        return self._items[position]
+
+    def __len__(self) -> int:
+        return list.__len__(self) if self._loaded else len(self._table)
+
+    def load(self) -> None:
+        """ Decodes the remaining items, in document order. """
+        if self._loaded:
+            return
+
+        items = self._items
+        list.extend(self, [items[i] if i in items else self._document.decode(*span)
+                           for i, span in enumerate(self._table)])
+
+        self._loaded = True
+        self._table = []
+        self._items = {}
@@ -0,0 +1,259 @@
+from __future__ import annotations
+from typing import Union
+
+DELETED: object = object()
+""" The marker written to the local layer of an overlay for keys that have been deleted, hiding them in every layer. """
+
+
+class Overlay(dict):
+    """ This class provides a dictionary that looks up each key through an ordered stack of layers, instead of merging
+    the layers into a copy. The last layer takes precedence, and dictionaries found at the same key in several layers
+    are combined into a nested overlay of those dictionaries, so the layers are never copied. The value that wins for
+    each key is memoized in the dictionary itself until a layer holding the key is added, replaced or removed, so that
+    changing a layer only costs the keys it holds. The merged keys of the layers are likewise kept until a layer is
+    changed or a key is written or deleted. Values written to the overlay are kept in a local layer above every
+    other layer, leaving the layers themselves unmodified, although composite values taken from a layer are still the
+    values of that layer and are modified in place. """
+
+    _layers: list
+    """ The layers of the overlay, from the lowest to the highest precedence. """
+
+    _local: Union[dict, None]
+    """ The layer holding the values written to the overlay, or None if nothing has been written to it yet. """
+
+    _parent: Union['Overlay', None]
+    """ The overlay that this overlay is nested in, or None for the root overlay. """
+
+    _key: any
+    """ The key of this overlay in the overlay that it is nested in. """
+
+    _keys: Union[dict, None]
+    """ The keys of the overlay in order, as the keys of a dictionary, or None if they haven't been merged from the
+    layers since a layer was last changed. """
+
+    @property
+    def layers(self) -> tuple:
+        """ Returns the layers of the overlay, from the lowest to the highest precedence. """
+        return tuple(self._layers)
+
+    def __init__(self, layers: Union[list, tuple] = (), local: Union[dict, None] = None,
+                 parent: Union['Overlay', None] = None, key: any = None):
+        """ Initializes a new Overlay object for the given layers, from the lowest to the highest precedence. """
+        super().__init__()
+
+        for layer in layers:
+            if not isinstance(layer, dict):
+                raise TypeError(f'<{self.__class__.__name__}> Only dictionaries can be layers, but a layer is a '
+                                f'{type(layer).__name__}.')
+
+        self._layers = list(layers)
+        self._local = local
+        self._parent = parent
+        self._key = key
+        self._keys = None
+
+    def stack(self) -> list:
+        """ Returns the layers, followed by the local layer if one exists. """
+        return self._layers if self._local is None else self._layers + [self._local]
+
+    def lookup(self, key: any) -> any:
+        """ Returns the value that wins for the given key, without memoizing it. """
+        values: list = []
+
+        for layer in reversed(self.stack()):
+            if key not in layer:
+                continue
+            value = layer[key]
+            if value is DELETED:
+                break
+            values.append(value)
+            # Values that aren't dictionaries hide the values of the layers below them
+            if not isinstance(value, dict):
+                break
+
+        if not values:
+            raise KeyError(key)
+
+        if not isinstance(values[0], dict):
+            return values[0]
+
+        dictionaries = [value for value in values if isinstance(value, dict)]
+        local = None
+
+        if self._local is not None and isinstance(self._local.get(key), dict):
+            local = dictionaries.pop(0)
+
+        return Overlay(list(reversed(dictionaries)), local, self, key)
+
+    def writable(self) -> dict:
+        """ Returns the local layer, creating it and attaching it to the local layers of the enclosing overlays if it
+        doesn't exist yet. """
+        if self._local is None:
+            if self._parent is None:
+                self._local = {}
+            else:
+                local = self._parent.writable()
+                existing = local.get(self._key)
+                self._local = existing if isinstance(existing, dict) else {}
+                local[self._key] = self._local
+
+        return self._local
+
+    def forget(self, keys: Union[list, set, tuple, None] = None) -> None:
+        """ Removes the memoized values of the given keys, or of every key, along with the merged keys of the
+        overlay. """
+        self._keys = None
+
+        if keys is None:
+            dict.clear(self)
+            return
+
+        for key in keys:
+            dict.pop(self, key, None)
+
+    def add_layer(self, layer: dict, position: Union[int, None] = None) -> list:
+        """ Adds the given layer at the given position of the stack, or above every other layer, and returns the keys
+        whose values may have changed. """
+        if not isinstance(layer, dict):
+            raise TypeError(f'<{self.__class__.__name__}> Only dictionaries can be layers, but the layer is a '
+                            f'{type(layer).__name__}.')
+
+        self._layers.insert(len(self._layers) if position is None else position, layer)
+
+        keys = list(layer)
+        self.forget(keys)
+
+        return keys
+
+    def replace_layer(self, position: int, layer: dict) -> list:
+        """ Replaces the layer at the given position of the stack with the given layer, and returns the keys whose values
+        may have changed. """
+        if not isinstance(layer, dict):
+            raise TypeError(f'<{self.__class__.__name__}> Only dictionaries can be layers, but the layer is a '
+                            f'{type(layer).__name__}.')
+
+        keys = list(dict.fromkeys(list(self._layers[position]) + list(layer)))
+        self._layers[position] = layer
+        self.forget(keys)
+
+        return keys
+
+    def remove_layer(self, position: int) -> list:
+        """ Removes the layer at the given position of the stack, and returns the keys whose values may have changed. """
+        keys = list(self._layers.pop(position))
+        self.forget(keys)
+
+        return keys
+
+    def __missing__(self, key: any) -> any:
+        value = self.lookup(key)
+        dict.__setitem__(self, key, value)
+        return value
+
+    def __contains__(self, key: any) -> bool:
+        try:
+            self[key]
+        except (KeyError, TypeError):
+            return False
+        return True
+
+    def __setitem__(self, key: any, value: any) -> None:
+        self.writable()[key] = value
+        dict.pop(self, key, None)
+        # New keys are merged again, since a key that was deleted earlier takes its position in the lower layers
+        if self._keys is not None and key not in self._keys:
+            self._keys = None
+
+    def __delitem__(self, key: any) -> None:
+        if key not in self:
+            raise KeyError(key)
+
+        self.writable()[key] = DELETED
+        dict.pop(self, key, None)
+        if self._keys is not None:
+            self._keys.pop(key, None)
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return len(self.merged())
+
+    def __eq__(self, other: any) -> bool:
+        return dict(self.items()) == other
+
+    def __ne__(self, other: any) -> bool:
+        return not self == other
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+    __hash__ = None
+
+    def merged(self) -> dict:
+        """ Returns the keys of the overlay in order, as the keys of a dictionary. The keys are merged from the layers
+        once, and kept until a layer is changed. """
+        if self._keys is None:
+            keys: dict = {}
+
+            for layer in self.stack():
+                for key, value in layer.items():
+                    if value is DELETED:
+                        keys.pop(key, None)
+                    else:
+                        keys[key] = None
+
+            self._keys = keys
+
+        return self._keys
+
+    def keys(self) -> list:
+        return list(self.merged())
+
+    def values(self) -> list:
+        return [self[key] for key in self.keys()]
+
+    def items(self) -> list:
+        return [(key, self[key]) for key in self.keys()]
+
+    def get(self, key: any, default: any = None) -> any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def copy(self) -> dict:
+        return dict(self.items())
+
+    def pop(self, key: any, *args) -> any:
+        try:
+            value = self[key]
+        except KeyError:
+            if args:
+                return args[0]
+            raise
+
+        del self[key]
+
+        return value
+
+    def popitem(self) -> tuple:
+        keys = self.keys()
+
+        if not keys:
+            raise KeyError('popitem(): dictionary is empty')
+
+        return keys[-1], self.pop(keys[-1])
+
+    def setdefault(self, key: any, default: any = None) -> any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self) -> None:
+        for key in self.keys():
+            del self[key]
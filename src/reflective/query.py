@@ -1,10 +1,238 @@
 from __future__ import annotations
+import re
 from collections import UserList
-from typing import Union
+from functools import lru_cache
+from typing import Callable, Iterator, NamedTuple, Union
 
 DEFAULT_DELIMITER: str = '/'
 """ The default separator used to join path components into paths. """
 
+QUERY_CACHE_SIZE: int = 1024
+""" The default maximum number of compiled Query objects that are retained for reuse. """
+
+SLICE_PATTERN: re.Pattern = re.compile(r'^(-?[0-9]+)?:(-?[0-9]+)?(?::(-?[0-9]+)?)?$')
+""" The regular expression pattern used to match slice path components in queries. """
+
+QUERY_CACHE_MARKER: object = object()
+""" The trailing cache key component that distinguishes cached query results from cached Reflective instances. """
+
+WILDCARD_CHARACTERS: str = '*?'
+""" The characters that make a query path component a wildcard pattern. """
+
+RECURSIVE_WILDCARD: str = '**'
+""" The query path component that matches any number of nested path components. """
+
+FILTER_PATTERN: re.Pattern = re.compile(r'^(.*?)\[\?(.*)\]$', re.DOTALL)
+""" The regular expression pattern used to match filter path components in queries, optionally preceded by a key. """
+
+PREDICATE_PATTERN: re.Pattern = re.compile(r'^\s*(!)?\s*([^=!<>\s]+)\s*(?:(==|!=|<=|>=|<|>)\s*(.+?))?\s*$', re.DOTALL)
+""" The regular expression pattern used to parse filter expressions into a field, an operator, and a literal value. """
+
+
+class QueryCacheInfo(NamedTuple):
+    """ This class provides a data object to represent the statistics of the compiled Query cache. """
+
+    hits: int
+    """ The number of compilations that were served from the cache. """
+
+    misses: int
+    """ The number of compilations that required parsing the query. """
+
+    maxsize: int
+    """ The maximum number of compiled Query objects retained in the cache. """
+
+    currsize: int
+    """ The current number of compiled Query objects retained in the cache. """
+
+
+class Wildcard:
+    """ This class provides a query path component that matches the keys of dictionaries and the positions of lists
+    and tuples by a glob pattern, where * matches any run of characters and ? matches any single character. The **
+    pattern is recursive, matching any number of nested path components, including none. """
+
+    __slots__ = ('_pattern', '_regex', '_recursive')
+
+    _pattern: str
+    """ The glob pattern of the component. """
+
+    _regex: Union[re.Pattern, None]
+    """ The compiled pattern that keys are matched against, or None if every key matches. """
+
+    _recursive: bool
+    """ Whether the component matches any number of nested path components. """
+
+    @property
+    def pattern(self) -> str:
+        """ Returns the glob pattern of the component. """
+        return self._pattern
+
+    @property
+    def recursive(self) -> bool:
+        """ Returns whether the component matches any number of nested path components. """
+        return self._recursive
+
+    def __init__(self, pattern: str):
+        """ Initializes a new Wildcard object for the given glob pattern. """
+        self._pattern = pattern
+        self._recursive = pattern == RECURSIVE_WILDCARD
+        self._regex = None
+
+        if not self._recursive and pattern.strip('*'):
+            translated = ''.join('.*' if c == '*' else '.' if c == '?' else re.escape(c) for c in pattern)
+            self._regex = re.compile(translated, re.DOTALL)
+
+    def __eq__(self, other: any) -> bool:
+        if isinstance(other, Wildcard):
+            return self._pattern == other._pattern
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((Wildcard, self._pattern))
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} {self._pattern!r}>'
+
+    def __str__(self) -> str:
+        return self._pattern
+
+    def matches(self, key: any) -> bool:
+        """ Returns whether the given dictionary key or list position matches the pattern. """
+        return self._regex is None or self._regex.fullmatch(str(key)) is not None
+
+
+class Filter:
+    """ This class provides a query path component that matches the items of lists, tuples and dictionaries for which
+    a predicate holds. Predicates are compiled once from an expression, which is either a field to test for existence,
+    optionally negated with !, or a field compared with a literal value using ==, !=, <, <=, > or >=. Fields are paths
+    relative to each item, where @ refers to the item itself, and literal values are quoted strings, numbers, true,
+    false or null. """
+
+    __slots__ = ('_expression', '_field', '_operator', '_value', '_negated')
+
+    _expression: str
+    """ The expression that the predicate was compiled from. """
+
+    _field: list
+    """ The path components of the tested field, relative to each item. """
+
+    _operator: Union[str, None]
+    """ The comparison operator, or None if the predicate tests the existence of the field. """
+
+    _value: any
+    """ The literal value that the field is compared with. """
+
+    _negated: bool
+    """ Whether the predicate tests for the absence of the field. """
+
+    OPERATORS: dict = {
+        '==': lambda a, b: a == b,
+        '!=': lambda a, b: a != b,
+        '<': lambda a, b: a < b,
+        '<=': lambda a, b: a <= b,
+        '>': lambda a, b: a > b,
+        '>=': lambda a, b: a >= b,
+    }
+    """ The comparison functions of the supported operators. """
+
+    LITERALS: dict = {'true': True, 'false': False, 'null': None}
+    """ The values of the supported keyword literals. """
+
+    @property
+    def expression(self) -> str:
+        """ Returns the expression that the predicate was compiled from. """
+        return self._expression
+
+    @property
+    def field(self) -> list:
+        """ Returns the path components of the tested field, relative to each item. """
+        return self._field
+
+    @property
+    def operator(self) -> Union[str, None]:
+        """ Returns the comparison operator, or None if the predicate tests the existence of the field. """
+        return self._operator
+
+    @property
+    def value(self) -> any:
+        """ Returns the literal value that the field is compared with. """
+        return self._value
+
+    def __init__(self, expression: str, delimiter: Union[str, None] = None):
+        """ Initializes a new Filter object by compiling the given expression. """
+        from reflective.exceptions import RQuerySyntaxError
+
+        match = PREDICATE_PATTERN.fullmatch(expression)
+
+        if match is None or match.group(1) and match.group(3):
+            raise RQuerySyntaxError(f'Invalid filter expression: [?{expression}]')
+
+        negated, field, operator, value = match.groups()
+        delimiter = delimiter if delimiter is not None else DEFAULT_DELIMITER
+
+        self._expression = expression
+        self._negated = negated is not None
+        self._operator = operator
+        self._value = Filter.literal(value, expression) if operator is not None else None
+        self._field = [] if field == '@' else [
+            int(component) if component.replace('-', '').isdigit() else component
+            for component in field.strip(delimiter).split(delimiter)
+        ]
+
+    def __eq__(self, other: any) -> bool:
+        if isinstance(other, Filter):
+            return self._expression == other._expression
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((Filter, self._expression))
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} {self._expression!r}>'
+
+    def __str__(self) -> str:
+        return f'[?{self._expression}]'
+
+    def matches(self, item: any, path: list, resolve: Union[Callable, None] = None) -> bool:
+        """ Returns whether the predicate holds for the given unparsed item at the given path. Only the tested field is
+        resolved, using the given resolve function, which is called with the unparsed field value and its path. """
+        from functools import reduce
+
+        try:
+            value = reduce(lambda c, k: c[k], self._field, item)
+        except (KeyError, IndexError, TypeError):
+            return self._negated
+
+        if self._operator is None:
+            return not self._negated
+
+        if resolve is not None and isinstance(value, str) and '$' in value:
+            value = resolve(value, path + self._field)
+
+        try:
+            return Filter.OPERATORS[self._operator](value, self._value)
+        except TypeError:
+            # Values of incomparable types never match ordering comparisons
+            return False
+
+    @staticmethod
+    def literal(text: str, expression: str) -> any:
+        """ Returns the value of the given literal text of the given filter expression. """
+        from reflective.exceptions import RQuerySyntaxError
+
+        if len(text) > 1 and text[0] == text[-1] and text[0] in '\'"':
+            return text[1:-1]
+
+        if text in Filter.LITERALS:
+            return Filter.LITERALS[text]
+
+        for cast in (int, float):
+            try:
+                return cast(text)
+            except ValueError:
+                pass
+
+        raise RQuerySyntaxError(f'Invalid literal value "{text}" in filter expression: [?{expression}]')
+
 
 class Query:
     """ This class provides a data object to represent arbitrary queries to Reflective instances. """
@@ -30,6 +258,9 @@ class Query:
     _is_relative: bool
     """ Whether the query is relative to the current context. """
 
+    _is_wildcard: bool
+    """ Whether the query contains wildcard or filter path components. """
+
     @property
     def query(self) -> any:
         """ Returns the raw query value that the Query object represents. """
@@ -60,15 +291,20 @@ class Query:
         """ Returns whether the query is relative to the current context. """
         return self._is_relative
 
+    @property
+    def is_wildcard(self) -> bool:
+        """ Returns whether the query contains wildcard or filter path components, which may match any number of values.
+        """
+        return self._is_wildcard
+
     def __init__(self, query: Union[str, int, slice], delimiter: Union[str, None] = None):
         """ Initializes a new Query object, optionally with a delimiter override. """
-        import re
-
         self._query = query
         self._query_type = type(query)
         self._delimiter = delimiter if delimiter is not None else DEFAULT_DELIMITER
         self._is_path = False
         self._is_relative = True
+        self._is_wildcard = False
         self._path = []
 
         if self._query_type in [slice, int]:
@@ -89,18 +325,23 @@ class Query:
                 self._is_path = True
 
             # Break down the query into path components
-            self._path = self._query.split(self._delimiter)
+            self._path = Query.split(self._query, self._delimiter)
 
             # Analyze and possibly convert the path components into their appropriate types
             for i, component in enumerate(self._path):
 
+                # Filter components are already compiled
+                if isinstance(component, Filter):
+                    self._is_wildcard = True
+                    continue
+
                 # Convert numerical references to integers
                 if component.replace('-', '').isdigit():
                     self._path[i] = int(component)
                     continue
 
                 # Convert slice references to slice objects
-                slice_match = re.fullmatch(r'^(-?[0-9]+)?:(-?[0-9]+)?(?::(-?[0-9]+)?)?$', component)
+                slice_match = SLICE_PATTERN.fullmatch(component)
 
                 if slice_match is not None:
                     start = slice_match.group(1)
@@ -119,10 +360,95 @@ class Query:
                     self._path[i] = slice(start, stop, step)
                     continue
 
+                # Convert glob patterns to wildcard components
+                if any(c in component for c in WILDCARD_CHARACTERS):
+                    self._path[i] = Wildcard(component)
+                    self._is_wildcard = True
+
     def __str__(self):
         """ Returns the string representation of the Query object. """
         return str(self._query)
 
+    @staticmethod
+    def split(query: str, delimiter: str) -> list:
+        """ Splits the given query string into path components, where delimiters within filter expressions don't
+        separate components, and filter expressions are compiled into Filter components. A filter expression directly
+        following a key, such as hosts[?name=='a'], filters the value of that key. """
+        if '[?' not in query:
+            return query.split(delimiter)
+
+        components: list = []
+        current: str = ''
+        depth: int = 0
+        quote: Union[str, None] = None
+        i: int = 0
+
+        while i < len(query):
+            c = query[i]
+
+            if quote is not None:
+                quote = None if c == quote else quote
+            elif depth and c in '\'"':
+                quote = c
+            elif query.startswith('[?', i):
+                depth += 1
+            elif c == ']' and depth:
+                depth -= 1
+            elif not depth and query.startswith(delimiter, i):
+                components.append(current)
+                current = ''
+                i += len(delimiter)
+                continue
+
+            current += c
+            i += 1
+
+        components.append(current)
+        path: list = []
+
+        for component in components:
+            match = FILTER_PATTERN.fullmatch(component)
+
+            if match is None:
+                path.append(component)
+                continue
+
+            if match.group(1):
+                path.append(match.group(1))
+
+            path.append(Filter(match.group(2), delimiter))
+
+        return path
+
+    @classmethod
+    def compile(cls, query: Union[str, int, slice, 'Query'], delimiter: Union[str, None] = None) -> 'Query':
+        """ Returns a Query object for the given query, reusing a previously compiled Query object for string queries.
+        Compiled Query objects are shared, so their path components must not be modified. """
+        if isinstance(query, Query):
+            return query
+
+        if type(query) is not str:
+            return cls(query, delimiter)
+
+        return _compile(query, delimiter)
+
+    @staticmethod
+    def cache_info() -> QueryCacheInfo:
+        """ Returns the statistics of the compiled Query cache. """
+        return QueryCacheInfo(*_compile.cache_info())
+
+    @staticmethod
+    def cache_clear() -> None:
+        """ Removes all compiled Query objects from the cache and resets the cache statistics. """
+        _compile.cache_clear()
+
+    @staticmethod
+    def cache_resize(size: int) -> None:
+        """ Sets the maximum number of compiled Query objects retained in the cache. The cache is replaced by a new
+        cache of the given size, so the compiled Query objects and statistics of the previous cache are discarded. """
+        global _compile
+        _compile = lru_cache(maxsize=size)(_compile.__wrapped__)
+
 
 class QueryResult(UserList):
     """ This class provides a data object to represent the result of a query. It inherently mimics the behavior of
@@ -131,15 +457,90 @@ class QueryResult(UserList):
     _query: Query
     """ The query that was executed. """
 
+    _data: list
+    """ The results that have been produced so far. """
+
+    _source: Union[Iterator, None]
+    """ The iterator producing the remaining results of a lazy result, or None once every result has been produced. """
+
+    _length: Union[int, None]
+    """ The total number of results of a lazy result if it is known in advance, or None otherwise. """
+
     @property
     def query(self) -> Query:
         """ Returns the query that was executed. """
         return self._query
 
-    def __init__(self, query: Query, data: list):
-        """ Initializes a new QueryResult object. """
+    @property
+    def data(self) -> list:
+        """ Returns the list of results, producing any remaining results of a lazy result first. """
+        if self._source is not None:
+            self._data.extend(self._source)
+            self._source = None
+        return self._data
+
+    @data.setter
+    def data(self, value: list) -> None:
+        """ Sets the list of results. """
+        self._data = value
+        self._source = None
+
+    @property
+    def is_lazy(self) -> bool:
+        """ Returns whether some results haven't been produced yet. """
+        return self._source is not None
+
+    def __init__(self, query: Query, data: Union[list, None] = None, source: Union[Iterator, None] = None,
+                 length: Union[int, None] = None):
+        """ Initializes a new QueryResult object with the given results. If a source iterator is given, the result is
+        lazy, and the results it produces are appended to the given results as they are first read. If the total
+        number of results is known in advance, it is given as the length, so that it can be read without producing the
+        results. """
         self._query = query
         super().__init__(data)
+        self._source = source
+        self._length = length
+
+    def __len__(self) -> int:
+        if self._source is not None and self._length is not None:
+            return self._length
+        return len(self.data)
+
+    def __iter__(self):
+        i = 0
+
+        while True:
+            if i < len(self._data):
+                yield self._data[i]
+                i += 1
+            elif not self.fetch(1):
+                return
+
+    def __getitem__(self, i: Union[int, slice]) -> any:
+        if isinstance(i, slice):
+            return QueryResult(self._query, self.data[i])
+        if i >= 0 and self._source is not None:
+            self.fetch(i + 1 - len(self._data))
+            return self._data[i]
+        return self.data[i]
+
+    def __bool__(self) -> bool:
+        if self._source is not None and self._length is not None:
+            return self._length > 0
+        return bool(self._data) or self.fetch(1) > 0
+
+    def fetch(self, count: int) -> int:
+        """ Produces up to the given number of remaining results of a lazy result, returning the number produced. """
+        produced = 0
+
+        while self._source is not None and produced < count:
+            try:
+                self._data.append(next(self._source))
+                produced += 1
+            except StopIteration:
+                self._source = None
+
+        return produced
 
 
 class QueryManager:
@@ -178,23 +579,31 @@ class QueryManager:
 
     def __call__(self, query: Union[str, int, slice, Query], use_cache: bool = False) -> QueryResult:
         """ Executes a query on the bound Reflective instance. """
+        from reflective.stats import StatsManager
+
+        if StatsManager.active and self.core.stats.enabled:
+            return self.core.stats.measure('query', self.query, query, use_cache)
         return self.query(query, use_cache)
 
     def query(self, query: Union[str, int, slice, Query], use_cache: bool = False) -> QueryResult:
         """ Executes a query on the bound Reflective instance. """
         from functools import reduce
+        from reflective.stats import StatsManager
         from reflective.types import Reflective, RString
 
         # Convert the query to a Query object if it isn't already
-        if type(query) is not Query:
-            query = Query(query)
+        query = Query.compile(query)
 
         cache_key = self.build_cache_key(query)
+        stats = self.core.stats if StatsManager.active else None
 
         # If caching is enabled, check if the query is already cached assuming it doesn't end with a slice type
-        if use_cache and not type(query.path[-1]) is slice:
-            if cache_key in self.cache:
-                return self.cache[cache_key]
+        if use_cache and not type(query.path[-1]) is slice and not query.is_wildcard:
+            qr = self.cache.get(cache_key)
+            if stats is not None and stats.enabled:
+                stats.count('cache_miss' if qr is None else 'cache_hit')
+            if qr is not None:
+                return qr
 
         if query.type is slice and isinstance(self.context.ref, str):
             return QueryResult(query, [self.context.ref[query.query]])
@@ -203,50 +612,257 @@ class QueryManager:
         ref: Union['Reflective', None] = None
         found: bool = True
         context = self.core.root().context
-        root = context.raw
 
+        # Relative queries start from the value of this context, which doesn't require traversal from the root
         if query.is_relative and len(self.core.path):
-            root = reduce(lambda c, k: c[k], self.core.path, root)
+            root = self.context.raw
+        else:
+            root = context.raw
+
+        if stats is not None and stats.enabled:
+            stats.count('traverse')
+
+        # Wildcard queries are matched lazily, as their results are read
+        if query.is_wildcard:
+            prefix = self.core.path if query.is_relative else []
+            lookup = self.lookup if len(self.core.indexes) else None
+            walk = self.walk(query.path, root, prefix, lambda value, path: context.parse(value, path=path), lookup)
+            return QueryResult(query, source=(context.get(path) for path in walk))
 
         try:
-            # Reduce the reference based on the query path components.
-            ref = reduce(lambda c, k: c[k], query.path, root)
+            # Reduce the reference based on the query path components, leaving the container of the last component
+            container = reduce(lambda c, k: c[k], query.path[:-1], root)
+            # List slices are produced lazily from their container, so the sliced items aren't copied
+            if type(query.path[-1]) is slice and isinstance(container, list):
+                ref = container
+            else:
+                ref = container[query.path[-1]]
         except (KeyError, TypeError):
             # Could not find a matching reference
             found = False
 
         if found:
+            path = self.core.path + query.path if query.is_relative else query.path
             if type(query.path[-1]) is slice and isinstance(ref, list):
-                for item in ref:
-                    results.append(item)
-            else:
-                path = self.core.path + query.path if query.is_relative else query.path
-                lookup = context.get(path)
-                results.append(lookup)
+                qr = self.slice_result(query, container, path)
+                if use_cache:
+                    self.cache[cache_key] = qr
+                return qr
+            lookup = context.get(path)
+            results.append(lookup)
 
         if use_cache:
-            self.cache[cache_key] = QueryResult(query, results)
-            return self.cache[cache_key]
+            qr = QueryResult(query, results)
+            self.cache[cache_key] = qr
+            return qr
 
         return QueryResult(query, results)
 
-    def build_cache_key(self, query: Union[str, int, slice, Query]) -> str:
+    def slice_result(self, query: Query, container: list, path: list) -> QueryResult:
+        """ Returns a lazy QueryResult of the items of the given unparsed list selected by the slice ending the given
+        absolute path. Its length is known from the slice, and the instance of each item is only created when the item
+        is first read. """
+        context = self.core.root().context
+        positions = range(len(container))[path[-1]]
+        prefix = path[:-1]
+        return QueryResult(query, source=(context.get(prefix + [i]) for i in positions), length=len(positions))
+
+    def query_many(self, queries: list) -> list:
+        """ Executes the given queries on the bound Reflective instance in a single pass, returning a QueryResult for
+        each query in the same order. The requested paths are arranged in a prefix tree, so every container shared by
+        several paths is only looked up once. """
+        from reflective.core import RCore
+        from reflective.stats import StatsManager
+
+        context = self.core.root().context
+        compiled: list = [Query.compile(query) for query in queries]
+        results: list = [None] * len(compiled)
+
+        # Each prefix tree node holds the path component leading to it, its children, and the queries ending at it
+        tree: dict = {'children': {}, 'targets': []}
+
+        for i, query in enumerate(compiled):
+            if query.is_wildcard or query.type is slice and isinstance(self.context.ref, str):
+                results[i] = self.query(query)
+                continue
+
+            path = self.core.path + query.path if query.is_relative else query.path
+            node = tree
+
+            for component, key in zip(path, RCore.path_key(path)):
+                if key not in node['children']:
+                    node['children'][key] = {'component': component, 'children': {}, 'targets': []}
+                node = node['children'][key]
+
+            node['targets'].append((i, path))
+
+        if StatsManager.active and self.core.stats.enabled:
+            self.core.stats.count('traverse')
+
+        # Slices of lists and tuples are held as their sequence and the positions they select, so the sliced items
+        # aren't copied
+        stack: list = [(tree, context.raw, None)]
+
+        while stack:
+            node, value, positions = stack.pop()
+
+            for i, path in node['targets']:
+                if positions is not None and isinstance(value, list):
+                    results[i] = self.slice_result(compiled[i], value, path)
+                else:
+                    results[i] = QueryResult(compiled[i], [context.get(path)])
+
+            sliced = None
+
+            for child in node['children'].values():
+                component = child['component']
+                try:
+                    if positions is not None and type(component) is int:
+                        stack.append((child, value[positions[component]], None))
+                        continue
+                    if positions is not None:
+                        # Other components below a slice are applied to the sliced items, which are only copied here
+                        if sliced is None:
+                            sliced = value[node['component']]
+                        parent = sliced
+                    else:
+                        parent = value
+                    if type(component) is slice and isinstance(parent, (list, tuple)):
+                        stack.append((child, parent, range(*component.indices(len(parent)))))
+                    else:
+                        stack.append((child, parent[component], None))
+                except (KeyError, TypeError):
+                    # Could not find a matching reference for any of the paths below the child
+                    self.mark_missing(child, compiled, results)
+
+        return results
+
+    def lookup(self, items: any, path: list, predicate: Filter) -> Union[list, None]:
+        """ Returns the positions of the given unparsed items at the given path that may match the given filter
+        predicate, in ascending order, or None if no index applies to the predicate. """
+        from reflective.core import RCore
+
+        if predicate.operator != '==' or not isinstance(items, (list, tuple)):
+            return None
+
+        index = self.core.indexes.get(RCore.path_key(path), RCore.path_key(predicate.field), items)
+
+        if index is None:
+            return None
+
+        return index.lookup(predicate.value)
+
+    @staticmethod
+    def walk(path: list, root: any, prefix: list, resolve: Union[Callable, None] = None,
+             lookup: Union[Callable, None] = None) -> Iterator[list]:
+        """ Yields the absolute path components of every value matching the given query path components, starting from
+        the given root value at the given path. The items of each value are visited depth first, in document order, but
+        a recursive component first matches the rest of the path at a value itself before matching it below any of its
+        items, so matches nearer that value come first. Only the branches that can still match are visited, and the
+        walk is streamed, holding a single pending iterator for each level of nesting. Filter components test
+        the unparsed items, resolving the fields they compare with the given resolve function, and only test the
+        candidate positions returned by the given lookup function unless it returns None. """
+        length: int = len(path)
+
+        # Several recursive components can match the same value by different routes
+        seen: Union[set, None] = set() if sum(isinstance(c, Wildcard) and c.recursive for c in path) > 1 else None
+
+        def items(value: any) -> Iterator[tuple]:
+            if isinstance(value, dict):
+                return iter(value.items())
+            if isinstance(value, (list, tuple)):
+                return enumerate(value)
+            return iter(())
+
+        # The pending states of each level are produced by generator functions, binding their arguments immediately
+        def descend(value: any, location: list, i: int) -> Iterator[tuple]:
+            yield value, location, i + 1
+            for k, v in items(value):
+                yield v, location + [k], i
+
+        def match(value: any, location: list, i: int, wildcard: Wildcard) -> Iterator[tuple]:
+            for k, v in items(value):
+                if wildcard.matches(k):
+                    yield v, location + [k], i + 1
+
+        def select(value: any, location: list, i: int, positions: range) -> Iterator[tuple]:
+            for k in positions:
+                yield value[k], location + [k], i + 1
+
+        def accept(value: any, location: list, i: int, predicate: Filter) -> Iterator[tuple]:
+            positions = lookup(value, location, predicate) if lookup is not None else None
+            candidates = items(value) if positions is None else ((k, value[k]) for k in positions)
+            for k, v in candidates:
+                if predicate.matches(v, location + [k], resolve):
+                    yield v, location + [k], i + 1
+
+        stack: list = [iter([(root, list(prefix), 0)])]
+
+        while stack:
+            state = next(stack[-1], None)
+
+            if state is None:
+                stack.pop()
+                continue
+
+            value, location, i = state
+
+            if i == length:
+                if seen is not None:
+                    key = tuple(location)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                yield location
+                continue
+
+            component = path[i]
+
+            if isinstance(component, Wildcard):
+                if component.recursive:
+                    # Match no components at this value, then continue matching recursively below every item
+                    stack.append(descend(value, location, i))
+                else:
+                    stack.append(match(value, location, i, component))
+
+            elif isinstance(component, Filter):
+                stack.append(accept(value, location, i, component))
+
+            elif type(component) is slice:
+                if isinstance(value, (list, tuple)):
+                    stack.append(select(value, location, i, range(len(value))[component]))
+
+            else:
+                try:
+                    stack.append(iter([(value[component], location + [component], i + 1)]))
+                except (KeyError, IndexError, TypeError):
+                    # Could not find a matching reference, so nothing below it can match
+                    continue
+
+    @staticmethod
+    def mark_missing(node: dict, compiled: list, results: list) -> None:
+        """ Records an empty QueryResult for every query ending at or below the given prefix tree node. """
+        stack: list = [node]
+
+        while stack:
+            node = stack.pop()
+            for i, _ in node['targets']:
+                results[i] = QueryResult(compiled[i], [])
+            stack.extend(node['children'].values())
+
+    def build_cache_key(self, query: Union[str, int, slice, Query]) -> tuple:
         """ Builds a cache key for the given query. """
 
         # Convert the query to a Query object if it isn't already
-        if type(query) is not Query:
-            query = Query(query)
+        query = Query.compile(query)
 
-        path = query.path.copy() if query.is_relative else self.context.path + query.path
+        path = self.context.path + query.path if query.is_relative else query.path
 
-        for i, component in enumerate(path):
-            if type(component) is slice:
-                start = component.start if component.start is not None else ''
-                stop = component.stop if component.stop is not None else ''
-                step = component.step if component.step is not None else ''
-                path[i] = f'{start}:{stop}:{step}'
+        return self.core.path_key(path) + (QUERY_CACHE_MARKER,)
 
-        # Build the cache key base
-        source = self.delimiter.join(str(c) for c in path)
 
-        return self.core.hash_value(source)
+@lru_cache(maxsize=QUERY_CACHE_SIZE)
+def _compile(query: str, delimiter: Union[str, None]) -> Query:
+    """ Returns a new Query object for the given string query. Calls are memoized by the least recently used cache
+    behind Query.compile. """
+    return Query(query, delimiter)
@@ -0,0 +1,283 @@
+from __future__ import annotations
+from contextlib import contextmanager
+from typing import Union
+
+MAX_RESOLUTION_DEPTH: int = 64
+""" The default maximum number of nested reference resolutions. """
+
+
+class ResolutionFrame:
+    """ This class provides the state of a single reference resolution in progress. """
+
+    __slots__ = ('key', 'dependencies', 'volatile', 'value')
+
+    key: Union[tuple, None]
+    """ The path components of the value being resolved, or None if the value has no known path. """
+
+    dependencies: set
+    """ The paths of the source values that the resolved value depends on. """
+
+    volatile: bool
+    """ Whether the resolved value depends on a source that can't be tracked, such as an environment variable. """
+
+    value: any
+    """ The resolved value. """
+
+    def __init__(self, key: Union[tuple, None]):
+        """ Initializes a new ResolutionFrame object for the given value path. """
+        self.key = key
+        self.dependencies = set()
+        self.volatile = False
+        self.value = None
+
+
+class ResolutionManager:
+    """ This class provides memoization of resolved Reflective reference values, keyed by the path of the referencing
+    value. Each resolved value records the source paths it depends on so that it can be invalidated when any of those
+    sources are modified. """
+
+    _core: 'RCore'
+    """ The parent RCore instance of this instance. """
+
+    _values: 'PathTrie'
+    """ The memoized resolved values, keyed by the path components of the referencing value. """
+
+    _dependencies: dict
+    """ The source paths that each memoized value depends on, keyed by the path components of the referencing value. """
+
+    _dependents: 'PathTrie'
+    """ The paths of the memoized values that depend on each source path, keyed by the source path components. """
+
+    _stack: list
+    """ The stack of resolutions currently in progress. """
+
+    _active: set
+    """ The paths of the values on the stack of resolutions in progress, so that cycles can be detected in constant time.
+    """
+
+    _max_depth: Union[int, None]
+    """ The maximum number of nested resolutions, or None for no limit. """
+
+    _snapshot: any
+    """ The fully resolved plain copy of the root value produced by the last pre-resolution, or None if there hasn't
+    been one since the root value was last modified. """
+
+    _graph: Union['DependencyGraph', None]
+    """ The dependency graph of the root value, or None if it hasn't been built since the root value was last modified.
+    """
+
+    _templates: dict
+    """ The templates compiled ahead of time for the strings of the root value, such as those loaded from a snapshot,
+    keyed by source string. """
+
+    @property
+    def core(self) -> 'RCore':
+        """ Returns the parent RCore instance of this instance. """
+        return self._core
+
+    @property
+    def max_depth(self) -> Union[int, None]:
+        """ Returns the maximum number of nested resolutions, or None for no limit. """
+        return self._max_depth
+
+    @max_depth.setter
+    def max_depth(self, value: Union[int, None]) -> None:
+        """ Sets the maximum number of nested resolutions, or None for no limit. """
+        self._max_depth = value
+
+    @property
+    def snapshot(self) -> any:
+        """ Returns the fully resolved plain copy of the root value produced by the last pre-resolution, or None if there
+        hasn't been one since the root value was last modified. """
+        return self._snapshot
+
+    @snapshot.setter
+    def snapshot(self, value: any) -> None:
+        """ Sets the fully resolved plain copy of the root value produced by a pre-resolution. """
+        self._snapshot = value
+
+    @property
+    def graph(self) -> Union['DependencyGraph', None]:
+        """ Returns the dependency graph of the root value, or None if it hasn't been built since the root value was last
+        modified. """
+        return self._graph
+
+    @graph.setter
+    def graph(self, value: Union['DependencyGraph', None]) -> None:
+        """ Sets the dependency graph of the root value. """
+        self._graph = value
+
+    @property
+    def templates(self) -> dict:
+        """ Returns the templates compiled ahead of time for the strings of the root value, keyed by source string. """
+        return self._templates
+
+    @templates.setter
+    def templates(self, value: dict) -> None:
+        """ Sets the templates compiled ahead of time for the strings of the root value, keyed by source string. These
+        are used instead of compiling the strings, and are kept when memoized values are invalidated. """
+        self._templates = value
+
+    @property
+    def depth(self) -> int:
+        """ Returns the number of resolutions currently in progress. """
+        return len(self._stack)
+
+    def __init__(self, core: 'RCore', max_depth: Union[int, None] = MAX_RESOLUTION_DEPTH):
+        """ Initializes a new ResolutionManager object associated with the given core. """
+        from reflective.trie import PathTrie
+        self._core = core
+        self._values = PathTrie()
+        self._dependencies = {}
+        self._dependents = PathTrie()
+        self._stack = []
+        self._active = set()
+        self._max_depth = max_depth
+        self._snapshot = None
+        self._graph = None
+        self._templates = {}
+
+    def __contains__(self, key: tuple) -> bool:
+        return key in self._values
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def entries(self) -> list:
+        """ Returns the path components, memoized value and dependencies of every memoized value. """
+        return [(key, value, self._dependencies[key]) for key, value in self._values.subtree(())]
+
+    def recall(self, key: tuple) -> any:
+        """ Returns the memoized value for the given path, recording its dependencies against any resolution in
+        progress. """
+        if self._stack:
+            frame = self._stack[-1]
+            frame.dependencies.add(key)
+            frame.dependencies.update(self._dependencies[key])
+        return self._values[key]
+
+    @contextmanager
+    def resolving(self, key: Union[tuple, None]):
+        """ Tracks the resolution of the value at the given path, memoizing the value assigned to the yielded frame
+        once the resolution completes successfully. An exception is raised if the value is already being resolved, which
+        means that it references itself, or if the maximum resolution depth would be exceeded. """
+        from reflective.exceptions import RCircularReference, RResolutionDepthExceeded
+
+        if key is not None and key in self._active:
+            cycle = self.cycle(key)
+            raise RCircularReference(f'Circular reference detected: {" -> ".join(cycle)}', cycle)
+
+        if self._max_depth is not None and len(self._stack) >= self._max_depth:
+            raise RResolutionDepthExceeded(f'The maximum resolution depth of {self._max_depth} was exceeded while '
+                                           f'resolving {self.format(key)}')
+
+        frame = ResolutionFrame(key)
+        self._stack.append(frame)
+
+        if key is not None:
+            self._active.add(key)
+
+        try:
+            yield frame
+        finally:
+            self._stack.pop()
+
+            if key is not None:
+                self._active.discard(key)
+
+            # Nested resolutions are dependencies of the resolution that triggered them
+            if self._stack:
+                parent = self._stack[-1]
+                parent.dependencies.update(frame.dependencies)
+                parent.volatile = parent.volatile or frame.volatile
+
+        if key is not None and not frame.volatile:
+            self.store(key, frame.value, frame.dependencies)
+
+    def cycle(self, key: tuple) -> list:
+        """ Returns the formatted paths of the values that form a cycle of references back to the given path, which must
+        be on the stack of resolutions in progress. """
+        keys: list = [frame.key for frame in self._stack]
+        start = keys.index(key)
+        return [self.format(k) for k in keys[start:] if k is not None] + [self.format(key)]
+
+    def format(self, key: Union[tuple, None]) -> str:
+        """ Returns the given path components formatted as an absolute query path. """
+        if key is None:
+            return '<unknown>'
+        delimiter = self.core.delimiter
+        return delimiter + delimiter.join(str(component) for component in key)
+
+    def depend(self, path: list) -> None:
+        """ Records the given source path as a dependency of the resolution in progress. """
+        from reflective.query import Filter, Wildcard
+
+        if not self._stack:
+            return
+
+        key: list = []
+
+        # Slices, wildcards and filters can't be tracked individually, so the dependency is recorded against their
+        # container
+        for component in path:
+            if type(component) is slice or isinstance(component, (Wildcard, Filter)):
+                break
+            key.append(component)
+
+        self._stack[-1].dependencies.add(tuple(key))
+
+    def volatile(self) -> None:
+        """ Marks the resolution in progress as depending on a source that can't be tracked. """
+        if self._stack:
+            self._stack[-1].volatile = True
+
+    def store(self, key: tuple, value: any, dependencies: set) -> None:
+        """ Memoizes the given resolved value for the given path, along with the source paths it depends on. """
+        self.discard(key)
+        self._values[key] = value
+        self._dependencies[key] = frozenset(dependencies)
+        for dependency in dependencies:
+            if dependency not in self._dependents:
+                self._dependents[dependency] = set()
+            self._dependents[dependency].add(key)
+
+    def discard(self, key: tuple) -> None:
+        """ Removes the memoized value for the given path, if any. """
+        if key not in self._values:
+            return
+
+        del self._values[key]
+
+        for dependency in self._dependencies.pop(key):
+            dependents = self._dependents.get(dependency)
+            if dependents is None:
+                continue
+            dependents.discard(key)
+            if not dependents:
+                del self._dependents[dependency]
+
+    def invalidate(self, path: Union[list, tuple] = ()) -> None:
+        """ Removes the memoized values at or below the given path, as well as every memoized value that depends on a
+        source at, above, or below the given path. """
+        path = self.core.path_key(path)
+        self._snapshot = None
+        self._graph = None
+        affected: set = set(key for key, _ in self._values.subtree(path))
+
+        for _, dependents in self._dependents.prefixes(path):
+            affected.update(dependents)
+
+        for _, dependents in self._dependents.subtree(path):
+            affected.update(dependents)
+
+        for key in affected:
+            self.discard(key)
+
+    def clear(self) -> None:
+        """ Removes all memoized values. """
+        from reflective.trie import PathTrie
+        self._values = PathTrie()
+        self._dependencies = {}
+        self._dependents = PathTrie()
+        self._snapshot = None
+        self._graph = None
@@ -0,0 +1,293 @@
+from __future__ import annotations
+import struct
+import sys
+from typing import Union
+
+SNAPSHOT_MAGIC: bytes = b'RSNP'
+""" The bytes that every snapshot starts with. """
+
+SNAPSHOT_VERSION: int = 1
+""" The version of the snapshot format written by this module. """
+
+FLOAT: struct.Struct = struct.Struct('>d')
+""" The packing of float values, and of each part of complex values. """
+
+
+class SnapshotWriter:
+    """ This class provides the encoding of a value into the compact binary snapshot format. Strings are stored once in
+    a table and referred to by position, so repeated keys and values cost a few bytes each, and every string containing
+    references is stored along with its compiled template, so loading a snapshot never scans strings for references.
+    The dependency graph of the references and the plain resolved values memoized for them are stored as well, so that
+    a loaded value can be resolved without scanning or resolving it again. """
+
+    _strings: dict
+    """ The position of each string in the string table, keyed by string. """
+
+    _templates: dict
+    """ The compiled template of each string containing references, keyed by source string. """
+
+    def __init__(self):
+        """ Initializes a new SnapshotWriter object. """
+        self._strings = {}
+        self._templates = {}
+
+    @staticmethod
+    def varint(value: int) -> bytes:
+        """ Returns the given non-negative integer encoded in seven-bit groups, least significant group first. """
+        data = bytearray()
+
+        while value > 0x7f:
+            data.append(value & 0x7f | 0x80)
+            value >>= 7
+
+        data.append(value)
+
+        return bytes(data)
+
+    def string(self, value: str) -> bytes:
+        """ Returns the position of the given string in the string table, adding it if needed, as a varint. """
+        position = self._strings.get(value)
+
+        if position is None:
+            position = self._strings[value] = len(self._strings)
+
+        return self.varint(position)
+
+    def encode(self, value: any, out: bytearray) -> None:
+        """ Appends the encoding of the given unparsed value to the given buffer. """
+        from reflective.template import Template
+
+        varint = self.varint
+
+        if value is None:
+            out += b'N'
+        elif value is True:
+            out += b'T'
+        elif value is False:
+            out += b'F'
+        elif isinstance(value, str):
+            if '$' in value:
+                if value not in self._templates:
+                    self._templates[value] = Template.compile(value)
+                out += b'R'
+            else:
+                out += b'S'
+            out += self.string(value)
+        elif isinstance(value, int):
+            # Integers of any size are zigzag encoded so that small negative values stay small
+            out += b'I'
+            out += varint(value << 1 if value >= 0 else (-value << 1) - 1)
+        elif isinstance(value, float):
+            out += b'D'
+            out += FLOAT.pack(value)
+        elif isinstance(value, complex):
+            out += b'C'
+            out += FLOAT.pack(value.real)
+            out += FLOAT.pack(value.imag)
+        elif isinstance(value, dict):
+            out += b'{'
+            out += varint(len(value))
+            for k, v in value.items():
+                self.encode(k, out)
+                self.encode(v, out)
+        elif isinstance(value, (list, tuple)):
+            out += b'[' if isinstance(value, list) else b'('
+            out += varint(len(value))
+            for item in value:
+                self.encode(item, out)
+        else:
+            raise TypeError(f'<{self.__class__.__name__}> Values of type {type(value).__name__} can\'t be stored in a '
+                            f'snapshot.')
+
+    def dump(self, value: any, references: Union[dict, None] = None, memos: Union[list, None] = None) -> bytes:
+        """ Returns the snapshot of the given unparsed value, along with the given references of each node of its
+        dependency graph and the given path, value and dependencies of each memoized resolved value. """
+        from reflective.template import Template
+
+        body = bytearray()
+        self.encode(value, body)
+
+        graph = bytearray()
+        references = references or {}
+        graph += self.varint(len(references))
+
+        for key, paths in references.items():
+            self.encode(list(key), graph)
+            graph += self.varint(len(paths))
+            for path in paths:
+                self.encode(list(path), graph)
+
+        memo = bytearray()
+        memos = memos or []
+        memo += self.varint(len(memos))
+
+        for key, resolved, dependencies in memos:
+            self.encode(list(key), memo)
+            self.encode(resolved, memo)
+            memo += self.varint(len(dependencies))
+            for dependency in dependencies:
+                self.encode(list(dependency), memo)
+
+        # Templates refer to strings, so they are encoded before the string table is complete
+        templates = bytearray()
+        templates += self.varint(len(self._templates))
+
+        template: Template
+        for template in self._templates.values():
+            templates += self.string(template.source)
+            templates += self.varint(len(template.segments))
+            for segment in template.segments:
+                templates += self.string(segment)
+            templates += self.varint(len(template.slots))
+            for slot in template.slots:
+                templates += self.string(slot.method)
+                templates += self.string(slot.query)
+                templates += self.string(slot.text)
+
+        strings = bytearray()
+        strings += self.varint(len(self._strings))
+
+        for string in self._strings:
+            data = string.encode('utf-8', 'surrogatepass')
+            strings += self.varint(len(data))
+            strings += data
+
+        return SNAPSHOT_MAGIC + bytes([SNAPSHOT_VERSION]) + strings + templates + body + graph + memo
+
+
+class SnapshotReader:
+    """ This class provides the decoding of a snapshot written by a SnapshotWriter, in a single sequential pass over
+    its bytes. """
+
+    _data: bytes
+    """ The bytes of the snapshot. """
+
+    _position: int
+    """ The position of the next byte to be decoded. """
+
+    _strings: list
+    """ The string table of the snapshot. """
+
+    _templates: dict
+    """ The compiled templates of the snapshot, keyed by source string. """
+
+    @property
+    def templates(self) -> dict:
+        """ Returns the compiled templates of the snapshot, keyed by source string. """
+        return self._templates
+
+    def __init__(self, data: bytes):
+        """ Initializes a new SnapshotReader object for the given snapshot bytes, validating its header. """
+        from reflective.exceptions import RSnapshotError
+
+        if len(data) <= len(SNAPSHOT_MAGIC) or data[:len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC:
+            raise RSnapshotError(f'<{self.__class__.__name__}> The data is not a Reflective snapshot.')
+
+        version = data[len(SNAPSHOT_MAGIC)]
+
+        if version != SNAPSHOT_VERSION:
+            raise RSnapshotError(f'<{self.__class__.__name__}> Snapshots of version {version} are not supported.')
+
+        self._data = data
+        self._position = len(SNAPSHOT_MAGIC) + 1
+        self._strings = []
+        self._templates = {}
+
+    def varint(self) -> int:
+        """ Decodes the next varint. """
+        data = self._data
+        position = self._position
+        byte = data[position]
+        value = byte & 0x7f
+        shift = 7
+
+        while byte & 0x80:
+            position += 1
+            byte = data[position]
+            value |= (byte & 0x7f) << shift
+            shift += 7
+
+        self._position = position + 1
+
+        return value
+
+    def string(self) -> str:
+        """ Decodes the next string table reference. """
+        return self._strings[self.varint()]
+
+    def decode(self) -> any:
+        """ Decodes the next value. """
+        tag = self._data[self._position]
+        self._position += 1
+
+        if tag == 0x53 or tag == 0x52:  # S, R
+            return self.string()
+        if tag == 0x7b:  # {
+            count = self.varint()
+            value: dict = {}
+            for _ in range(count):
+                key = self.decode()
+                value[key] = self.decode()
+            return value
+        if tag == 0x5b:  # [
+            return [self.decode() for _ in range(self.varint())]
+        if tag == 0x28:  # (
+            return tuple([self.decode() for _ in range(self.varint())])
+        if tag == 0x49:  # I
+            value = self.varint()
+            return value >> 1 if not value & 1 else -((value + 1) >> 1)
+        if tag == 0x4e:  # N
+            return None
+        if tag == 0x54:  # T
+            return True
+        if tag == 0x46:  # F
+            return False
+        if tag == 0x44:  # D
+            self._position += FLOAT.size
+            return FLOAT.unpack_from(self._data, self._position - FLOAT.size)[0]
+        if tag == 0x43:  # C
+            self._position += FLOAT.size * 2
+            return complex(FLOAT.unpack_from(self._data, self._position - FLOAT.size * 2)[0],
+                           FLOAT.unpack_from(self._data, self._position - FLOAT.size)[0])
+
+        from reflective.exceptions import RSnapshotError
+        raise RSnapshotError(f'<{self.__class__.__name__}> Unknown value tag {tag!r} at position {self._position - 1}.')
+
+    def load(self) -> tuple:
+        """ Decodes the whole snapshot, returning the unparsed value, the references of each node of the dependency
+        graph, and the path, value and dependencies of each memoized resolved value. """
+        from reflective.exceptions import RSnapshotError
+        from reflective.template import Template, TemplateSlot
+
+        try:
+            data = self._data
+            intern = sys.intern
+
+            for _ in range(self.varint()):
+                size = self.varint()
+                self._strings.append(intern(data[self._position:self._position + size].decode('utf-8', 'surrogatepass')))
+                self._position += size
+
+            for _ in range(self.varint()):
+                source = self.string()
+                segments = tuple([self.string() for _ in range(self.varint())])
+                slots = tuple([TemplateSlot(self.string(), self.string(), self.string()) for _ in range(self.varint())])
+                self._templates[source] = Template(source, segments, slots)
+
+            value = self.decode()
+            references: dict = {}
+
+            for _ in range(self.varint()):
+                key = tuple(self.decode())
+                references[key] = [tuple(self.decode()) for _ in range(self.varint())]
+
+            memos: list = []
+
+            for _ in range(self.varint()):
+                key = tuple(self.decode())
+                resolved = self.decode()
+                memos.append((key, resolved, set(tuple(self.decode()) for _ in range(self.varint()))))
+        except (IndexError, UnicodeDecodeError, struct.error) as error:
+            raise RSnapshotError(f'<{self.__class__.__name__}> The snapshot is truncated or corrupt.') from error
+
+        return value, references, memos
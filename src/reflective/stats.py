@@ -0,0 +1,207 @@
+from __future__ import annotations
+from time import perf_counter
+from typing import Callable, Union
+
+TIMING_BUCKETS: int = 32
+""" The number of power of two microsecond buckets in each timing histogram. """
+
+
+class TimingHistogram:
+    """ This class provides a histogram of the durations recorded for a single event. Durations are counted in buckets
+    with power of two microsecond upper bounds, so recording a duration costs a constant amount of time and memory. """
+
+    __slots__ = ('count', 'total', 'min', 'max', 'buckets')
+
+    count: int
+    """ The number of recorded durations. """
+
+    total: float
+    """ The sum of the recorded durations in seconds. """
+
+    min: Union[float, None]
+    """ The shortest recorded duration in seconds, or None if no durations have been recorded. """
+
+    max: Union[float, None]
+    """ The longest recorded duration in seconds, or None if no durations have been recorded. """
+
+    buckets: list
+    """ The number of recorded durations in each bucket, where bucket i counts durations below 2 ** i microseconds. """
+
+    @property
+    def mean(self) -> Union[float, None]:
+        """ Returns the mean recorded duration in seconds, or None if no durations have been recorded. """
+        return self.total / self.count if self.count else None
+
+    def __init__(self):
+        """ Initializes a new, empty TimingHistogram object. """
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+        self.buckets = [0] * TIMING_BUCKETS
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} count={self.count} mean={self.mean} min={self.min} max={self.max}>'
+
+    def record(self, seconds: float) -> None:
+        """ Records the given duration in seconds. """
+        self.count += 1
+        self.total += seconds
+        self.min = seconds if self.min is None else min(self.min, seconds)
+        self.max = seconds if self.max is None else max(self.max, seconds)
+        self.buckets[min(int(seconds * 1e6).bit_length(), TIMING_BUCKETS - 1)] += 1
+
+    def percentile(self, percent: float) -> Union[float, None]:
+        """ Returns the upper bound in seconds of the bucket containing the given percentile of the recorded durations,
+        or None if no durations have been recorded. """
+        if not self.count:
+            return None
+
+        threshold = self.count * percent / 100
+        seen = 0
+
+        for i, count in enumerate(self.buckets):
+            seen += count
+            if seen >= threshold:
+                return min((2 ** i) / 1e6, self.max)
+
+        return self.max
+
+
+class StatsManager:
+    """ This class provides opt-in instrumentation of a root Reflective instance and its descendents, consisting of
+    event counters, timing histograms and callback hooks. Instrumented code checks the enabled flag before recording
+    anything, and while no instance is enabled at all, instrumented code doesn't even look up its stats manager.
+
+    The recorded events are:
+
+    - parse: A value was parsed for references, including the values nested in parsed containers.
+    - scan: A string was scanned for references because its compiled template wasn't already cached.
+    - resolve: A reference to another value was resolved.
+    - memo_hit: A resolved value was recalled from the resolution memo instead of being resolved again.
+    - cache_hit, cache_miss: An instance or cached query result was, or wasn't, found in the instance cache.
+    - traverse: A value was located by traversing the path to it from the root value.
+    - query, render: A query was executed or a template was rendered. These are also timed.
+    """
+
+    _core: 'RCore'
+    """ The parent RCore instance of this instance. """
+
+    active: int = 0
+    """ The number of StatsManager instances that are enabled. This is checked by instrumented code before it looks up
+    the stats manager of its core. """
+
+    _enabled: bool
+    """ Whether events are recorded. """
+
+    _counters: dict
+    """ The number of times each event has occurred, keyed by event name. """
+
+    _timings: dict
+    """ The timing histogram of each timed event, keyed by event name. """
+
+    _hooks: list
+    """ The callbacks that are called with the event name and duration, if timed, of every recorded event. """
+
+    @property
+    def core(self) -> 'RCore':
+        """ Returns the parent RCore instance of this instance. """
+        return self._core
+
+    @property
+    def enabled(self) -> bool:
+        """ Returns whether events are recorded. """
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        """ Sets whether events are recorded. """
+        value = bool(value)
+        if value is not self._enabled:
+            StatsManager.active += 1 if value else -1
+        self._enabled = value
+
+    @property
+    def counters(self) -> dict:
+        """ Returns a copy of the number of times each event has occurred, keyed by event name. """
+        return dict(self._counters)
+
+    @property
+    def timings(self) -> dict:
+        """ Returns the timing histogram of each timed event, keyed by event name. """
+        return dict(self._timings)
+
+    @property
+    def hooks(self) -> list:
+        """ Returns the callbacks that are called with the event name and duration of every recorded event. """
+        return self._hooks
+
+    def __init__(self, core: 'RCore', enabled: bool = False):
+        """ Initializes a new StatsManager object associated with the given core. """
+        self._core = core
+        self._enabled = False
+        self.enabled = enabled
+        self._counters = {}
+        self._timings = {}
+        self._hooks = []
+
+    def __del__(self):
+        # Instances that are collected while enabled no longer need to be checked by instrumented code
+        if self._enabled:
+            StatsManager.active -= 1
+
+    def __getitem__(self, event: str) -> int:
+        """ Returns the number of times the given event has occurred. """
+        return self._counters.get(event, 0)
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} enabled={self._enabled} counters={self._counters}>'
+
+    def count(self, event: str, count: int = 1) -> None:
+        """ Records the given number of occurrences of the given event. """
+        if not count:
+            return
+
+        self._counters[event] = self._counters.get(event, 0) + count
+
+        for hook in self._hooks:
+            hook(event, None)
+
+    def record(self, event: str, seconds: float) -> None:
+        """ Records a single occurrence of the given event, which took the given duration in seconds. """
+        self._counters[event] = self._counters.get(event, 0) + 1
+
+        timing = self._timings.get(event)
+        if timing is None:
+            timing = self._timings[event] = TimingHistogram()
+        timing.record(seconds)
+
+        for hook in self._hooks:
+            hook(event, seconds)
+
+    def measure(self, event: str, function: Callable, *args, **kwargs) -> any:
+        """ Calls the given function with the given arguments, recording the duration of the call as the given event,
+        and returns the result of the call. """
+        start = perf_counter()
+
+        try:
+            return function(*args, **kwargs)
+        finally:
+            self.record(event, perf_counter() - start)
+
+    def hook(self, callback: Callable[[str, Union[float, None]], None]) -> Callable:
+        """ Registers the given callback to be called with the event name and duration in seconds, or None if the event
+        isn't timed, of every recorded event. The callback is returned so that this can be used as a decorator. """
+        self._hooks.append(callback)
+        return callback
+
+    def unhook(self, callback: Callable) -> None:
+        """ Removes the given callback, if it is registered. """
+        if callback in self._hooks:
+            self._hooks.remove(callback)
+
+    def reset(self) -> None:
+        """ Removes all recorded counters and timings. """
+        self._counters = {}
+        self._timings = {}
+
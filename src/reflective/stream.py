@@ -0,0 +1,928 @@
+from __future__ import annotations
+import codecs
+import json
+import re
+from abc import ABC, abstractmethod
+from typing import IO, Union
+
+STREAM_CHUNK_SIZE: int = 65536
+""" The default number of characters, or bytes for binary files, read from a JSON stream at a time. """
+
+WHITESPACE_PATTERN: re.Pattern = re.compile(r'[ \t\n\r]*')
+""" The regular expression pattern used to skip insignificant whitespace between JSON tokens. """
+
+STRING_BODY_PATTERN: re.Pattern = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL)
+""" The regular expression pattern used to match the characters of a JSON string up to its closing quote, stopping
+before a trailing backslash whose escaped character hasn't been read yet. """
+
+CONTENT_PATTERN: re.Pattern = re.compile(r'[^"{}\[\]]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^"{}\[\]]*)*', re.DOTALL)
+""" The regular expression pattern used to skip the content of a JSON value up to its next container boundary,
+including complete strings, stopping at the opening quote of a string that hasn't been read completely. """
+
+SCALAR_END_PATTERN: re.Pattern = re.compile(r'[ \t\n\r,\]}]')
+""" The regular expression pattern used to find the end of a JSON number or literal. """
+
+
+class JSONReader:
+    """ This class provides an incremental reader of JSON text from a file object. Chunks are only read from the file
+    when the value being read extends beyond the text read so far, and complete values are decoded by the standard
+    library decoder. """
+
+    _fp: IO
+    """ The text or binary file object that JSON text is read from. """
+
+    _chunk_size: int
+    """ The number of characters, or bytes for binary files, read from the file at a time. """
+
+    _decoder: Union[codecs.IncrementalDecoder, None]
+    """ The incremental UTF-8 decoder of binary files, or None once the file is known to be a text file. """
+
+    _buffer: str
+    """ The JSON text that has been read but not yet consumed, preceded by the text consumed since the last chunk was
+    read. """
+
+    _position: int
+    """ The position of the first unconsumed character in the buffer. """
+
+    _eof: bool
+    """ Whether the end of the file has been reached. """
+
+    @property
+    def eof(self) -> bool:
+        """ Returns whether the end of the file has been reached. """
+        return self._eof
+
+    def __init__(self, fp: IO, chunk_size: int = STREAM_CHUNK_SIZE):
+        """ Initializes a new JSONReader object for the given text or binary file object. """
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = ''
+        self._position = 0
+        self._eof = False
+
+    def fill(self) -> bool:
+        """ Appends the next chunk of the file to the unconsumed text of the buffer, discarding the consumed text, and
+        returns False if the end of the file was reached. """
+        if self._eof:
+            return False
+
+        chunk = self._fp.read(self._chunk_size)
+
+        # Chunks ending within a multibyte character may not decode to any text until the next chunk is read
+        while isinstance(chunk, bytes):
+            data = chunk
+            chunk = self._decoder.decode(data, final=not data)
+            if chunk or not data:
+                break
+            chunk = self._fp.read(self._chunk_size)
+
+        if not chunk:
+            self._eof = True
+            return False
+
+        self._buffer = self._buffer[self._position:] + chunk
+        self._position = 0
+        return True
+
+    def advance(self, end: int, parts: Union[list, None]) -> bool:
+        """ Consumes the text of the value being read up to the given position, appending it to the given parts unless
+        they are None, and appends the next chunk of the file to the buffer. Setting the scanned text aside keeps it
+        from being copied again as each chunk is read, so values spanning many chunks are read in linear time. """
+        if parts is not None:
+            parts.append(self._buffer[self._position:end])
+
+        self._position = end
+        return self.fill()
+
+    def error(self, message: str) -> json.JSONDecodeError:
+        """ Returns an error for the given message at the current position. """
+        return json.JSONDecodeError(message, self._buffer, self._position)
+
+    def peek(self) -> str:
+        """ Skips whitespace and returns the next character without consuming it, or an empty string at the end of the
+        file. """
+        while True:
+            self._position = WHITESPACE_PATTERN.match(self._buffer, self._position).end()
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if not self.fill():
+                return ''
+
+    def expect(self, characters: str) -> str:
+        """ Consumes and returns the next character, which must be one of the given characters. """
+        c = self.peek()
+
+        if not c or c not in characters:
+            raise self.error(f'Expecting one of {characters!r}')
+
+        self._position += 1
+        return c
+
+    def read(self, keep: bool = True) -> str:
+        """ Consumes the next complete JSON value, reading chunks from the file until the whole value has been read, and
+        returns its text, or an empty string if keep is false. """
+        c = self.peek()
+        parts: Union[list, None] = [] if keep else None
+        i = self._position
+
+        if not c:
+            raise self.error('Expecting value')
+
+        # Numbers and literals end at the next delimiter, or at the end of the file
+        if c not in '"{[':
+            while True:
+                match = SCALAR_END_PATTERN.search(self._buffer, i)
+                if match is not None:
+                    i = match.start()
+                    break
+                if not self.advance(len(self._buffer), parts):
+                    i = self._position
+                    break
+                i = self._position
+
+        depth = 1 if c in '{[' else 0
+        string = c == '"'
+        i += 1 if depth or string else 0
+
+        while depth or string:
+            buffer = self._buffer
+
+            if string:
+                i = STRING_BODY_PATTERN.match(buffer, i).end()
+                if i < len(buffer) and buffer[i] == '"':
+                    string = False
+                    i += 1
+                    continue
+                message = 'Unterminated string'
+            else:
+                i = CONTENT_PATTERN.match(buffer, i).end()
+                if i < len(buffer):
+                    token = buffer[i]
+                    i += 1
+                    if token == '"':
+                        string = True
+                    else:
+                        depth += 1 if token in '{[' else -1
+                    continue
+                message = 'Unterminated value'
+
+            if not self.advance(i, parts):
+                raise self.error(message)
+
+            i = self._position
+
+        if parts is None:
+            self._position = i
+            return ''
+
+        parts.append(self._buffer[self._position:i])
+        self._position = i
+        return parts[0] if len(parts) == 1 else ''.join(parts)
+
+    def text(self) -> str:
+        """ Consumes the next complete JSON value and returns its text. """
+        return self.read()
+
+    def decode(self) -> any:
+        """ Consumes and decodes the next complete JSON value. """
+        return json.loads(self.read())
+
+    def skip(self) -> None:
+        """ Consumes the next complete JSON value without decoding it. """
+        self.read(keep=False)
+
+
+class LazyContainer(ABC):
+    """ This class provides the base for containers whose items are only loaded when they are first read. Built-in
+    container methods that read or modify the items are overridden to finish loading first, except for item lookups,
+    which subclasses handle as efficiently as they can. """
+
+    _loaded: bool
+    """ Whether all items have been loaded. """
+
+    @property
+    def loaded(self) -> bool:
+        """ Returns whether all items have been loaded. """
+        return self._loaded
+
+    @abstractmethod
+    def load(self) -> None:
+        """ Loads all remaining items. """
+
+
+class LazyDict(LazyContainer, dict):
+    """ This class provides a dictionary whose members are only loaded when they are first read. """
+
+    def __missing__(self, key: any) -> any:
+        if not self._loaded:
+            self.load()
+            if dict.__contains__(self, key):
+                return dict.__getitem__(self, key)
+        raise KeyError(key)
+
+    def __contains__(self, key: any) -> bool:
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def get(self, key: any, default: any = None) -> any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __iter__(self):
+        if not self._loaded:
+            self.load()
+        return dict.__iter__(self)
+
+    def __len__(self) -> int:
+        if not self._loaded:
+            self.load()
+        return dict.__len__(self)
+
+    def __reversed__(self):
+        if not self._loaded:
+            self.load()
+        return dict.__reversed__(self)
+
+    def __eq__(self, other: any) -> bool:
+        if not self._loaded:
+            self.load()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other: any) -> bool:
+        if not self._loaded:
+            self.load()
+        return dict.__ne__(self, other)
+
+    def __repr__(self) -> str:
+        if not self._loaded:
+            self.load()
+        return dict.__repr__(self)
+
+    # The union operators only exist from Python 3.9
+    if hasattr(dict, '__or__'):
+        def __or__(self, other: any) -> any:
+            if not self._loaded:
+                self.load()
+            return dict.__or__(self, other)
+
+        def __ior__(self, other: any) -> any:
+            if not self._loaded:
+                self.load()
+            return dict.__ior__(self, other)
+
+    __hash__ = None
+
+    def __setitem__(self, key: any, value: any) -> None:
+        if not self._loaded:
+            self.load()
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key: any) -> None:
+        if not self._loaded:
+            self.load()
+        dict.__delitem__(self, key)
+
+    def keys(self):
+        if not self._loaded:
+            self.load()
+        return dict.keys(self)
+
+    def values(self):
+        if not self._loaded:
+            self.load()
+        return dict.values(self)
+
+    def items(self):
+        if not self._loaded:
+            self.load()
+        return dict.items(self)
+
+    def copy(self) -> dict:
+        if not self._loaded:
+            self.load()
+        return dict.copy(self)
+
+    def pop(self, key: any, *args) -> any:
+        if not self._loaded:
+            self.load()
+        return dict.pop(self, key, *args)
+
+    def popitem(self) -> tuple:
+        if not self._loaded:
+            self.load()
+        return dict.popitem(self)
+
+    def setdefault(self, key: any, default: any = None) -> any:
+        if not self._loaded:
+            self.load()
+        return dict.setdefault(self, key, default)
+
+    def update(self, *args, **kwargs) -> None:
+        if not self._loaded:
+            self.load()
+        dict.update(self, *args, **kwargs)
+
+    def clear(self) -> None:
+        if not self._loaded:
+            self.load()
+        dict.clear(self)
+
+
+class LazyList(LazyContainer, list):
+    """ This class provides a list whose items are only loaded when they are first read. """
+
+    def __getitem__(self, index: Union[int, slice]) -> any:
+        if not self._loaded:
+            self.load()
+        return list.__getitem__(self, index)
+
+    def __iter__(self):
+        if not self._loaded:
+            self.load()
+        return list.__iter__(self)
+
+    def __len__(self) -> int:
+        if not self._loaded:
+            self.load()
+        return list.__len__(self)
+
+    def __reversed__(self):
+        if not self._loaded:
+            self.load()
+        return list.__reversed__(self)
+
+    def __contains__(self, item: any) -> bool:
+        if not self._loaded:
+            self.load()
+        return list.__contains__(self, item)
+
+    def __eq__(self, other: any) -> bool:
+        if not self._loaded:
+            self.load()
+        return list.__eq__(self, other)
+
+    def __ne__(self, other: any) -> bool:
+        if not self._loaded:
+            self.load()
+        return list.__ne__(self, other)
+
+    def __lt__(self, other: any) -> bool:
+        if not self._loaded:
+            self.load()
+        return list.__lt__(self, other)
+
+    def __le__(self, other: any) -> bool:
+        if not self._loaded:
+            self.load()
+        return list.__le__(self, other)
+
+    def __gt__(self, other: any) -> bool:
+        if not self._loaded:
+            self.load()
+        return list.__gt__(self, other)
+
+    def __ge__(self, other: any) -> bool:
+        if not self._loaded:
+            self.load()
+        return list.__ge__(self, other)
+
+    def __repr__(self) -> str:
+        if not self._loaded:
+            self.load()
+        return list.__repr__(self)
+
+    def __add__(self, other: any) -> any:
+        if not self._loaded:
+            self.load()
+        return list.__add__(self, other)
+
+    def __iadd__(self, other: any) -> any:
+        if not self._loaded:
+            self.load()
+        return list.__iadd__(self, other)
+
+    def __mul__(self, count: int) -> any:
+        if not self._loaded:
+            self.load()
+        return list.__mul__(self, count)
+
+    def __rmul__(self, count: int) -> any:
+        if not self._loaded:
+            self.load()
+        return list.__rmul__(self, count)
+
+    def __imul__(self, count: int) -> any:
+        if not self._loaded:
+            self.load()
+        return list.__imul__(self, count)
+
+    __hash__ = None
+
+    def __setitem__(self, index: Union[int, slice], value: any) -> None:
+        if not self._loaded:
+            self.load()
+        list.__setitem__(self, index, value)
+
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        if not self._loaded:
+            self.load()
+        list.__delitem__(self, index)
+
+    def append(self, item: any) -> None:
+        if not self._loaded:
+            self.load()
+        list.append(self, item)
+
+    def extend(self, items: any) -> None:
+        if not self._loaded:
+            self.load()
+        list.extend(self, items)
+
+    def insert(self, index: int, item: any) -> None:
+        if not self._loaded:
+            self.load()
+        list.insert(self, index, item)
+
+    def pop(self, *args) -> any:
+        if not self._loaded:
+            self.load()
+        return list.pop(self, *args)
+
+    def remove(self, item: any) -> None:
+        if not self._loaded:
+            self.load()
+        list.remove(self, item)
+
+    def clear(self) -> None:
+        if not self._loaded:
+            self.load()
+        list.clear(self)
+
+    def index(self, item: any, *args) -> int:
+        if not self._loaded:
+            self.load()
+        return list.index(self, item, *args)
+
+    def count(self, item: any) -> int:
+        if not self._loaded:
+            self.load()
+        return list.count(self, item)
+
+    def copy(self) -> list:
+        if not self._loaded:
+            self.load()
+        return list.copy(self)
+
+    def reverse(self) -> None:
+        if not self._loaded:
+            self.load()
+        list.reverse(self)
+
+    def sort(self, *args, **kwargs) -> None:
+        if not self._loaded:
+            self.load()
+        list.sort(self, *args, **kwargs)
+
+
+class DeferredDict(LazyDict):
+    """ This class provides a dictionary that is decoded from its JSON text when it is first read. """
+
+    _text: Union[str, None]
+    """ The JSON text of the dictionary, or None once it has been decoded. """
+
+    def __init__(self, text: str):
+        """ Initializes a new DeferredDict object for the given JSON text of a dictionary. """
+        super().__init__()
+        self._text = text
+        self._loaded = False
+
+    def load(self) -> None:
+        """ Decodes the JSON text of the dictionary. """
+        if not self._loaded:
+            self._loaded = True
+            dict.update(self, json.loads(self._text))
+            self._text = None
+
+
+class DeferredList(LazyList):
+    """ This class provides a list that is decoded from its JSON text when it is first read. """
+
+    _text: Union[str, None]
+    """ The JSON text of the list, or None once it has been decoded. """
+
+    def __init__(self, text: str):
+        """ Initializes a new DeferredList object for the given JSON text of a list. """
+        super().__init__()
+        self._text = text
+        self._loaded = False
+
+    def load(self) -> None:
+        """ Decodes the JSON text of the list. """
+        if not self._loaded:
+            self._loaded = True
+            list.extend(self, json.loads(self._text))
+            self._text = None
+
+
+class StreamDict(LazyDict):
+    """ This class provides the root dictionary of a JSON stream, whose members are parsed from the stream in order as
+    they are first looked up. Looking up a member only reads the stream up to the end of that member, so members near
+    the start of the stream are available before the rest of it has been read. """
+
+    _loader: 'JSONStreamLoader'
+    """ The loader that parses the members from the stream. """
+
+    def __init__(self, loader: 'JSONStreamLoader'):
+        """ Initializes a new StreamDict object whose members are parsed by the given loader. """
+        super().__init__()
+        self._loader = loader
+        self._loaded = False
+
+    def __missing__(self, key: any) -> any:
+        while not self._loaded:
+            member = self.advance()
+            if member is not None and member[0] == key:
+                return member[1]
+        raise KeyError(key)
+
+    def advance(self) -> Union[tuple, None]:
+        """ Parses the next member from the stream and returns its key and value, or None if the member was skipped or
+        the end of the dictionary was reached. """
+        member = self._loader.member([])
+
+        if member is self._loader:
+            self._loaded = True
+            self._loader = None
+            return None
+
+        if member is not None:
+            dict.__setitem__(self, *member)
+
+        return member
+
+    def load(self) -> None:
+        """ Parses all remaining members from the stream. """
+        while not self._loaded:
+            self.advance()
+
+
+class JSONStreamLoader:
+    """ This class provides the incremental loading of a JSON document from a file object. The members of a root
+    object are parsed as they are first looked up, values at skipped paths are never decoded or stored, and values at
+    deferred paths are kept as JSON text until they are first read. Skipped and deferred paths are query paths
+    relative to the root, where * matches any key or position. """
+
+    _reader: JSONReader
+    """ The incremental reader of the JSON text. """
+
+    _skip: list
+    """ The path components of the values that aren't loaded at all. """
+
+    _defer: list
+    """ The path components of the values that are only decoded when they are first read. """
+
+    _started: bool
+    """ Whether the opening brace of the root object has been consumed. """
+
+    def __init__(self, fp: IO, skip: Union[list, None] = None, defer: Union[list, None] = None,
+                 chunk_size: int = STREAM_CHUNK_SIZE, delimiter: Union[str, None] = None):
+        """ Initializes a new JSONStreamLoader object for the given text or binary file object. """
+        from reflective.query import Query
+
+        self._reader = JSONReader(fp, chunk_size)
+        self._skip = [Query.compile(path, delimiter).path for path in skip or []]
+        self._defer = [Query.compile(path, delimiter).path for path in defer or []]
+        self._started = False
+
+    def load(self) -> any:
+        """ Returns the root value of the document. Root objects are returned as a StreamDict whose members are parsed
+        as they are first looked up, and other root values are loaded immediately. """
+        if self._reader.peek() == '{':
+            return StreamDict(self)
+
+        return self.value([])
+
+    @staticmethod
+    def matches(patterns: list, path: list, partial: bool = False) -> bool:
+        """ Returns whether any of the given patterns matches the given path, or if partial is true, whether any of the
+        patterns matches a path below the given path. """
+        from reflective.query import Wildcard
+
+        for pattern in patterns:
+            if len(pattern) <= len(path) if partial else len(pattern) != len(path):
+                continue
+            if all(component == key or isinstance(component, Wildcard) and component.matches(key)
+                   for component, key in zip(pattern, path)):
+                return True
+
+        return False
+
+    def member(self, path: list) -> Union[tuple, None, 'JSONStreamLoader']:
+        """ Parses the next member of the object being read at the given path, returning its key and value, None if the
+        member was skipped, or this loader once the end of the object has been reached. """
+        reader = self._reader
+
+        if not self._started and not path:
+            reader.expect('{')
+            self._started = True
+            if reader.peek() == '}':
+                reader.expect('}')
+                return self
+        else:
+            if reader.expect(',}') == '}':
+                return self
+
+        if reader.peek() != '"':
+            raise reader.error('Expecting property name enclosed in double quotes')
+
+        key = reader.decode()
+        reader.expect(':')
+        location = path + [key]
+
+        if self.matches(self._skip, location):
+            reader.skip()
+            return None
+
+        return key, self.value(location)
+
+    def value(self, path: list) -> any:
+        """ Parses the next value at the given path, honouring the skipped and deferred paths at or below it. """
+        reader = self._reader
+        c = reader.peek()
+
+        if self.matches(self._defer, path):
+            text = reader.text()
+            if c == '{':
+                return DeferredDict(text)
+            if c == '[':
+                return DeferredList(text)
+            return json.loads(text)
+
+        # Values without skipped or deferred paths below them are decoded at once
+        if c not in '{[' or not self.matches(self._skip + self._defer, path, partial=True):
+            return reader.decode()
+
+        if c == '[':
+            items: list = []
+            reader.expect('[')
+            if reader.peek() == ']':
+                reader.expect(']')
+                return items
+            while True:
+                location = path + [len(items)]
+                if self.matches(self._skip, location):
+                    reader.skip()
+                    # Skipped items keep the positions of the following items
+                    items.append(None)
+                else:
+                    items.append(self.value(location))
+                if reader.expect(',]') == ']':
+                    return items
+
+        members: dict = {}
+        reader.expect('{')
+
+        if reader.peek() == '}':
+            reader.expect('}')
+            return members
+
+        while True:
+            if reader.peek() != '"':
+                raise reader.error('Expecting property name enclosed in double quotes')
+            key = reader.decode()
+            reader.expect(':')
+            location = path + [key]
+            if self.matches(self._skip, location):
+                reader.skip()
+            else:
+                members[key] = self.value(location)
+            if reader.expect(',}') == '}':
+                return members
+
+
+class ResolvingDict(dict):
+    """ This class provides an empty dictionary standing in for an unparsed dictionary while it is encoded, producing
+    the resolved values of its members one at a time as the encoder iterates over them. """
+
+    _context: 'ContextManager'
+    """ The context used to resolve the members. """
+
+    _value: dict
+    """ The unparsed dictionary. """
+
+    _path: list
+    """ The absolute path components of the unparsed dictionary. """
+
+    _trail: tuple
+    """ The path components of the referenced values followed to reach the unparsed dictionary. """
+
+    def __init__(self, context: 'ContextManager', value: dict, path: list, trail: tuple = ()):
+        """ Initializes a new ResolvingDict object for the given unparsed dictionary at the given path. """
+        super().__init__()
+        self._context = context
+        self._value = value
+        self._path = path
+        self._trail = trail
+
+    def __len__(self) -> int:
+        return len(self._value)
+
+    def items(self):
+        for key, value in self._value.copy().items():
+            yield key, StreamWriter.view(self._context, value, self._path + [key], self._trail)
+
+
+class ResolvingList(list):
+    """ This class provides an empty list standing in for an unparsed list or tuple while it is encoded, producing the
+    resolved values of its items one at a time as the encoder iterates over them. """
+
+    _context: 'ContextManager'
+    """ The context used to resolve the items. """
+
+    _value: Union[list, tuple]
+    """ The unparsed list or tuple. """
+
+    _path: list
+    """ The absolute path components of the unparsed list or tuple. """
+
+    _trail: tuple
+    """ The path components of the referenced values followed to reach the unparsed list or tuple. """
+
+    def __init__(self, context: 'ContextManager', value: Union[list, tuple], path: list, trail: tuple = ()):
+        """ Initializes a new ResolvingList object for the given unparsed list or tuple at the given path. """
+        super().__init__()
+        self._context = context
+        self._value = value
+        self._path = path
+        self._trail = trail
+
+    def __len__(self) -> int:
+        return len(self._value)
+
+    def __iter__(self):
+        for i, value in enumerate(self._value if isinstance(self._value, tuple) else self._value.copy()):
+            yield StreamWriter.view(self._context, value, self._path + [i], self._trail)
+
+
+class StreamWriter:
+    """ This class provides the writing of serialized values to a file object in chunks of a bounded size. Values are
+    resolved as they are serialized, so neither a resolved copy of the value nor the whole output is held in memory,
+    and the first chunk is written as soon as it is ready. """
+
+    _fp: IO
+    """ The text file object that chunks are written to. """
+
+    _chunk_size: int
+    """ The number of characters collected before they are written as a chunk. """
+
+    _chunks: list
+    """ The text collected since the last chunk was written. """
+
+    _size: int
+    """ The number of characters collected since the last chunk was written. """
+
+    def __init__(self, fp: IO, chunk_size: int = STREAM_CHUNK_SIZE):
+        """ Initializes a new StreamWriter object for the given text file object. """
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._chunks = []
+        self._size = 0
+
+    def write(self, text: str) -> None:
+        """ Collects the given text, writing the collected text as a chunk once it reaches the chunk size. """
+        self._chunks.append(text)
+        self._size += len(text)
+
+        if self._size >= self._chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """ Writes the collected text as a chunk. """
+        if self._chunks:
+            self._fp.write(''.join(self._chunks))
+            self._chunks = []
+            self._size = 0
+
+    @staticmethod
+    def view(context: 'ContextManager', value: any, path: list, trail: tuple = ()) -> any:
+        """ Returns the given unparsed value at the given path as it should be encoded. Composite values are returned as
+        views resolving their members as they are iterated, and other values are resolved immediately, except for sole
+        references to composite values, which are returned as views of the referenced value. The trail holds the path
+        components of the referenced values followed to reach the value. """
+        if isinstance(value, dict):
+            return ResolvingDict(context, value, path, trail)
+
+        if isinstance(value, (list, tuple)):
+            return ResolvingList(context, value, path, trail)
+
+        referent = context.referent(value)
+
+        # Referenced composite values are streamed from their own paths, so a resolved copy of them isn't held
+        if referent is not None:
+            target = referent().context
+            return StreamWriter.view(context, target.raw, target.path, StreamWriter.follow(context, trail, target.path))
+
+        return context.parse(value, path=path)
+
+    @staticmethod
+    def follow(context: 'ContextManager', trail: tuple, path: list) -> tuple:
+        """ Returns the given trail of followed references extended with the given referenced path. An RCircularReference
+        error is raised if the referenced value is already being written, which means that it contains a reference to
+        itself. """
+        from reflective.exceptions import RCircularReference
+
+        key = context.core.path_key(path)
+
+        if key in trail:
+            resolver = context.core.resolver
+            cycle = [resolver.format(k) for k in trail[trail.index(key):]] + [resolver.format(key)]
+            raise RCircularReference(f'Circular reference detected: {" -> ".join(cycle)}', cycle)
+
+        return trail + (key,)
+
+    def dump_json(self, context: 'ContextManager', flat: bool = True) -> None:
+        """ Writes the JSON representation of the resolved value of the given context, formatted as RCore.to_json would
+        format it. """
+        encoder = json.JSONEncoder(indent=None if flat else 4)
+
+        for text in encoder.iterencode(self.view(context, context.raw, context.path)):
+            self.write(text)
+
+        self.flush()
+
+    def dump_yaml(self, context: 'ContextManager') -> None:
+        """ Writes the YAML representation of the resolved value of the given context, formatted as RCore.to_yaml would
+        format it. The events of the document are emitted as the value is traversed, so it is never represented as a
+        whole. """
+        import yaml
+
+        dumper = yaml.Dumper(self, indent=4)
+
+        try:
+            dumper.open()
+            dumper.emit(yaml.DocumentStartEvent(explicit=dumper.use_explicit_start, version=dumper.use_version,
+                                                tags=dumper.use_tags))
+            self.emit_yaml(dumper, context, context.raw, context.path)
+            dumper.emit(yaml.DocumentEndEvent(explicit=dumper.use_explicit_end))
+            dumper.close()
+        finally:
+            dumper.dispose()
+
+        self.flush()
+
+    def emit_yaml(self, dumper: 'yaml.Dumper', context: 'ContextManager', value: any, path: list,
+                  trail: tuple = ()) -> None:
+        """ Emits the YAML events of the given unparsed value at the given path, resolving it as it is traversed. The
+        trail holds the path components of the referenced values followed to reach the value. """
+        import yaml
+
+        if isinstance(value, dict):
+            items = list(value.copy().items())
+            if dumper.sort_keys:
+                try:
+                    items.sort()
+                except TypeError:
+                    pass
+            dumper.emit(yaml.MappingStartEvent(None, 'tag:yaml.org,2002:map', True, flow_style=False))
+            for key, item in items:
+                self.emit_node(dumper, key)
+                self.emit_yaml(dumper, context, item, path + [key], trail)
+            dumper.emit(yaml.MappingEndEvent())
+            return
+
+        if isinstance(value, (list, tuple)):
+            # Tuples are tagged explicitly, as the default representer of the YAML library does
+            tag = 'tag:yaml.org,2002:seq' if isinstance(value, list) else 'tag:yaml.org,2002:python/tuple'
+            dumper.emit(yaml.SequenceStartEvent(None, tag, isinstance(value, list), flow_style=False))
+            for i, item in enumerate(value if isinstance(value, tuple) else value.copy()):
+                self.emit_yaml(dumper, context, item, path + [i], trail)
+            dumper.emit(yaml.SequenceEndEvent())
+            return
+
+        referent = context.referent(value)
+
+        # Referenced composite values are emitted from their own paths, so a resolved copy of them isn't held
+        if referent is not None:
+            target = referent().context
+            self.emit_yaml(dumper, context, target.raw, target.path, self.follow(context, trail, target.path))
+        else:
+            self.emit_node(dumper, context.parse(value, path=path))
+
+    @staticmethod
+    def emit_node(dumper: 'yaml.Dumper', value: any) -> None:
+        """ Represents the given resolved value and emits its YAML events. """
+        node = dumper.represent_data(value)
+        dumper.represented_objects = {}
+        dumper.object_keeper = []
+        dumper.alias_key = None
+
+        dumper.anchor_node(node)
+        dumper.serialize_node(node, None, None)
+        dumper.serialized_nodes = {}
+        dumper.anchors = {}
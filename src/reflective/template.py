@@ -0,0 +1,111 @@
+from __future__ import annotations
+from functools import lru_cache
+from typing import NamedTuple
+
+TEMPLATE_CACHE_SIZE: int = 65536
+""" The maximum number of compiled templates that are retained for reuse. """
+
+
+class TemplateSlot(NamedTuple):
+    """ This class provides a data object to represent a single reference within a template. """
+
+    method: str
+    """ The lower-cased reference method, which is either "r" or "e". """
+
+    query: str
+    """ The query string or environment variable name of the reference. """
+
+    text: str
+    """ The original text of the reference in the source string. """
+
+
+class Template:
+    """ This class provides a pre-tokenized representation of a string containing Reflective references, consisting of
+    the literal segments of the string and the reference slots between them. """
+
+    _source: str
+    """ The source string that the template was compiled from. """
+
+    _segments: tuple
+    """ The literal segments of the source string. There is always one more segment than there are slots. """
+
+    _slots: tuple
+    """ The reference slots of the source string. """
+
+    _sole: bool
+    """ Whether the source string consists of nothing but references to the same Reflective query. """
+
+    @property
+    def source(self) -> str:
+        """ Returns the source string that the template was compiled from. """
+        return self._source
+
+    @property
+    def segments(self) -> tuple:
+        """ Returns the literal segments of the source string. """
+        return self._segments
+
+    @property
+    def slots(self) -> tuple:
+        """ Returns the reference slots of the source string. """
+        return self._slots
+
+    @property
+    def sole(self) -> bool:
+        """ Returns whether the source string consists of nothing but references to the same Reflective query, in which
+        case the referenced value is passed through without being converted to a string. """
+        return self._sole
+
+    @property
+    def references(self) -> list:
+        """ Returns the query strings of the Reflective references in the template. """
+        return [slot.query for slot in self._slots if slot.method == 'r']
+
+    def __init__(self, source: str, segments: tuple, slots: tuple):
+        """ Initializes a new Template object from the given literal segments and reference slots. """
+        self._source = source
+        self._segments = segments
+        self._slots = slots
+        self._sole = len(slots) > 0 \
+            and all(slot.method == 'r' and slot.query == slots[0].query for slot in slots) \
+            and ''.join(segments).strip() == ''
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self._source!r})'
+
+    def render(self, values: list) -> str:
+        """ Renders the template by joining the literal segments with the given string values of the slots. """
+        parts: list = [self._segments[0]]
+        for value, segment in zip(values, self._segments[1:]):
+            parts.append(value)
+            parts.append(segment)
+        return ''.join(parts)
+
+    @staticmethod
+    def compile(source: str) -> 'Template':
+        """ Returns the compiled template for the given source string, reusing previously compiled templates. """
+        return _compile(source)
+
+    @staticmethod
+    def cache_info():
+        """ Returns the hit and miss statistics of the compiled template cache. """
+        return _compile.cache_info()
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def _compile(source: str) -> Template:
+    """ Compiles the given source string into a Template object. """
+    from reflective.util import RUtil
+
+    segments: list = []
+    slots: list = []
+    position: int = 0
+
+    for match in RUtil.ref_pattern.finditer(source):
+        segments.append(source[position:match.start()])
+        slots.append(TemplateSlot(match.group(1).lower(), match.group(2), match.group(0)))
+        position = match.end()
+
+    segments.append(source[position:])
+
+    return Template(source, tuple(segments), tuple(slots))
@@ -0,0 +1,187 @@
+from __future__ import annotations
+from collections.abc import MutableMapping
+from typing import NamedTuple, Union
+
+_EMPTY = object()
+""" The sentinel used to mark trie nodes that do not hold a value. """
+
+
+class PathSummary(NamedTuple):
+    """ This class provides a data object to represent the aggregate statistics of a subtree of a PathTrie instance. """
+
+    count: int
+    """ The number of values stored in the subtree. """
+
+    weight: int
+    """ The total weight of the values stored in the subtree. """
+
+
+class PathNode:
+    """ This class provides a single node of a PathTrie instance. """
+
+    __slots__ = ('children', 'value', 'weight', 'total_count', 'total_weight')
+
+    children: dict
+    """ The child nodes of this node, keyed by path component. """
+
+    value: any
+    """ The value stored at this node, if any. """
+
+    weight: int
+    """ The weight of the value stored at this node. """
+
+    total_count: int
+    """ The number of values stored at or below this node. """
+
+    total_weight: int
+    """ The total weight of the values stored at or below this node. """
+
+    def __init__(self):
+        """ Initializes a new PathNode object without a value. """
+        self.children = {}
+        self.value = _EMPTY
+        self.weight = 0
+        self.total_count = 0
+        self.total_weight = 0
+
+    def walk(self, path: tuple):
+        """ Yields the path and value of every value stored at or below this node. """
+        if self.value is not _EMPTY:
+            yield path, self.value
+        for component, child in list(self.children.items()):
+            yield from child.walk(path + (component,))
+
+
+class PathTrie(MutableMapping):
+    """ This class provides a mapping of path component tuples to values, indexed by path prefix so that the values
+    at or below a given path can be found without scanning every key. Each value may carry a numeric weight, and every
+    node tracks the number and total weight of the values below it. """
+
+    _root: PathNode
+    """ The root node of the trie. """
+
+    def __init__(self):
+        """ Initializes a new, empty PathTrie object. """
+        self._root = PathNode()
+
+    def __getitem__(self, path: tuple) -> any:
+        node = self.node(path)
+        if node is None or node.value is _EMPTY:
+            raise KeyError(path)
+        return node.value
+
+    def __setitem__(self, path: tuple, value: any) -> None:
+        self.insert(path, value)
+
+    def __delitem__(self, path: tuple) -> None:
+        nodes = self.trace(path)
+        if nodes is None or nodes[-1].value is _EMPTY:
+            raise KeyError(path)
+        node = nodes[-1]
+        self.adjust(nodes, -1, -node.weight)
+        node.value = _EMPTY
+        node.weight = 0
+        self.prune(path, nodes)
+
+    def __contains__(self, path: tuple) -> bool:
+        node = self.node(path)
+        return node is not None and node.value is not _EMPTY
+
+    def __iter__(self):
+        for path, _ in self._root.walk(()):
+            yield path
+
+    def __len__(self) -> int:
+        return self._root.total_count
+
+    def insert(self, path: tuple, value: any, weight: int = 0) -> None:
+        """ Stores the given value with the given weight at the given path. """
+        nodes: list = [self._root]
+        for component in path:
+            child = nodes[-1].children.get(component)
+            if child is None:
+                child = nodes[-1].children[component] = PathNode()
+            nodes.append(child)
+        node = nodes[-1]
+        self.adjust(nodes, 1 if node.value is _EMPTY else 0, weight - node.weight)
+        node.value = value
+        node.weight = weight
+
+    def node(self, path: tuple) -> Union[PathNode, None]:
+        """ Returns the node for the given path, or None if no node exists for the path. """
+        node = self._root
+        for component in path:
+            node = node.children.get(component)
+            if node is None:
+                return None
+        return node
+
+    def trace(self, path: tuple) -> Union[list, None]:
+        """ Returns the nodes visited from the root to the given path, or None if no node exists for the path. """
+        nodes: list = [self._root]
+        for component in path:
+            node = nodes[-1].children.get(component)
+            if node is None:
+                return None
+            nodes.append(node)
+        return nodes
+
+    @staticmethod
+    def adjust(nodes: list, count: int, weight: int) -> None:
+        """ Applies the given changes in value count and weight to the aggregates of the given nodes. """
+        if count or weight:
+            for node in nodes:
+                node.total_count += count
+                node.total_weight += weight
+
+    @staticmethod
+    def prune(path: tuple, nodes: list) -> None:
+        """ Removes the empty trailing nodes along the given path, where nodes are the nodes visited for the path. """
+        for i in range(len(path), 0, -1):
+            node = nodes[i]
+            if node.value is not _EMPTY or node.children:
+                break
+            del nodes[i - 1].children[path[i - 1]]
+
+    def subtree(self, prefix: tuple = ()):
+        """ Yields the path and value of every value stored at or below the given path prefix. """
+        node = self.node(prefix)
+        if node is not None:
+            yield from node.walk(tuple(prefix))
+
+    def summary(self, prefix: tuple = ()) -> PathSummary:
+        """ Returns the number and total weight of the values stored at or below the given path prefix. """
+        node = self.node(prefix)
+        if node is None:
+            return PathSummary(0, 0)
+        return PathSummary(node.total_count, node.total_weight)
+
+    def prefixes(self, path: tuple):
+        """ Yields the path and value of every value stored at the given path or any of its ancestor paths. """
+        node = self._root
+        if node.value is not _EMPTY:
+            yield (), node.value
+        for i, component in enumerate(path):
+            node = node.children.get(component)
+            if node is None:
+                return
+            if node.value is not _EMPTY:
+                yield tuple(path[:i + 1]), node.value
+
+    def pop_subtree(self, prefix: tuple = ()) -> list:
+        """ Removes every value stored at or below the given path prefix, returning the removed paths and values. """
+        nodes = self.trace(prefix)
+        if nodes is None:
+            return []
+
+        node = nodes[-1]
+        removed = list(node.walk(tuple(prefix)))
+
+        if len(prefix):
+            self.adjust(nodes[:-1], -node.total_count, -node.total_weight)
+            del nodes[-2].children[prefix[-1]]
+            self.prune(tuple(prefix[:-1]), nodes[:-1])
+        else:
+            self._root = PathNode()
+
+        return removed
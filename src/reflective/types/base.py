@@ -8,6 +8,9 @@ DEFAULT_NAMESPACE: str = 'r_'
 NAMESPACE_KEY: str = '__reflective_namespace'
 """ The key used to store the dynamic namespace in the object dictionary. """
 
+VALUE_KEY: str = '__reflective_value'
+""" The key used to hand the resolved value of a new instance from its constructor to its initializer. """
+
 
 class Reflective:
     """ This is the base class for all Reflective value type instances. """
@@ -23,14 +26,21 @@ class Reflective:
         # Specifically handle instantiations of the core Reflective type class to ensure the correct type is returned.
         type_value = RUtil.get_reference(ref)
         type_class = RUtil.get_type_class(type_value)
+        instance = type_class.__new__(type_class, type_value)
+
+        # Hand the resolved value to the initializer so that the reference isn't resolved again
+        instance.__dict__[VALUE_KEY] = type_value
 
-        return type_class.__new__(type_class, type_value)
+        return instance
 
     def __init__(self, ref: any, namespace: Union[str, None] = None):
         """ Initializes a new Reflective instance of the appropriate type, using the given reference as the value. """
         from reflective.core import RCore
         from reflective.context import ContextManager
 
+        # Type classes that don't read the resolved value handed over by the constructor must not keep it
+        self.__dict__.pop(VALUE_KEY, None)
+
         if namespace is None:
             namespace = DEFAULT_NAMESPACE
 
@@ -54,6 +64,76 @@ class Reflective:
 
         self.__dict__[namespace] = inst
 
+    @staticmethod
+    def from_json_stream(fp: any, skip: Union[list, None] = None, defer: Union[list, None] = None,
+                         chunk_size: Union[int, None] = None) -> 'Reflective':
+        """ Creates a new Reflective instance from the JSON document in the given text or binary file object, reading
+        it incrementally. The members of a root object are parsed as they are first looked up, so early members are
+        available before the rest of the file has been read, and the file must stay open until the value is fully
+        loaded. Values at the skip paths are never decoded, and values at the defer paths are only decoded when they
+        are first read. """
+        from reflective.stream import JSONStreamLoader, STREAM_CHUNK_SIZE
+
+        loader = JSONStreamLoader(fp, skip, defer, chunk_size if chunk_size is not None else STREAM_CHUNK_SIZE)
+
+        return Reflective(loader.load())
+
+    @staticmethod
+    def from_mapped_json(path: str, index: Union[str, None] = None, threshold: Union[int, None] = None) -> 'Reflective':
+        """ Creates a new Reflective instance backed by the JSON file at the given path, which is memory-mapped rather
+        than read. Composite values of at least the threshold size are decoded one level at a time as paths under them
+        are first dereferenced, so reading a value only decodes the bytes on its path. The offset index at the given
+        path, or a current index next to the file, is used to locate members without scanning for them. The file stays
+        open until the close method of the RCore instance is called, or the instance is used as a context manager. """
+        from reflective.mapped import MappedDocument, MAPPED_THRESHOLD
+
+        if index is None:
+            index = MappedDocument.default_index(path)
+
+        document = MappedDocument(path, index, threshold if threshold is not None else MAPPED_THRESHOLD)
+
+        try:
+            instance = Reflective(document.load())
+        except Exception:
+            document.close()
+            raise
+
+        instance().hold(document)
+
+        return instance
+
+    @staticmethod
+    def overlay(*layers: dict) -> 'Reflective':
+        """ Creates a new Reflective instance whose value is an overlay of the given dictionaries, from the lowest to the
+        highest precedence. Values are looked up through the layers instead of merging them, so the layers aren't
+        copied, and values written to the instance are kept above every layer without modifying the layers. Layers are
+        changed with the add_layer, replace_layer and remove_layer methods of the RCore class. """
+        from reflective.overlay import Overlay
+        return Reflective(Overlay(layers))
+
+    @staticmethod
+    def load_snapshot(source: any) -> 'Reflective':
+        """ Creates a new Reflective instance from a snapshot written by RCore.dump_snapshot, given as bytes or as a
+        binary file object that is read in one pass. The compiled templates of the snapshot are kept by the resolver of
+        the new instance so that its strings aren't scanned for references again, and its dependency graph and memoized
+        resolved values are restored for the new instance. """
+        from reflective.graph import DependencyGraph
+        from reflective.snapshot import SnapshotReader
+
+        reader = SnapshotReader(source if isinstance(source, (bytes, bytearray)) else source.read())
+        value, references, memos = reader.load()
+
+        instance = Reflective(value)
+        resolver = instance().resolver
+        resolver.templates = reader.templates
+
+        for key, resolved, dependencies in memos:
+            resolver.store(key, resolved, dependencies)
+
+        resolver.graph = DependencyGraph(instance(), references)
+
+        return instance
+
     def __call__(self, *args, **kwargs) -> Union[RCore, 'Reflective', QueryResult, any]:
         from reflective.query import Query
 
@@ -74,11 +154,14 @@ class Reflective:
         if total_args == 1 and str(query).strip() == '':
             return core.context.ref
 
-        query = Query(query)
+        query = Query.compile(query)
         qr: QueryResult = core.query(query)
 
         # Handle query only scenarios
         if total_args == 1:
+            # Wildcard results are returned as-is so that their matches are only produced as they are read
+            if query.is_wildcard:
+                return qr
             if len(qr) == 1:
                 return qr[0]
             return qr
@@ -91,6 +174,10 @@ class Reflective:
                 result().context.raw = value
             return True
 
+        # Wildcard queries don't name the references to be created
+        if query.is_wildcard:
+            return None
+
         # If the references to be set don't already exist, create them in the parent context
         else:
             parent_path = core.path + query.path[:-1]
@@ -105,6 +192,8 @@ class Reflective:
             else:
                 core.root().context.raw[key] = value
 
+            core.root().context.changed(parent_path + [key], structural=False)
+
         return None
 
     def __getattr__(self, item):
@@ -130,7 +219,8 @@ class Reflective:
         if isinstance(qr, Reflective):
             qr().context.delete()
             return
-        for result in self(item):
+        # Deleting in reverse order keeps the positions of the remaining list items valid
+        for result in reversed(list(qr)):
             result().context.delete()
 
     def __getitem__(self, item):
@@ -155,7 +245,8 @@ class Reflective:
         if isinstance(qr, Reflective):
             qr().context.delete()
             return
-        for result in self(item):
+        # Deleting in reverse order keeps the positions of the remaining list items valid
+        for result in reversed(list(qr)):
             result().context.delete()
 
     def __enter__(self) -> 'Reflective':
@@ -165,7 +256,10 @@ class Reflective:
         return self()
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        pass
+        """ Closes the resources backing the value when leaving the context of the root instance. """
+        core = self()
+        if core.root is self:
+            core.close()
 
     def __repr__(self) -> str:
         # Ensure that this reference is valid
@@ -6,7 +6,7 @@ class RDict(RComposite, UserDict, dict):
 
     def __init__(self, ref: any = None, **kwargs):
         from reflective.util import RUtil
-        value = RUtil.get_reference(ref)
+        value = RUtil.get_instance_reference(self, ref)
         self.__dict__['data'] = value
         super().__init__(ref)
         # if value is not None:
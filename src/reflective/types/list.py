@@ -6,10 +6,18 @@ class RList(RComposite, UserList, list):
 
     def __init__(self, ref: any):
         from reflective.util import RUtil
-        value = RUtil.get_reference(ref)
-        if value is not None:
+        from reflective.view import ListView
+        value = RUtil.get_instance_reference(self, ref)
+        # Lazily resolved views already write through to the unparsed list value
+        if value is not None and not isinstance(value, ListView):
             value = RUtil.get_list_value(value)
-            RUtil.update_reference(ref, value)
+            raw = RUtil.get_raw_reference(ref)
+            # Mutations must reach the unparsed list, so a list without references is used as-is, and the resolved list
+            # is only written back when it differs from the unparsed value
+            if type(raw) is list and raw == value:
+                value = raw
+            else:
+                RUtil.update_reference(ref, value)
         self.__dict__['data'] = value
         super().__init__(ref)
 
@@ -68,6 +76,7 @@ class RList(RComposite, UserList, list):
             self.__dict__['data'] += other
         else:
             self.__dict__['data'] += list(other)
+        self().context.changed()
         return self
 
     def __mul__(self, n):
@@ -81,6 +90,7 @@ class RList(RComposite, UserList, list):
         # Ensure that this reference is valid
         self().enforce_validation()
         self.__dict__['data'] *= n
+        self().context.changed()
         return self
 
     def __copy__(self):
@@ -96,26 +106,37 @@ class RList(RComposite, UserList, list):
         # Ensure that this reference is valid
         self().enforce_validation()
         self.__dict__['data'].append(item)
+        self().context.moved(len(self.__dict__['data']) - 1, 1)
 
     def insert(self, i, item):
         # Ensure that this reference is valid
         self().enforce_validation()
-        self.__dict__['data'].insert(i, item)
+        data = self.__dict__['data']
+        data.insert(i, item)
+        # Positions are clamped to the list the same way list.insert clamps them
+        self().context.moved(min(max(i if i >= 0 else len(data) - 1 + i, 0), len(data) - 1), 1)
 
     def pop(self, i=-1):
         # Ensure that this reference is valid
         self().enforce_validation()
-        return self.__dict__['data'].pop(i)
+        data = self.__dict__['data']
+        value = data.pop(i)
+        self().context.moved(i if i >= 0 else len(data) + 1 + i, -1)
+        return value
 
     def remove(self, item):
         # Ensure that this reference is valid
         self().enforce_validation()
-        self.__dict__['data'].remove(item)
+        data = self.__dict__['data']
+        position = data.index(item)
+        del data[position]
+        self().context.moved(position, -1)
 
     def clear(self):
         # Ensure that this reference is valid
         self().enforce_validation()
         self.__dict__['data'].clear()
+        self().context.changed()
 
     def copy(self):
         # Ensure that this reference is valid
@@ -136,11 +157,13 @@ class RList(RComposite, UserList, list):
         # Ensure that this reference is valid
         self().enforce_validation()
         self.__dict__['data'].reverse()
+        self().context.changed()
 
     def sort(self, *args, **kwds):
         # Ensure that this reference is valid
         self().enforce_validation()
         self.__dict__['data'].sort(*args, **kwds)
+        self().context.changed()
 
     def extend(self, other):
         # Ensure that this reference is valid
@@ -149,3 +172,4 @@ class RList(RComposite, UserList, list):
             self.__dict__['data'].extend(other.data)
         else:
             self.__dict__['data'].extend(other)
+        self().context.changed()
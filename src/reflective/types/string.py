@@ -7,9 +7,8 @@ class RString(RSimple, UserString, str):
 
     def __init__(self, ref: str):
         from reflective.util import RUtil
-        value = RUtil.get_reference(ref)
-        value = RUtil.get_string_value(value)
-        RUtil.update_reference(ref, value)
+        # Strings are immutable, so the resolved value is never written back over the unparsed value and its references
+        value = RUtil.get_string_value(RUtil.get_instance_reference(self, ref))
         self.__dict__['data'] = value
         super().__init__(ref)
 
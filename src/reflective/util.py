@@ -24,6 +24,35 @@ class RUtil:
 
         return value
 
+    @staticmethod
+    def get_instance_reference(instance: any, ref: any):
+        """ Returns the value that was resolved when the given instance was created, or resolves the given reference if
+        the instance was created directly from its type class. """
+        from reflective.types.base import VALUE_KEY
+
+        if VALUE_KEY in instance.__dict__:
+            return instance.__dict__.pop(VALUE_KEY)
+
+        return RUtil.get_reference(ref)
+
+    @staticmethod
+    def get_raw_reference(value: any):
+        """ Returns the unparsed value of the given reference, or the given value if it isn't a reference. """
+        from reflective.core import RCore
+        from reflective.context import ContextManager
+        from reflective.types import Reflective
+
+        if isinstance(value, Reflective):
+            return value().context.raw
+
+        if isinstance(value, RCore):
+            return value.context.raw
+
+        if isinstance(value, ContextManager):
+            return value.raw
+
+        return value
+
     @staticmethod
     def update_reference(ref: any, value: any):
         from reflective.core import RCore
@@ -42,15 +71,17 @@ class RUtil:
     @staticmethod
     def get_type_class(value: any):
         """ Returns the appropriate Reflective type class for the given value. """
+        from collections.abc import Mapping
         from reflective.types import Reflective, RDict, RList, RTuple, RBool, RInt, RFloat, RComplex, RString, RNone
+        from reflective.view import ListView, TupleView
 
-        if isinstance(value, dict) or value == {}:
+        if isinstance(value, Mapping) or value == {}:
             return RDict
 
-        if isinstance(value, list) or value == []:
+        if isinstance(value, (list, ListView)) or value == []:
             return RList
 
-        if isinstance(value, tuple):
+        if isinstance(value, (tuple, TupleView)):
             return RTuple
 
         if isinstance(value, bool):
@@ -85,6 +116,27 @@ class RUtil:
             return value.data[:]
         return list(value)
 
+    @staticmethod
+    def get_plain_value(value: any) -> any:
+        """ Returns a copy of the given value where every Reflective instance is replaced with its plain Python value. """
+        from collections.abc import Mapping
+        from reflective.types import Reflective
+
+        if isinstance(value, Reflective):
+            # Instances hold a copy of their value taken when they were created, so the value is resolved again
+            return RUtil.get_plain_value(value().context.resolved)
+
+        if isinstance(value, Mapping):
+            return {k: RUtil.get_plain_value(v) for k, v in value.items()}
+
+        if isinstance(value, list):
+            return [RUtil.get_plain_value(item) for item in value]
+
+        if isinstance(value, tuple):
+            return tuple(RUtil.get_plain_value(item) for item in value)
+
+        return value
+
     @staticmethod
     def get_string_value(value: any) -> str:
         """ Returns the appropriate string value for the given value. """
@@ -98,19 +150,12 @@ class RUtil:
     @staticmethod
     def extract(value: str) -> list:
         """ Extracts the Reflective reference strings from the given string and returns them as a list of strings."""
+        from reflective.template import Template
 
-        references: list = []
-
-        # Process $(r|e){...} references
-        matches = RUtil.ref_pattern.findall(value)
-
-        for match in matches:
-            # Handles instances of $(r){...} references
-            if str(match[0]).lower() == 'r':
-                # Capture the Reflective query string
-                references.append(match[1])
+        if '$' not in value:
+            return []
 
-        return references
+        return Template.compile(value).references
 
     @staticmethod
     def update(source: str, ref: str, value: any) -> any:
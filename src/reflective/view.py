@@ -0,0 +1,160 @@
+from __future__ import annotations
+from collections.abc import Mapping, MutableSequence, Sequence
+
+
+class View:
+    """ This class provides the base for lazily resolved views of composite values. Views wrap the unparsed container
+    value and only resolve Reflective references for the items that are actually accessed. """
+
+    _context: 'ContextManager'
+    """ The context manager used to resolve the items of the view. """
+
+    _raw: any
+    """ The unparsed container value that the view wraps. """
+
+    _path: list
+    """ The path components of the wrapped container value, relative to the root context. """
+
+    @property
+    def context(self) -> 'ContextManager':
+        """ Returns the context manager used to resolve the items of the view. """
+        return self._context
+
+    @property
+    def raw(self) -> any:
+        """ Returns the unparsed container value that the view wraps. """
+        return self._raw
+
+    @property
+    def path(self) -> list:
+        """ Returns the path components of the wrapped container value, relative to the root context. """
+        return self._path
+
+    def __init__(self, context: 'ContextManager', raw: any, path: list = None):
+        """ Initializes a new View object for the given unparsed container value. """
+        self._context = context
+        self._raw = raw
+        self._path = list(path) if path is not None else []
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def __repr__(self) -> str:
+        return self.resolve().__repr__()
+
+    def item(self, key: any) -> any:
+        """ Returns the lazily resolved value of the item with the given key. """
+        return self._context.view(self._raw[key], self._path + [key])
+
+    def changed(self) -> None:
+        """ Signals that the wrapped container value has been modified through the view. """
+        self._context.core.root().context.changed(self._path)
+
+    def resolve(self) -> any:
+        """ Returns a fully resolved copy of the wrapped container value. """
+        return self._context.parse(self._raw, path=self._path)
+
+
+class DictView(View, Mapping):
+    """ This class provides a lazily resolved, read-only view of a dictionary value. """
+
+    __hash__ = None
+
+    def __getitem__(self, key: any) -> any:
+        return self.item(key)
+
+    def __iter__(self):
+        return iter(self._raw)
+
+    def __contains__(self, key: any) -> bool:
+        return key in self._raw
+
+    def __or__(self, other: any) -> dict:
+        if isinstance(other, Mapping):
+            return {**dict(self.items()), **dict(other.items())}
+        return NotImplemented
+
+    def __ror__(self, other: any) -> dict:
+        if isinstance(other, Mapping):
+            return {**dict(other.items()), **dict(self.items())}
+        return NotImplemented
+
+
+class TupleView(View, Sequence):
+    """ This class provides a lazily resolved, read-only view of a tuple value. """
+
+    def __getitem__(self, index: any) -> any:
+        if isinstance(index, slice):
+            return tuple(self.item(i) for i in range(*index.indices(len(self._raw))))
+        return self.item(index)
+
+    def __eq__(self, other: any) -> bool:
+        if isinstance(other, (tuple, TupleView)):
+            return tuple(self) == tuple(other)
+        return NotImplemented
+
+    __hash__ = None
+
+
+class ListView(View, MutableSequence):
+    """ This class provides a lazily resolved view of a list value. Modifications made through the view are written
+    directly to the wrapped list value. """
+
+    __hash__ = None
+
+    def __getitem__(self, index: any) -> any:
+        if isinstance(index, slice):
+            return [self.item(i) for i in range(*index.indices(len(self._raw)))]
+        return self.item(index)
+
+    def __setitem__(self, index: any, value: any) -> None:
+        self._raw[index] = value
+        self.changed()
+
+    def __delitem__(self, index: any) -> None:
+        del self._raw[index]
+        self.changed()
+
+    def __eq__(self, other: any) -> bool:
+        if isinstance(other, (list, ListView)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __lt__(self, other: any) -> bool:
+        return list(self) < self.__cast(other)
+
+    def __le__(self, other: any) -> bool:
+        return list(self) <= self.__cast(other)
+
+    def __gt__(self, other: any) -> bool:
+        return list(self) > self.__cast(other)
+
+    def __ge__(self, other: any) -> bool:
+        return list(self) >= self.__cast(other)
+
+    def __add__(self, other: any) -> list:
+        return list(self) + self.__cast(other)
+
+    def __radd__(self, other: any) -> list:
+        return self.__cast(other) + list(self)
+
+    def __mul__(self, n: int) -> list:
+        return list(self) * n
+
+    __rmul__ = __mul__
+
+    @staticmethod
+    def __cast(other: any) -> list:
+        return list(other) if isinstance(other, ListView) else other
+
+    def insert(self, index: int, value: any) -> None:
+        self._raw.insert(index, value)
+        self.changed()
+
+    def sort(self, *, key=None, reverse: bool = False) -> None:
+        """ Sorts the wrapped list value in place, comparing the resolved values of the items. """
+        resolved = list(self)
+        order = sorted(range(len(resolved)), key=lambda i: resolved[i] if key is None else key(resolved[i]),
+                       reverse=reverse)
+        self._raw[:] = [self._raw[i] for i in order]
+        self.changed()
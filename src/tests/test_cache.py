@@ -0,0 +1,157 @@
+from reflective import Reflective
+from reflective.query import QUERY_CACHE_MARKER, QueryResult
+
+
+def test_cache_keys():
+    """Test that cached instances are keyed by their path components."""
+
+    r = Reflective({'a': {'b': {'c': 'value'}}, 'list': [1, 2, 3]})
+
+    c = r.a.b.c
+    assert r().cache[('a', 'b', 'c')] is c
+    assert c().context.cache_key == ('a', 'b', 'c')
+    assert r['a/b/c'] is c
+
+    assert r().query.build_cache_key('list/0:2') == ('list', '0:2:', QUERY_CACHE_MARKER)
+    assert r.a().query.build_cache_key('b/c') == ('a', 'b', 'c', QUERY_CACHE_MARKER)
+    assert r.a().query.build_cache_key('/list') == ('list', QUERY_CACHE_MARKER)
+
+
+def test_cached_queries():
+    """Test that cached query results don't collide with cached instances."""
+
+    r = Reflective({'a': {'b': 'value'}})
+
+    qr = r().query('a/b', use_cache=True)
+    assert isinstance(qr, QueryResult)
+    assert r().query('a/b', use_cache=True) is qr
+    assert r.a.b == 'value'
+    assert r().cache[('a', 'b')] is qr[0]
+
+
+def test_cache_limits():
+    """Test that the least recently used entries are evicted once the cache limits are exceeded."""
+
+    r = Reflective({'a': 'a', 'b': 'b', 'c': 'c'})
+    r().cache.max_entries = 2
+
+    r.a, r.b
+    assert ('a',) in r().cache
+    r.c
+    assert ('a',) not in r().cache
+    assert list(r().cache) == [('b',), ('c',)]
+    assert r().cache.evictions == 1
+
+    r().cache.max_entries = None
+    r().cache.max_bytes = 1
+    r.a
+    assert len(r().cache) == 0
+    assert r().cache.bytes == 0
+    assert r.a == 'a'
+
+
+def test_cache_size():
+    """Test that the size of cached values includes the items of composite values."""
+    import sys
+
+    r = Reflective({'small': {'a': 1}, 'large': {f'key{i}': str(i) * 100 for i in range(100)}})
+
+    r.large, r.small
+    assert r().cache.bytes == 0
+
+    # Values are measured once a byte limit is set
+    r().cache.max_bytes = 10 ** 9
+    small = r().cache._entries[('small',)].size
+    large = r().cache._entries[('large',)].size
+    assert large > 100 * 100 > small
+    assert large > sys.getsizeof(r().cache._entries[('large',)].value)
+
+    r().cache.max_bytes = 100 * 100
+    assert ('large',) not in r().cache
+    assert ('small',) in r().cache
+
+
+def test_cache_ttl(monkeypatch):
+    """Test that entries expire once their time-to-live has passed."""
+    import time
+
+    now = [100.0]
+    monkeypatch.setattr(time, 'monotonic', lambda: now[0])
+
+    r = Reflective({'a': 'a'})
+    r().cache.ttl = 10
+
+    a = r.a
+    now[0] += 5
+    assert r.a is a
+    now[0] += 10
+    assert ('a',) not in r().cache
+    assert r.a is not a
+
+
+def test_cache_weak_values():
+    """Test that weakly cached instances can be collected once they are no longer referenced."""
+    import gc
+
+    r = Reflective({'dict': {'a': 1}, 'int': 1})
+    r().cache.weak = True
+
+    d = r.dict
+    assert r().cache[('dict',)] is d
+    del d
+    gc.collect()
+    assert ('dict',) not in r().cache
+
+    # Types that don't support weak references are held strongly
+    r.int
+    gc.collect()
+    assert ('int',) in r().cache
+
+
+def test_subtree_invalidation():
+    """Test that deleting or replacing a value removes the cached entries of its descendents."""
+
+    r = Reflective({'a': {'b': {'c': 1, 'd': [1, 2]}}, 'e': {'f': 2}})
+
+    r.a.b.c, r.a.b.d[0], r.e.f
+    r().query('a/b/d/:', use_cache=True)
+    assert ('a', 'b', 'd', 0) in r().cache
+
+    r.a = {'b': {'c': 3}}
+    assert ('a',) in r().cache
+    assert not any(key[0] == 'a' and len(key) > 1 for key in r().cache)
+    assert ('e', 'f') in r().cache
+
+    r.a.b.c
+    del r.a.b
+    assert ('a', 'b') not in r().cache
+    assert ('a', 'b', 'c') not in r().cache
+    assert ('a',) in r().cache
+    assert r().cache.invalidate(('e',), inclusive=False) == 1
+    assert ('e',) in r().cache
+
+
+def test_cache_subtree():
+    """Test that the cached entries below a path can be enumerated and summarized."""
+
+    r = Reflective({'a': {'b': 1, 'c': {'d': 2}}, 'e': 3})
+
+    b, d, e = r.a.b, r.a.c.d, r.e
+
+    assert dict(r().cache.subtree(('a',))) == {('a',): r.a, ('a', 'b'): b, ('a', 'c'): r.a.c, ('a', 'c', 'd'): d}
+    assert list(r().cache.subtree(('x',))) == []
+
+    summary = r().cache.summary(('a', 'c'))
+    assert summary.entries == 2
+    assert summary.bytes == sum(r().cache._entries[key].size for key in [('a', 'c'), ('a', 'c', 'd')])
+    assert r().cache.summary().entries == len(r().cache)
+    assert r().cache.summary().bytes == r().cache.bytes
+
+    # Enumeration doesn't change the least recently used order
+    order = list(r().cache)
+    list(r().cache.subtree())
+    assert list(r().cache) == order
+
+    r().cache.invalidate(('a', 'c'))
+    assert r().cache.summary(('a',)).entries == 2
+    assert [key for key in r().cache if key[:2] == ('a', 'c')] == []
@@ -0,0 +1,40 @@
+from reflective import Reflective
+
+
+def test_parent_container_cache():
+    """Test that contexts cache the container holding their value until the structure changes."""
+
+    r = Reflective({'a': {'b': {'c': 1}}, 'list': [{'name': 'one'}, {'name': 'two'}]})
+
+    c = r.a.b.c
+    assert c().context.parent is r().raw['a']['b']
+    version = r().context.version
+
+    r.a.b.c = 2
+    assert r().context.version == version
+    assert c == 2
+
+    r.a = {'b': {'c': 3}}
+    assert r().context.version > version
+    assert c().context.parent is r().raw['a']['b']
+    assert c == 3
+
+    name = r.list[1].name
+    assert name == 'two'
+    r.list.insert(0, {'name': 'zero'})
+    assert name == 'one'
+
+    del r.list[0]
+    assert name == 'two'
+
+
+def test_root_replacement():
+    """Test that descendent contexts follow a replaced root value."""
+
+    r = Reflective({'a': {'b': 1}})
+
+    b = r.a.b
+    r().context.raw = {'a': {'b': 2}}
+
+    assert b().context.root is r().raw
+    assert b == 2
@@ -1,3 +1,5 @@
+import io
+import json
 from reflective import Reflective
 
 
@@ -13,3 +15,114 @@ def test_yaml():
 
     assert r().to_yaml() == 'key: value\n'
     assert r().yaml == 'key: value\n'
+
+
+class ChunkRecorder:
+    """ A text file that records each chunk written to it. """
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, text: str) -> None:
+        self.chunks.append(text)
+
+
+def test_dump_json():
+    """Test that JSON is streamed in chunks, resolving references as it's written, with the output of to_json."""
+
+    r = Reflective({
+        'name': 'svc',
+        'host': '$r{/name}.local',
+        'ports': [80, '$r{/meta/port}'],
+        'meta': {'port': 443, 'tags': ('a', 'b'), 'empty': {}},
+        'copy': '$r{/meta}',
+    })
+
+    fp = ChunkRecorder()
+    r().dump_json(fp, chunk_size=16)
+    assert len(fp.chunks) > 1
+    assert all(len(chunk) < 32 for chunk in fp.chunks)
+    assert json.loads(''.join(fp.chunks)) == {
+        'name': 'svc',
+        'host': 'svc.local',
+        'ports': [80, 443],
+        'meta': {'port': 443, 'tags': ['a', 'b'], 'empty': {}},
+        'copy': {'port': 443, 'tags': ['a', 'b'], 'empty': {}},
+    }
+
+    for flat in (True, False):
+        fp = io.StringIO()
+        r().dump_json(fp, flat=flat)
+        assert fp.getvalue() == r().to_json(flat=flat)
+
+    fp = io.StringIO()
+    r.meta().dump_json(fp)
+    assert fp.getvalue() == '{"port": 443, "tags": ["a", "b"], "empty": {}}'
+
+
+def test_dump_yaml():
+    """Test that YAML is streamed in chunks, resolving references as it's written, with the output of to_yaml."""
+
+    r = Reflective({'name': 'svc', 'host': '$r{/name}.local', 'meta': {'b': [1, 'yes'], 'a': ('x',), 'c': {}}})
+
+    fp = io.StringIO()
+    r().dump_yaml(fp, chunk_size=8)
+    assert fp.getvalue() == r().to_yaml()
+
+    fp = io.StringIO()
+    Reflective({'a': '$r{/b}', 'b': {'c': 1}})().dump_yaml(fp)
+    assert fp.getvalue() == 'a:\n    c: 1\nb:\n    c: 1\n'
+
+
+def test_dump_sole_references():
+    """Test that sole references to composite values are written the same way by the streaming writers and the
+    converters."""
+
+    r = Reflective({'a': '$r{b}', 'b': {'c': 1}, 'd': ['$r{/b}']})
+
+    assert r().to_json() == '{"a": {"c": 1}, "b": {"c": 1}, "d": [{"c": 1}]}'
+
+    for flat in (True, False):
+        fp = io.StringIO()
+        r().dump_json(fp, flat=flat)
+        assert fp.getvalue() == r().to_json(flat=flat)
+
+    fp = io.StringIO()
+    r().dump_yaml(fp)
+    assert fp.getvalue() == r().to_yaml()
+
+
+def test_dump_referenced_values():
+    """Test that sole references to composite values are written from the referenced value without resolving a copy."""
+    import pytest
+    from reflective.exceptions import RCircularReference
+
+    r = Reflective({'a': '$r{b}', 'b': {'c': '$r{/d}', 'e': [1, 2]}, 'd': 'D'})
+
+    for dump in ('dump_json', 'dump_yaml'):
+        fp = io.StringIO()
+        getattr(r(), dump)(fp)
+        assert ('a',) not in r().resolver
+        assert ('b', 'c') in r().resolver
+
+    fp = io.StringIO()
+    r().dump_json(fp)
+    assert json.loads(fp.getvalue()) == {'a': {'c': 'D', 'e': [1, 2]}, 'b': {'c': 'D', 'e': [1, 2]}, 'd': 'D'}
+
+    r = Reflective({'a': {'b': '$r{/a}'}})
+
+    for dump in ('dump_json', 'dump_yaml'):
+        with pytest.raises(RCircularReference):
+            getattr(r(), dump)(io.StringIO())
+
+
+def test_dump_lazy():
+    """Test that values loaded lazily from a JSON stream are loaded as they are written."""
+
+    document = {'name': 'svc', 'host': '$r{/name}.local', 'logs': [{'id': i} for i in range(3)], 'meta': {'a': [1]}}
+
+    for dump, convert in (('dump_json', 'to_json'), ('dump_yaml', 'to_yaml')):
+        r = Reflective.from_json_stream(io.StringIO(json.dumps(document)), defer=['logs', 'meta'], chunk_size=8)
+        fp = io.StringIO()
+        getattr(r(), dump)(fp)
+        assert fp.getvalue() == getattr(Reflective(json.loads(json.dumps(document)))(), convert)()
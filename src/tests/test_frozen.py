@@ -0,0 +1,87 @@
+from reflective import Reflective
+from reflective.frozen import FrozenDict, FrozenList
+
+
+def test_freeze():
+    """Test that frozen values are fully resolved and can be read by attribute, key, and path."""
+
+    r = Reflective({
+        'domain': 'example.com',
+        'port': 443,
+        'app': {'host': 'app.$r{/domain}', 'ports': [80, '$r{/port}'], 'tags': ('web', 'api')},
+    })
+
+    f = r().freeze()
+
+    assert isinstance(f, FrozenDict)
+    assert isinstance(f.app.ports, FrozenList)
+    assert f.app.host == 'app.example.com'
+    assert f['app']['ports'][1] == 443
+    assert f['app/ports/1'] == 443
+    assert f.app['ports/0'] == 80
+    assert f.app['/domain'] == 'example.com'
+    assert f['/'] is f
+    assert f.app.tags == ('web', 'api')
+    assert f.app is f['app']
+    assert f == r().resolver.snapshot
+    assert f.thaw() == {
+        'domain': 'example.com',
+        'port': 443,
+        'app': {'host': 'app.example.com', 'ports': [80, 443], 'tags': ['web', 'api']},
+    }
+
+    assert r.app().freeze() == f.app
+    assert r.app().freeze()['ports/1'] == 443
+
+
+def test_freeze_immutable():
+    """Test that frozen values can't be modified and don't reflect later modifications."""
+    import pytest
+
+    r = Reflective({'a': {'b': 1}, 'c': [1, 2]})
+    f = r().freeze()
+
+    with pytest.raises(TypeError):
+        f.a.b = 2
+    with pytest.raises(TypeError):
+        f['a']['b'] = 2
+    with pytest.raises(TypeError):
+        del f.a
+    with pytest.raises(AttributeError):
+        f.c.append(3)
+    with pytest.raises(AttributeError):
+        f.missing
+    with pytest.raises(KeyError):
+        f['a/missing']
+
+    r.a.b = 2
+    assert f.a.b == 1
+    assert r().freeze().a.b == 2
+
+
+def test_freeze_modified():
+    """Test that frozen values reflect values modified after the references depending on them were read."""
+
+    r = Reflective({'x': '$r{y}', 'y': '$r{z}-1', 'z': 'Z', 'm': {'n': '$r{y}'}})
+
+    assert r.x == 'Z-1'
+    assert r.m.n == 'Z-1'
+
+    r.z = 'ZZ'
+    f = r().freeze()
+
+    assert f['m']['n'] == 'ZZ-1'
+    assert f['m/n'] == 'ZZ-1'
+    assert f.x == 'ZZ-1'
+
+
+def test_freeze_delimited_keys():
+    """Test that keys containing the delimiter don't collide with the paths of nested values."""
+
+    r = Reflective({'a': {'b': 'nested'}, 'a/b': 'literal'})
+    f = r().freeze()
+
+    assert f['a/b'] == 'nested'
+    assert f.a.b == 'nested'
+    assert f.path == ''
+    assert f.a.path == 'a'
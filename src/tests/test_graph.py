@@ -0,0 +1,98 @@
+from reflective import Reflective
+
+
+def test_dependency_graph():
+    """Test that the dependency graph links each templated value to the templated values its references depend on."""
+
+    r = Reflective({
+        'domain': 'example.com',
+        'app': {'host': 'app.$r{/domain}', 'url': 'https://$r{/app/host}/'},
+        'links': ['$r{/app}', 'plain'],
+    })
+
+    graph = r().graph()
+
+    assert set(graph.nodes) == {('app', 'host'), ('app', 'url'), ('links', 0)}
+    assert graph.edges[('app', 'host')] == set()
+    assert graph.edges[('app', 'url')] == {('app', 'host')}
+    assert graph.edges[('links', 0)] == {('app', 'host'), ('app', 'url')}
+    assert graph.references[('app', 'url')] == [('app', 'host')]
+
+    order = graph.order()
+    assert order.index(('app', 'host')) < order.index(('app', 'url')) < order.index(('links', 0))
+
+    assert graph.to_dict()['/app/url'] == ['/app/host']
+    assert '"/app/url" -> "/app/host";' in graph.to_dot()
+
+    assert r.app().graph().nodes == [('app', 'host'), ('app', 'url')]
+
+
+def test_dependency_graph_cycles():
+    """Test that ordering a graph with circular references raises an error naming the cycle."""
+    import pytest
+    from reflective.exceptions import RCircularReference
+
+    r = Reflective({'a': '$r{/b}', 'b': '$r{/c}', 'c': 'x $r{/a}', 'd': 'value'})
+
+    with pytest.raises(RCircularReference) as error:
+        r().graph().order()
+    assert error.value.cycle == ['/a', '/b', '/c', '/a']
+
+
+def test_resolve_all():
+    """Test that every reference is resolved once into a plain snapshot that is discarded once the value changes."""
+    from reflective.util import RUtil
+
+    values = {
+        'domain': 'example.com',
+        'port': 8080,
+        'app': {'host': 'app.$r{/domain}', 'port': '$r{/port}', 'url': 'https://$r{/app/host}:$r{/port}/'},
+        'alias': '$r{/app}',
+        'chain': '$r{/alias}',
+        'items': ('$r{/port}', 'plain'),
+    }
+
+    r = Reflective(values)
+    snapshot = r().resolve_all()
+
+    assert snapshot == {
+        'domain': 'example.com',
+        'port': 8080,
+        'app': {'host': 'app.example.com', 'port': 8080, 'url': 'https://app.example.com:8080/'},
+        'alias': {'host': 'app.example.com', 'port': 8080, 'url': 'https://app.example.com:8080/'},
+        'chain': {'host': 'app.example.com', 'port': 8080, 'url': 'https://app.example.com:8080/'},
+        'items': (8080, 'plain'),
+    }
+    assert type(snapshot['app']['port']) is int
+    assert RUtil.get_plain_value(Reflective(values)().context.resolved) == snapshot
+    assert r().resolver.snapshot is snapshot
+    assert ('app', 'url') in r().resolver
+
+    r.domain = 'example.org'
+    assert r().resolver.snapshot is None
+    assert r.app.url == 'https://app.example.org:8080/'
+
+
+def test_resolve_all_modified():
+    """Test that pre-resolution reflects values modified after the references depending on them were read."""
+
+    r = Reflective({'x': '$r{y}', 'y': '$r{z}-1', 'z': 'Z', 'm': {'n': '$r{y}'}})
+
+    assert r.x == 'Z-1'
+    assert r.m.n == 'Z-1'
+
+    r.z = 'ZZ'
+    assert r().resolve_all() == {'x': 'ZZ-1', 'y': 'ZZ-1', 'z': 'ZZ', 'm': {'n': 'ZZ-1'}}
+
+
+def test_resolve_all_depth():
+    """Test that pre-resolution resolves chains of references deeper than the maximum resolution depth."""
+
+    values = {f'v{i}': f'$r{{/v{i + 1}}}' for i in range(100)}
+    values['v100'] = 'end'
+
+    r = Reflective(values)
+    snapshot = r().resolve_all()
+
+    assert snapshot['v0'] == 'end'
+    assert r.v0 == 'end'
@@ -0,0 +1,90 @@
+import pytest
+from reflective import Reflective
+from reflective.query import Filter
+
+
+def test_index_lookup(monkeypatch):
+    """Test that indexes map field values to item positions and are used by matching filter queries."""
+
+    r = Reflective({
+        'default': 'c',
+        'hosts': [{'name': 'a', 'ip': 1}, {'name': 'b', 'ip': 2}, {'name': '$r{/default}', 'ip': 3}, {'ip': 4}],
+    })
+
+    index = r().index('hosts', 'name')
+    assert index is r().index('/hosts', 'name')
+
+    # Fields containing references are always candidates, since their resolved value can change
+    assert index.lookup('a') == [0, 2]
+    assert index.lookup('c') == [2]
+    assert index.lookup('z') == [2]
+
+    tested: list = []
+    matches = Filter.matches
+
+    def counting_matches(self, item, *args):
+        tested.append(item)
+        return matches(self, item, *args)
+
+    monkeypatch.setattr(Filter, 'matches', counting_matches)
+
+    assert list(r["hosts[?name=='b']/ip"]) == [2]
+    assert len(tested) == 2
+    assert list(r["hosts[?name=='c']/ip"]) == [3]
+    assert list(r["hosts[?name=='z']/ip"]) == []
+
+    r.default = 'x'
+    assert list(r["hosts[?name=='x']/ip"]) == [3]
+    assert list(r["hosts[?name=='c']/ip"]) == []
+
+
+def test_index_maintenance():
+    """Test that indexes are maintained incrementally by list mutations and path writes."""
+
+    r = Reflective({'hosts': [{'name': 'a'}, {'name': 'b'}, {'name': 'c'}]})
+    index = r().index('hosts', 'name')
+    hosts = r.hosts
+    assert r.hosts().index('/hosts', 'name') is index
+
+    hosts.append({'name': 'd'})
+    assert not index.stale
+    assert index.lookup('d') == [3]
+
+    hosts.insert(0, {'name': 'z'})
+    assert not index.stale
+    assert [index.lookup(name) for name in 'zabcd'] == [[0], [1], [2], [3], [4]]
+
+    hosts.pop(1)
+    hosts.pop()
+    assert not index.stale
+    assert [index.lookup(name) for name in 'zabcd'] == [[0], [], [1], [2], []]
+
+    hosts.remove({'name': 'z'})
+    assert not index.stale
+    assert [index.lookup(name) for name in 'bc'] == [[0], [1]]
+
+    r['hosts/0/name'] = 'e'
+    r['hosts/1'] = {'name': 'f'}
+    assert not index.stale
+    assert [index.lookup(name) for name in 'bcef'] == [[], [], [0], [1]]
+
+    del r['hosts/0']
+    assert not index.stale
+    assert index.lookup('f') == [0]
+
+    hosts.sort(key=lambda host: host['name'])
+    assert index.stale
+    assert list(r["hosts[?name=='f']/name"]) == ['f']
+    assert not index.stale
+
+
+def test_index_errors():
+    """Test that only list values can be indexed."""
+
+    r = Reflective({'hosts': {'a': {'name': 'a'}}})
+
+    with pytest.raises(TypeError):
+        r().index('hosts', 'name')
+
+    with pytest.raises(TypeError):
+        r().index('missing', 'name')
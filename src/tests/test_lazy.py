@@ -0,0 +1,102 @@
+import pytest
+from reflective import Reflective
+from reflective.context import ContextManager
+from reflective.exceptions import RInvalidReference
+from reflective.types import RString, RDict, RList, RTuple
+from reflective.view import DictView, ListView
+
+
+def test_lazy_access():
+    """Test that lazily resolved values match their eagerly resolved counterparts."""
+
+    source = {
+        'app': {
+            'name': 'My App',
+            'version': '1.2.3',
+            'tags': ['production', 'v$r{/app/version}'],
+            'pair': (1, 'by $r{/app/name}'),
+        }
+    }
+
+    r = Reflective(source)
+    r().lazy = True
+
+    assert type(r.app) is RDict
+    assert type(r.app.tags) is RList
+    assert type(r.app.pair) is RTuple
+    assert type(r.app.name) is RString
+    assert isinstance(r.app().ref, DictView)
+    assert isinstance(r.app.tags().ref, ListView)
+    assert r.app().ref | {'name': 'Other'} == {'name': 'Other', 'version': '1.2.3', 'tags': ['production', 'v1.2.3'],
+                                               'pair': (1, 'by My App')}
+    assert {'extra': 1} | r.app().ref == {'extra': 1, 'name': 'My App', 'version': '1.2.3',
+                                          'tags': ['production', 'v1.2.3'], 'pair': (1, 'by My App')}
+
+    assert r.app.tags == ['production', 'v1.2.3']
+    assert r.app.tags[1] == 'v1.2.3'
+    assert r.app.pair == (1, 'by My App')
+    assert r.app == {'name': 'My App', 'version': '1.2.3', 'tags': ['production', 'v1.2.3'], 'pair': (1, 'by My App')}
+    assert r().to_json() == '{"app": {"name": "My App", "version": "1.2.3", "tags": ["production", "v1.2.3"], ' \
+                            + '"pair": [1, "by My App"]}}'
+
+
+def test_lazy_resolution_scope(monkeypatch):
+    """Test that only the accessed values of a lazily resolved view are parsed."""
+
+    r = Reflective({'app': {str(i): f'$r{{/base}}-{i}' for i in range(100)}, 'base': 'value'})
+    r().lazy = True
+
+    parsed: list = []
+    parse = ContextManager.parse
+
+    def counting_parse(self, value, *args, **kwargs):
+        parsed.append(value)
+        return parse(self, value, *args, **kwargs)
+
+    monkeypatch.setattr(ContextManager, 'parse', counting_parse)
+
+    view = r.app().ref
+    assert view['42'] == 'value-42'
+    assert '$r{/base}-42' in parsed
+    assert '$r{/base}-43' not in parsed
+    assert len([v for v in parsed if isinstance(v, str) and v.startswith('$r{/base}-')]) == 1
+
+
+def test_lazy_list_updates():
+    """Test that list modifications made through lazily resolved views are written to the unparsed value."""
+
+    source = {'list': [1, 2, 3]}
+
+    r = Reflective(source)
+    r().lazy = True
+
+    r.list.append(4)
+    r.list.insert(0, 0)
+    assert source['list'] == [0, 1, 2, 3, 4]
+
+    r.list.remove(0)
+    assert r.list.pop() == 4
+    assert source['list'] == [1, 2, 3]
+    assert r.list == [1, 2, 3]
+
+
+def test_lazy_replacement():
+    """Test that replacing a value with one of the same type keeps existing instances valid, as in eager mode."""
+
+    for lazy in (False, True):
+        r = Reflective({'a': {'b': 1}, 'c': [1]})
+        r().lazy = lazy
+
+        a, c = r.a, r.c
+        r.a = {'b': 3}
+        r.c = [2]
+        assert a.b == 3
+        assert c == [2]
+
+        r.a = 'text'
+        with pytest.raises(RInvalidReference):
+            a.b
+
+        version = r().context.version
+        r().context.raw = {'a': 1}
+        assert r().context.version == version + 1
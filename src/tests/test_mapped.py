@@ -0,0 +1,98 @@
+import json
+import pytest
+from reflective import Reflective
+from reflective.mapped import MappedDict, MappedDocument, MappedList
+
+
+def write_document(tmp_path, size: int = 50) -> str:
+    """ Writes a JSON document with the given number of services and returns its path. """
+    path = str(tmp_path / 'document.json')
+    document = {
+        'domain': 'example.com',
+        'services': [{'name': f's{i}', 'host': '$r{/domain}', 'escaped': '\\"]}'} for i in range(size)],
+        'meta': {'owner': 'ops'},
+    }
+
+    with open(path, 'w') as fp:
+        json.dump(document, fp, indent=1)
+
+    return path
+
+
+def test_mapped_lazy_decoding(tmp_path):
+    """Test that mapped documents only decode the composite values on the paths that are read."""
+
+    r = Reflective.from_mapped_json(write_document(tmp_path), threshold=256)
+    raw = r().raw
+
+    assert isinstance(raw, MappedDict)
+    assert not dict.__contains__(raw, 'services')
+
+    assert r('services/5/name') == 's5'
+    assert r('services/-1/escaped') == '\\"]}'
+    services = raw['services']
+    assert isinstance(services, MappedList)
+    assert len(services) == 50
+    assert not services.loaded
+    assert sorted(services._items) == [5, 49]
+
+    assert r('services/5/host') == 'example.com'
+    assert 'meta' in raw and 'missing' not in raw
+    assert r('meta/owner') == 'ops'
+    assert list(raw) == ['domain', 'services', 'meta']
+    assert raw.loaded
+
+
+def test_mapped_index(tmp_path):
+    """Test that prebuilt offset indexes locate members without scanning for them, and must match the document."""
+
+    path = write_document(tmp_path)
+    index = MappedDocument.build_index(path, threshold=256)
+    assert index == path + '.index'
+
+    with MappedDocument(path, index, threshold=256) as document:
+        # The member offsets of indexed values are read from the index, so the values are never scanned
+        document.members = None
+        root = document.load()
+        assert root['services'][10]['name'] == 's10'
+        assert root['meta'] == {'owner': 'ops'}
+        assert document.indexed(1) is None
+
+    # Current indexes next to the document are found automatically
+    r = Reflective.from_mapped_json(path, threshold=256)
+    assert list(r['services/*/name'])[-1] == 's49'
+    r.meta.owner = 'dev'
+    assert r('meta/owner') == 'dev'
+
+    with pytest.raises(ValueError):
+        MappedDocument(write_document(tmp_path, 10), index)
+
+    other = str(tmp_path / 'other.index')
+    with open(other, 'w') as fp:
+        json.dump({'size': 0, 'tables': {}}, fp)
+    with pytest.raises(ValueError):
+        MappedDocument(path, other)
+
+
+def test_mapped_close(tmp_path):
+    """Test that the mapped document of an instance is closed with the instance, but not with its descendents."""
+
+    r = Reflective.from_mapped_json(write_document(tmp_path), threshold=256)
+    document = r().raw._document
+
+    with r.meta as core:
+        assert core.raw == {'owner': 'ops'}
+    assert r('services/1/name') == 's1'
+
+    with r as core:
+        assert core.raw['domain'] == 'example.com'
+    assert document._map is None and document._file.closed
+
+    with pytest.raises(ValueError):
+        r('services/2/name')
+
+    r = Reflective.from_mapped_json(write_document(tmp_path), threshold=256)
+    document = r().raw._document
+    r().close()
+    r().close()
+    assert document._file.closed
@@ -1,4 +1,6 @@
-from reflective.query import Query
+import pytest
+from reflective.exceptions import RQuerySyntaxError
+from reflective.query import Filter, Query, Wildcard, QUERY_CACHE_SIZE
 
 
 def test_query_class():
@@ -218,3 +220,68 @@ def test_query_class():
     assert q.path == ['test', 'test', slice(0, 10, 2)]
     assert q.is_path is True
     assert q.is_relative is False
+
+
+def test_query_cache():
+    Query.cache_clear()
+
+    q = Query.compile('test/test/0:2')
+    assert q.path == ['test', 'test', slice(0, 2)]
+    assert Query.compile('test/test/0:2') is q
+    assert Query.compile(q) is q
+    assert Query.compile('test/test/0:2', '.') is not q
+    assert Query.compile(1).path == [1]
+
+    info = Query.cache_info()
+    assert info.hits == 1
+    assert info.misses == 2
+    assert info.currsize == 2
+
+    Query.cache_resize(1)
+    assert Query.cache_info() == (0, 0, 1, 0)
+    assert Query.compile('test/test/0:2') is not q
+    q = Query.compile('test/test/0:2')
+    assert Query.compile('test/test/0:2', '.').path == ['test/test/0:2']
+    assert Query.compile('test/test/0:2') is not q
+
+    Query.cache_resize(QUERY_CACHE_SIZE)
+    Query.cache_clear()
+    assert Query.cache_info() == (0, 0, QUERY_CACHE_SIZE, 0)
+
+
+def test_query_wildcards():
+    """Test that glob and recursive path components are compiled to wildcard components."""
+    q = Query('/services/*/port')
+    assert q.path == ['services', Wildcard('*'), 'port']
+    assert q.is_wildcard is True
+    assert q.is_relative is False
+
+    q = Query('**/time?ut')
+    assert q.path[0].recursive is True
+    assert q.path[1].matches('timeout') is True
+    assert q.path[1].matches('timeouts') is False
+    assert Wildcard('1*').matches(10) is True
+    assert Query('services/0/port').is_wildcard is False
+
+
+def test_query_filters():
+    """Test that filter expressions are compiled to filter components, ignoring delimiters within them."""
+    q = Query("servers[?path=='/srv/a']/name")
+    assert q.path == ['servers', Filter("path=='/srv/a'"), 'name']
+    assert q.is_wildcard is True
+
+    f = Query('servers/[?limits/cpu >= 2.5]').path[1]
+    assert f.field == ['limits', 'cpu']
+    assert f.operator == '>='
+    assert f.value == 2.5
+    assert f.matches({'limits': {'cpu': 4}}, []) is True
+    assert f.matches({'limits': {}}, []) is False
+
+    assert Filter('!tags').matches({'name': 'a'}, []) is True
+    assert Filter('@ == null').matches(None, []) is True
+
+    with pytest.raises(RQuerySyntaxError):
+        Query('servers/[?cpu=>4]')
+
+    with pytest.raises(RQuerySyntaxError):
+        Query('servers/[?region==us-east]')
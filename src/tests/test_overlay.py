@@ -0,0 +1,93 @@
+import pytest
+from reflective import Reflective
+from reflective.exceptions import RInvalidReference
+from reflective.overlay import Overlay
+
+
+def test_overlay_lookup():
+    """Test that overlay lookups fall through the layers, combining the dictionaries found in several layers."""
+
+    defaults = {'app': {'name': 'svc', 'port': 80, 'db': {'host': 'localhost', 'pool': 5}}, 'region': 'us',
+                'url': 'http://$r{/app/name}:$r{/app/port}'}
+    env = {'app': {'port': 8080, 'db': {'host': 'db.prod'}}, 'debug': False}
+
+    r = Reflective.overlay(defaults, env)
+    assert isinstance(r().raw, Overlay)
+
+    assert r('app/port') == 8080
+    assert r('app/db/host') == 'db.prod'
+    assert r('app/db/pool') == 5
+    assert r.url == 'http://svc:8080'
+    assert list(r().raw) == ['app', 'region', 'url', 'debug']
+    assert r().context.resolved['app'] == {'name': 'svc', 'port': 8080, 'db': {'host': 'db.prod', 'pool': 5}}
+
+    # Written values are kept above the layers, which are left unmodified
+    r['app/port'] = 1
+    r.owner = 'ops'
+    del r['region']
+    assert r.url == 'http://svc:1'
+    assert r.owner == 'ops'
+    assert 'region' not in r().raw
+    assert defaults['app']['port'] == 80 and 'region' in defaults
+    assert env == {'app': {'port': 8080, 'db': {'host': 'db.prod'}}, 'debug': False}
+
+
+def test_overlay_layers():
+    """Test that adding, replacing and removing layers only invalidates the keys held by the changed layers."""
+
+    r = Reflective.overlay({'app': {'port': 80}, 'region': 'us', 'url': '$r{/region}:$r{/app/port}'})
+    app = r.app
+    assert r.url == 'us:80'
+
+    memo = dict(dict.items(r().raw))
+    r().add_layer({'app': {'port': 9000}})
+    # Only the winning values of the keys held by the new layer are looked up again
+    assert dict.__getitem__(r().raw, 'region') is memo['region']
+    assert dict.__getitem__(r().raw, 'app') is not memo['app']
+    assert r.url == 'us:9000'
+    assert app.port == 9000
+
+    r().replace_layer(1, {'region': 'eu'})
+    assert r.url == 'eu:80'
+
+    r().replace_layer(1, {'app': 'flat'})
+    assert r.app == 'flat'
+    with pytest.raises(RInvalidReference):
+        app.port
+
+    r().remove_layer(1)
+    assert r('app/port') == 80
+    assert r().raw.layers == ({'app': {'port': 80}, 'region': 'us', 'url': '$r{/region}:$r{/app/port}'},)
+
+    with pytest.raises(TypeError):
+        Reflective({'a': 1})().add_layer({})
+
+    with pytest.raises(TypeError):
+        Reflective.overlay({'a': 1}, ['b'])
+
+
+def test_overlay_keys():
+    """Test that the merged keys of an overlay are kept until a layer is changed or a key is written or deleted."""
+    from reflective.overlay import Overlay
+
+    overlay = Overlay([{'a': 1, 'b': 2}, {'c': 3}])
+    assert overlay.keys() == ['a', 'b', 'c']
+    assert overlay.merged() is overlay.merged()
+    assert len(overlay) == 3
+
+    overlay.add_layer({'d': 4}, 0)
+    assert overlay.keys() == ['d', 'a', 'b', 'c']
+
+    del overlay['a']
+    assert overlay.keys() == ['d', 'b', 'c']
+    overlay['e'] = 5
+    assert overlay.keys() == ['d', 'b', 'c', 'e']
+    # A deleted key that is written again takes its position in the layers
+    overlay['a'] = 6
+    assert overlay.keys() == ['d', 'a', 'b', 'c', 'e']
+
+    overlay.replace_layer(1, {'f': 7})
+    assert overlay.keys() == ['d', 'f', 'c', 'a', 'e']
+    overlay.remove_layer(0)
+    assert list(overlay) == ['f', 'c', 'a', 'e']
+    assert len(overlay) == 4
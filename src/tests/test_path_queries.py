@@ -105,3 +105,120 @@ def test_tuple_path_slices():
     # assert r('tuple/:-1') == source['composite']['tuple'][:-1]
 
     pass
+
+
+def test_get_many():
+    """Test that batched path queries return the same results as individual queries, in order."""
+
+    r = Reflective({
+        'hosts': [{'name': 'a', 'port': 80}, {'name': 'b', 'port': '$r{/hosts/0/port}'}],
+        'meta': {'owner': 'ops', 'tags': ['x', 'y', 'z']},
+    })
+
+    queries = ['hosts/0/name', 'meta/owner', 'hosts/1/port', 'meta/tags/0:2', 'meta/missing', 'hosts/0/name/x']
+    results = r().get_many(queries)
+
+    assert len(results) == len(queries)
+    assert results[0] is r('hosts/0/name')
+    assert results[1] == 'ops'
+    assert results[2] == 80
+    assert list(results[3]) == ['x', 'y']
+    assert len(results[4]) == 0
+    assert len(results[5]) == 0
+
+    # Components below a slice are looked up in the sliced items
+    queries = ['hosts/1:/0/name', 'hosts/::-1/0/port', 'meta/tags/1:/0:1', 'meta/tags/::-1']
+    assert r().get_many(queries) == [r(query) for query in queries]
+
+    # Relative queries are resolved from the child instance
+    meta = r.meta
+    assert meta().get_many(['owner', '/hosts/1/name', 'tags/2']) == ['ops', 'b', 'z']
+
+
+def test_wildcard_paths():
+    """Test that wildcard and recursive path components match every matching value lazily, with recursive matches
+    nearer the value they start from first."""
+
+    r = Reflective({
+        'domain': 'example.com',
+        'services': [
+            {'name': 'web', 'port': 80, 'host': 'web.$r{/domain}', 'timeout': 5},
+            {'name': 'db', 'port': 5432, 'limits': {'timeout': 30}},
+        ],
+        'timeout': 10,
+    })
+
+    ports = r['services/*/port']
+    assert ports.is_lazy
+    assert ports[0] == 80
+    assert ports.is_lazy
+    assert list(ports) == [80, 5432]
+    assert not ports.is_lazy
+    assert ports[1] is r('services/1/port')
+
+    assert list(r['**/timeout']) == [10, 5, 30]
+    assert list(r['**/**/timeout']) == [10, 5, 30]
+    assert list(r['services/?/h*']) == ['web.example.com']
+    assert list(r['services/0:1/*']) == ['web', 80, 'web.example.com', 5]
+    assert list(r.services['*/name']) == ['web', 'db']
+    assert list(r('services/*/missing')) == []
+    assert not r['missing/*']
+
+    r['services/*/port'] = 8080
+    assert r('services/0/port') == 8080
+    assert r('services/1/port') == 8080
+
+    del r['services/*/port']
+    assert 'port' not in r().raw['services'][0]
+    assert 'port' not in r().raw['services'][1]
+
+
+def test_filter_paths():
+    """Test that filter path components match the items for which their predicate holds, resolving only the fields they
+    test."""
+
+    r = Reflective({
+        'default': 'us-east',
+        'servers': [
+            {'name': 'a', 'region': 'us-east', 'cpu': 4, 'path': '/srv/a'},
+            {'name': 'b', 'region': '$r{/default}', 'cpu': 8, 'host': 'b.$r{/default}'},
+            {'name': 'c', 'region': 'eu-west', 'cpu': 2, 'tags': {'gpu': True}},
+        ],
+    })
+
+    assert list(r["servers[?region=='us-east']/name"]) == ['a', 'b']
+    assert ('servers', 1, 'region') in r().resolver
+    assert ('servers', 1, 'host') not in r().resolver
+
+    assert list(r['servers/[?cpu>=4]/name']) == ['a', 'b']
+    assert list(r['servers/[?cpu<4]/name']) == ['c']
+    assert list(r["servers/[?region!='us-east']/name"]) == ['c']
+    assert list(r['servers/[?tags/gpu]/name']) == ['c']
+    assert list(r['servers/[?tags/gpu==true]/name']) == ['c']
+    assert list(r['servers/[?!tags]/name']) == ['a', 'b']
+    assert list(r["servers/[?path=='/srv/a']/name"]) == ['a']
+    assert list(r["servers/[?cpu>'a']"]) == []
+    assert list(r['default/[?@==1]']) == []
+    assert list(r.servers["[?name=='c']/cpu"]) == [2]
+
+
+def test_lazy_slices():
+    """Test that list slice queries produce their item instances lazily, with a length known from the slice."""
+
+    r = Reflective({'name': 'b', 'list': ['a', '$r{/name}', {'c': 3}, 4, 5]})
+
+    qr = r['list/1:']
+    assert qr.is_lazy
+    assert len(qr) == 4
+    assert qr.is_lazy
+    assert qr[0] == 'b'
+    assert qr[0] is r('list/1')
+    assert qr.is_lazy
+    assert list(qr) == ['b', {'c': 3}, 4, 5]
+    assert not qr.is_lazy
+
+    assert len(r['list/::2']) == 3
+    assert list(r['list/::-2']) == [5, {'c': 3}, 'a']
+    assert len(r['list/10:']) == 0
+    assert not r['list/10:']
+    assert r().get_many(['list/:2', 'list/3:'])[1] == [4, 5]
@@ -0,0 +1,111 @@
+from reflective import Reflective
+from reflective.query import QueryManager
+
+
+def test_memoized_references(monkeypatch):
+    """Test that resolved references are memoized by the path of the referencing value."""
+
+    r = Reflective({'base': 'value', 'a': '$r{base}-a', 'b': ['$r{/base}-b']})
+
+    assert r('') == {'base': 'value', 'a': 'value-a', 'b': ['value-b']}
+    assert ('a',) in r().resolver
+    assert ('b', 0) in r().resolver
+
+    queries: list = []
+    query = QueryManager.query
+
+    def counting_query(self, *args, **kwargs):
+        queries.append(args[0])
+        return query(self, *args, **kwargs)
+
+    monkeypatch.setattr(QueryManager, 'query', counting_query)
+
+    assert r('') == {'base': 'value', 'a': 'value-a', 'b': ['value-b']}
+    assert not len(queries)
+
+
+def test_memoized_reference_invalidation():
+    """Test that memoized references are invalidated when the values they depend on are modified."""
+
+    r = Reflective({'app': {'version': '1.2.3'}, 'tag': 'v$r{/app/version}', 'name': 'app', 'other': '$r{name}'})
+
+    assert r('')['tag'] == 'v1.2.3'
+    assert r('')['other'] == 'app'
+
+    r.app.version = '2.0.0'
+    assert ('tag',) not in r().resolver
+    assert ('other',) in r().resolver
+    assert r('')['tag'] == 'v2.0.0'
+
+    r.app = {'version': '3.0.0'}
+    assert r('')['tag'] == 'v3.0.0'
+
+    del r.app
+    assert ('tag',) not in r().resolver
+    assert ('other',) in r().resolver
+    assert r('')['tag'] == 'v$r{/app/version}'
+
+
+def test_memoized_reference_chains():
+    """Test that references to other references are invalidated when the end of the chain is modified."""
+
+    r = Reflective({'x': '$r{y}', 'y': '$r{z}', 'z': 'Z'})
+
+    assert r.x == 'Z'
+
+    r.z = 'ZZ'
+    assert r('')['x'] == 'ZZ'
+    assert r().resolve_all() == {'x': 'ZZ', 'y': 'ZZ', 'z': 'ZZ'}
+
+
+def test_volatile_references(monkeypatch):
+    """Test that references to environment variables are not memoized."""
+
+    monkeypatch.setenv('REFLECTIVE_TEST', 'one')
+
+    r = Reflective({'env': '$e{REFLECTIVE_TEST}', 'ref': '$r{env}'})
+
+    assert r('') == {'env': 'one', 'ref': 'one'}
+    assert ('env',) not in r().resolver
+    assert ('ref',) not in r().resolver
+
+
+def test_circular_references():
+    """Test that circular references raise an error naming the cycle instead of recursing indefinitely."""
+    import pytest
+    from reflective.exceptions import RCircularReference
+
+    r = Reflective({'a': '$r{/b}', 'b': 'x $r{/c}', 'c': '$r{/a}', 'd': '$r{/d}', 'e': 'value'})
+
+    with pytest.raises(RCircularReference) as error:
+        r.a
+    assert error.value.cycle == ['/a', '/b', '/c', '/a']
+    assert '/a -> /b -> /c -> /a' in str(error.value)
+
+    with pytest.raises(RCircularReference):
+        r.d
+
+    # The resolution state is cleaned up after the error
+    assert r().resolver.depth == 0
+    assert r.e == 'value'
+
+    with pytest.raises(RCircularReference):
+        r.b
+
+
+def test_resolution_depth():
+    """Test that the resolution depth is limited to the configured maximum."""
+    import pytest
+    from reflective.exceptions import RResolutionDepthExceeded
+
+    values = {f'v{i}': f'$r{{/v{i + 1}}}' for i in range(10)}
+    values['v10'] = 'end'
+
+    r = Reflective(values)
+    r().resolver.max_depth = 5
+
+    with pytest.raises(RResolutionDepthExceeded):
+        r.v0
+
+    r().resolver.max_depth = 20
+    assert r.v0 == 'end'
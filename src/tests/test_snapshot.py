@@ -0,0 +1,70 @@
+import io
+import pytest
+from reflective import Reflective
+from reflective.exceptions import RSnapshotError
+from reflective.template import Template
+
+
+def test_snapshot_round_trip():
+    """Test that snapshots restore the unparsed value, its dependency graph and its memoized resolved values."""
+
+    r = Reflective({
+        'domain': 'example.com',
+        'app': {'host': 'app.$r{/domain}', 'url': 'https://$r{/app/host}/', 1: 'one'},
+        'values': [0, -1, 2 ** 70, 1.5, 2 + 3j, None, True, False, ('a', 'b'), {}, 'é'],
+    })
+    assert r('app/url') == 'https://app.example.com/'
+
+    data = r().dump_snapshot()
+    assert isinstance(data, bytes)
+
+    s = Reflective.load_snapshot(io.BytesIO(data))
+    assert s().raw == r().raw
+    assert s().graph().to_dict() == r().graph().to_dict()
+    assert ('app', 'url') in s().resolver
+
+    # Memoized values and precompiled templates are used without scanning strings again
+    misses = Template.cache_info().misses
+    assert s('app/url') == 'https://app.example.com/'
+    assert s().resolve_all()['app']['host'] == 'app.example.com'
+    assert Template.cache_info().misses == misses
+
+    s.domain = 'example.org'
+    assert s().resolver.graph is None
+    assert s('app/url') == 'https://app.example.org/'
+
+    fp = io.BytesIO()
+    r.app().dump_snapshot(fp)
+    assert Reflective.load_snapshot(fp.getvalue())().raw == r().raw['app']
+
+
+def test_snapshot_errors():
+    """Test that invalid snapshots and values that can't be stored raise errors."""
+
+    data = Reflective({'a': 'b'})().dump_snapshot()
+
+    with pytest.raises(RSnapshotError):
+        Reflective.load_snapshot(b'{"a": "b"}')
+
+    with pytest.raises(RSnapshotError):
+        Reflective.load_snapshot(data[:-3])
+
+    with pytest.raises(TypeError):
+        Reflective({'a': object()})().dump_snapshot()
+
+
+def test_snapshot_templates():
+    """Test that the templates of a snapshot are kept by the resolver of the loaded instance, not shared globally."""
+
+    source = 'snapshot-$r{/a}'
+    s = Reflective.load_snapshot(Reflective({'a': 1, 'b': source})().dump_snapshot())
+
+    template = s().resolver.templates[source]
+    assert template.references == ['/a']
+    assert Template.compile(source) is not template
+    assert s.b == 'snapshot-1'
+
+    s.a = 2
+    assert s.b == 'snapshot-2'
+    assert s().resolver.templates[source] is template
+    assert Reflective({'b': source})().resolver.templates == {}
@@ -0,0 +1,65 @@
+from reflective import Reflective
+from reflective.stats import TimingHistogram
+
+
+def test_stats_disabled():
+    """Test that no events are recorded unless the stats are enabled."""
+
+    r = Reflective({'a': {'b': 'value'}, 'c': '$r{/a/b}'})
+
+    assert not r().stats.enabled
+    assert r.c == 'value'
+    assert r().stats.counters == {}
+    assert r.a().stats is r().stats
+
+
+def test_stats_counters():
+    """Test that the hot path events are counted while the stats are enabled."""
+
+    r = Reflective({'a': {'b': 'value'}, 'c': 'x $r{/a/b} $r{/a/b}', 'd': 'unique $r{/a/b} text'})
+    r().stats.enabled = True
+
+    assert r.c == 'x value value'
+    assert r().stats['resolve'] == 1
+    assert r().stats['render'] == 1
+    assert r().stats['cache_miss'] > 0
+    assert r().stats['traverse'] > 0
+    assert r().stats['parse'] > 0
+
+    r.c
+    assert r().stats['cache_hit'] > 0
+
+    r().stats.reset()
+    r.d
+    assert r().stats['scan'] == 1
+    r().cache.clear()
+    r.d
+    assert r().stats['scan'] == 1
+    assert r().stats['memo_hit'] == 1
+
+
+def test_stats_timings_and_hooks():
+    """Test that timed events are recorded in histograms and passed to hooks."""
+
+    r = Reflective({'a': 'value', 'b': '$r{/a}'})
+    stats = r().stats
+    stats.enabled = True
+    events = []
+
+    @stats.hook
+    def hook(event, seconds):
+        events.append((event, seconds))
+
+    r.b
+    timing = r().stats.timings['query']
+    assert isinstance(timing, TimingHistogram)
+    assert timing.count == r().stats['query'] > 0
+    assert timing.min <= timing.mean <= timing.max
+    assert timing.percentile(50) <= timing.max
+    assert any(event == 'render' and seconds is not None for event, seconds in events)
+    assert any(event == 'parse' and seconds is None for event, seconds in events)
+
+    r().stats.unhook(hook)
+    events.clear()
+    r.a
+    assert events == []
@@ -0,0 +1,98 @@
+import io
+import json
+import pytest
+from reflective import Reflective
+from reflective.stream import DeferredDict, DeferredList, StreamDict
+
+
+class CountingReader(io.BytesIO):
+    """ A binary file that records the number of reads made from it. """
+
+    reads: int = 0
+
+    def read(self, size: int = -1) -> bytes:
+        self.reads += 1
+        return super().read(size)
+
+
+def test_stream_early_keys():
+    """Test that members of a streamed root object are available before the rest of the stream has been read."""
+
+    document = {
+        'name': 'svc',
+        'host': '$r{/name}.local',
+        'logs': [{'message': 'x' * 100} for _ in range(100)],
+        'tail': [1, 2, 3],
+    }
+    fp = CountingReader(json.dumps(document).encode())
+
+    r = Reflective.from_json_stream(fp, chunk_size=32)
+    assert isinstance(r().raw, StreamDict)
+
+    assert r.name == 'svc'
+    assert fp.reads == 1
+    assert r.host == 'svc.local'
+    assert fp.tell() < 128
+    assert not r().raw.loaded
+
+    assert r.tail == [1, 2, 3]
+    assert r().context.resolved == dict(document, host='svc.local')
+    assert r().raw.loaded
+
+    with pytest.raises(AttributeError):
+        r.missing
+
+
+def test_stream_skip_defer():
+    """Test that skipped values are never stored and deferred values are only decoded when they are first read."""
+
+    text = '{"a": {"b": [1, {"c": 2, "d": 3}], "e": {"f": [4]}}, "g": "\\"}", "h": [5, 6], "i": 7}'
+    r = Reflective.from_json_stream(io.StringIO(text), skip=['a/b/*/d', 'i'], defer=['a/e', 'h'], chunk_size=4)
+
+    assert r('a/b/1') == {'c': 2}
+    assert isinstance(r().raw['a']['e'], DeferredDict)
+    assert not r().raw['a']['e'].loaded
+    assert r('a/e/f/0') == 4
+    assert r().raw['a']['e'].loaded
+    assert r.g == '"}'
+
+    assert isinstance(r().raw['h'], DeferredList)
+    assert list(r['h/*']) == [5, 6]
+    assert 'i' not in r().raw
+    assert r().raw == {'a': {'b': [1, {'c': 2}], 'e': {'f': [4]}}, 'g': '"}', 'h': [5, 6]}
+
+
+def test_stream_values():
+    """Test that other root values load immediately and that streamed values can be modified like any other."""
+
+    assert Reflective.from_json_stream(io.BytesIO('[1, {"a": "é"}]'.encode()), chunk_size=3) == [1, {'a': 'é'}]
+    assert Reflective.from_json_stream(io.StringIO(' 5 ')) == 5
+    assert Reflective.from_json_stream(io.StringIO('{}'))().raw == {}
+
+    r = Reflective.from_json_stream(io.StringIO('{"a": 1, "b": [1, 2]}'))
+    r.c = 3
+    r.b.append(3)
+    assert r().raw == {'a': 1, 'b': [1, 2, 3], 'c': 3}
+
+    with pytest.raises(json.JSONDecodeError):
+        Reflective.from_json_stream(io.StringIO('{"a": 1 "b": 2}')).b
+
+
+def test_stream_chunk_boundaries():
+    """Test that values split across chunks at any position are read correctly without keeping consumed text."""
+    from reflective.stream import JSONReader
+
+    document = {'a': ['x\\"y' * 3, {'b': '{[é€😀]}'}, -1.5e3, True, None], 'c': '\\\\'}
+    text = json.dumps(document, ensure_ascii=False)
+
+    for chunk_size in range(1, 8):
+        assert JSONReader(io.StringIO(text), chunk_size).decode() == document
+        assert JSONReader(io.BytesIO(text.encode()), chunk_size).decode() == document
+
+    reader = JSONReader(io.StringIO(json.dumps([list(range(100))] * 100)), 16)
+    reader.expect('[')
+    while True:
+        reader.skip()
+        assert len(reader._buffer) < 32
+        if reader.expect(',]') == ']':
+            break
@@ -0,0 +1,47 @@
+from reflective import Reflective
+from reflective.template import Template
+from reflective.types import RInt
+from reflective.util import RUtil
+
+
+def test_template_compile():
+    """Test that strings are compiled into literal segments and reference slots."""
+
+    t = Template.compile('http://$r{/app/host}:$R{app/port}/$e{PREFIX}')
+
+    assert t.segments == ('http://', ':', '/', '')
+    assert [(s.method, s.query, s.text) for s in t.slots] == [
+        ('r', '/app/host', '$r{/app/host}'),
+        ('r', 'app/port', '$R{app/port}'),
+        ('e', 'PREFIX', '$e{PREFIX}'),
+    ]
+    assert t.references == ['/app/host', 'app/port']
+    assert t.sole is False
+    assert t.render(['localhost', '80', 'api']) == 'http://localhost:80/api'
+    assert Template.compile('http://$r{/app/host}:$R{app/port}/$e{PREFIX}') is t
+
+    assert Template.compile(' $r{a} ').sole is True
+    assert Template.compile('$r{a}$r{b}').sole is False
+    assert Template.compile('no references').slots == ()
+    assert RUtil.extract('$r{a}-$e{B}-$r{c}') == ['a', 'c']
+
+
+def test_template_rendering(monkeypatch):
+    """Test that compiled templates render references the same way as before."""
+
+    monkeypatch.setenv('REFLECTIVE_TEST', 'env')
+
+    r = Reflective({
+        'host': 'localhost',
+        'port': 8080,
+        'url': 'http://$r{host}:$r{port}/$r{host}',
+        'typed': '$r{port}',
+        'missing': '$r{nothing} and $r{host}',
+        'env': '$e{REFLECTIVE_TEST}-$r{host}',
+    })
+
+    assert r.url == 'http://localhost:8080/localhost'
+    assert type(r.typed) is RInt
+    assert r.typed == 8080
+    assert r.missing == '$r{nothing} and localhost'
+    assert r.env == 'env-localhost'
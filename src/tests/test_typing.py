@@ -269,3 +269,52 @@ def test_reference_type_invalidation():
         pass
 
     assert passing
+
+
+def test_single_resolution(monkeypatch):
+    """Test that each wrapper resolves its value exactly once when constructed."""
+    from reflective.context import ContextManager
+
+    r = Reflective({
+        'app': {
+            'name': 'app',
+            'greeting': 'hello $r{/app/name}',
+            'list': [1, '$r{/app/name}'],
+            'plain': [1, 2],
+            'dict': {'a': 1},
+            'tuple': ('$r{/app/name}', 2),
+            'int': 1,
+        },
+    })
+    r.app
+
+    parse = ContextManager.parse
+    calls = []
+
+    def counted(self, value, default=None, path=None):
+        calls.append(path)
+        return parse(self, value, default, path)
+
+    monkeypatch.setattr(ContextManager, 'parse', counted)
+
+    # The name was already resolved and cached as a reference of the other values
+    for key in ['greeting', 'list', 'plain', 'dict', 'tuple', 'int']:
+        calls.clear()
+        r.app[key]
+        assert calls.count(['app', key]) == 1
+
+    # String references are not written back over the unparsed value
+    assert r.app.greeting == 'hello app'
+    assert r().raw['app']['greeting'] == 'hello $r{/app/name}'
+    assert r.app.tuple == ('app', 2)
+
+    # Lists without references share the unparsed list so that mutations still reach it
+    assert r.app.plain().raw is r.app.plain.data
+
+    # The resolved value handed to the initializer isn't kept by any type
+    from reflective.types.base import VALUE_KEY
+    r.app.float = 1.5
+    r.app.none = None
+    r.app.bool = True
+    for key in ['greeting', 'list', 'plain', 'dict', 'tuple', 'int', 'float', 'none', 'bool']:
+        assert VALUE_KEY not in r.app[key].__dict__